@@ -1,21 +1,15 @@
 import os
-from cerebras.cloud.sdk import Cerebras
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from config.settings import settings
+from tools.llm_client import get_cerebras_client, cached_chat_completion
 from config.models import AgentResponse
+from tools.data_processor import DataProcessor
+from tools.prompt_template import PromptTemplate, canonical_text, canonical_key
 
-class AnalysisAgent:
-    def __init__(self, model: str = "gpt_oss_120b"):
-        self.client = Cerebras(api_key=settings.CEREBRAS_API_KEY)
-        self.model = settings.MODELS[model]
-    
-    def analyze_market(self, business_type: str, location: str, research_data: Dict[str, Any]) -> AgentResponse:
-        """Analyze market conditions and competition"""
-        
-        analysis_prompt = f"""
-        As a market analysis expert, analyze the following data for {business_type} business in {location}:
+ANALYSIS_PROMPT = PromptTemplate("""
+        As a market analysis expert, analyze the following data for ${business_type} business in ${location}:
         
-        Research Data: {research_data}
+        Research Data: ${research_data}
         
         Provide detailed analysis on:
         1. Market saturation level
@@ -25,10 +19,34 @@ class AnalysisAgent:
         5. Strategic recommendations
         
         Be data-driven and specific in your analysis.
-        """
-        
-        analysis_response = self._call_llm(analysis_prompt)
-        
+        """)
+
+class AnalysisAgent:
+    def __init__(self, model: str = "gpt_oss_120b"):
+        self.client = get_cerebras_client()
+        self.model = settings.MODELS[model]
+    
+    def analyze_market(self, business_type: str, location: str, research_data: Dict[str, Any]) -> AgentResponse:
+        """Analyze market conditions and competition"""
+        analysis_prompt, prompt_key = self._build_analysis_prompt(business_type, location, research_data)
+        analysis_response = self._call_llm(analysis_prompt, prompt_key, self._semantic_scope(business_type, location))
+        return self._build_response(research_data, analysis_response)
+    
+    def _build_analysis_prompt(self, business_type: str, location: str, research_data: Dict[str, Any]) -> Tuple[str, str]:
+        """Render the market analysis prompt and its template cache key"""
+        values = {
+            "business_type": canonical_text(business_type),
+            "location": canonical_text(location),
+            "research_data": DataProcessor.to_prompt_json(research_data)
+        }
+        return ANALYSIS_PROMPT.render(**values), ANALYSIS_PROMPT.cache_key(**values)
+    
+    def _semantic_scope(self, business_type: str, location: str) -> str:
+        """Near-duplicate cache hits are only allowed for the same business type and location"""
+        return f"analyze_market:{canonical_key(business_type)}:{canonical_key(location)}"
+    
+    def _build_response(self, research_data: Dict[str, Any], analysis_response: str) -> AgentResponse:
+        """Wrap the LLM analysis into an AgentResponse"""
         return AgentResponse(
             reasoning="Comprehensive market analysis based on scraped data",
             data=research_data,
@@ -36,16 +54,18 @@ class AnalysisAgent:
             confidence=0.88
         )
     
-    def _call_llm(self, prompt: str) -> str:
+    def _call_llm(self, prompt: str, prompt_key: Optional[str] = None, semantic_scope: Optional[str] = None) -> str:
         """Make LLM call to Cerebras"""
         try:
-            response = self.client.chat.completions.create(
+            return cached_chat_completion(
+                self.client,
                 messages=[{"role": "user", "content": prompt}],
                 model=self.model,
-                max_completion_tokens=5000,
+                prompt_key=prompt_key,
+                semantic_scope=semantic_scope,
+                max_completion_tokens=2000,
                 temperature=0.6,
                 top_p=0.8
             )
-            return response.choices[0].message.content
         except Exception as e:
-            return f"Error in LLM call: {str(e)}"
\ No newline at end of file
+            return f"Error in LLM call: {str(e)}"
@@ -1,205 +1,242 @@
 # business_discovery_agent.py
 import os
-from cerebras.cloud.sdk import Cerebras
-from typing import Dict, Any, List
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
 from config.settings import settings
+from tools.llm_client import get_async_cerebras_client, acached_chat_completion
 from config.models import BusinessSuggestion, CityBusinessReport, ComprehensiveBusinessAnalysis
-from tools.apify_client import ApifyDataCollector
-import json
+from tools.apify_client import get_apify_client
+from tools.data_processor import DataProcessor
+from tools.prompt_template import PromptTemplate, canonical_text
+import re
+import orjson
+import numpy as np
 from datetime import datetime
 
+CITY_TIERS = {
+    'mumbai': 'Metro', 'delhi': 'Metro', 'bangalore': 'Metro', 
+    'chennai': 'Metro', 'kolkata': 'Metro', 'hyderabad': 'Metro',
+    'pune': 'Large', 'ahmedabad': 'Large', 'jaipur': 'Medium'
+}
+HIGH_SPENDING_CITIES = frozenset({'mumbai', 'delhi', 'bangalore'})
+RAPID_GROWTH_CITIES = frozenset({'bangalore', 'pune', 'hyderabad'})
+JSON_FENCE = re.compile(r"```json\s*(.*?)```", re.DOTALL)
+
+CITY_REPORT_PROMPT = PromptTemplate("""
+        As a business opportunity analyst, analyze ${city} and suggest the most viable business opportunities.
+        
+        CITY CONTEXT:
+        - City: ${city}
+        - Population Tier: ${population_tier}
+        - Economic Indicators: ${economic_indicators}
+        
+        Suggest 5-7 business opportunities with this exact JSON structure:
+        {
+            "city": "${city}",
+            "population_tier": "Medium/Large/Metro",
+            "economic_indicators": {
+                "consumer_spending": "High/Medium/Low",
+                "commercial_activity": "High/Medium/Low", 
+                "growth_trajectory": "Rapid/Moderate/Slow"
+            },
+            "top_business_suggestions": [
+                {
+                    "business_type": "e.g., Specialty Coffee Shop",
+                    "viability_score": 85.5,
+                    "investment_range": "₹15-25 lakhs",
+                    "competition_level": "Medium",
+                    "growth_potential": "High",
+                    "key_opportunities": ["Growing youth population", "Digital adoption"],
+                    "challenges": ["Real estate costs", "Staff availability"]
+                }
+            ],
+            "market_trends": [
+                "Trend 1",
+                "Trend 2" 
+            ],
+            "consumer_behavior": {
+                "spending_patterns": "Description",
+                "preferred_categories": ["Category1", "Category2"],
+                "digital_adoption": "High/Medium/Low"
+            }
+        }
+        
+        Focus on:
+        - Current market gaps in ${city}
+        - Emerging consumer trends
+        - Sustainable business models
+        - Digital integration opportunities
+        - Local economic factors
+        """)
+
+COMPREHENSIVE_ANALYSIS_PROMPT = PromptTemplate("""
+        Create a comprehensive business analysis for ${business_type} in ${city}.
+        
+        REAL-TIME MARKET DATA:
+        ${real_time_data}
+        
+        Provide analysis in this exact JSON format:
+        {
+            "business_type": "${business_type}",
+            "location": "${city}",
+            "executive_summary": "2-3 paragraph comprehensive summary",
+            "market_overview": {
+                "market_size": "Estimate",
+                "growth_rate": "X% annually", 
+                "customer_segments": ["Segment1", "Segment2"],
+                "key_drivers": ["Driver1", "Driver2"]
+            },
+            "operational_requirements": {
+                "space_needed": "XXX sq ft",
+                "staff_requirements": "X-Y people",
+                "equipment_needs": ["Item1", "Item2"],
+                "licenses_required": ["License1", "License2"]
+            },
+            "financial_projections": {
+                "initial_investment": "₹X-Y lakhs",
+                "monthly_operating_costs": "₹X lakhs",
+                "break_even_period": "X-Y months",
+                "projected_roi": "X% annually"
+            },
+            "competitor_analysis": {
+                "total_competitors": X,
+                "competitive_landscape": "Description",
+                "competitor_strengths": ["Strength1", "Strength2"],
+                "competitor_weaknesses": ["Weakness1", "Weakness2"],
+                "market_gaps": ["Gap1", "Gap2"]
+            },
+            "risk_assessment": {
+                "market_risks": ["Risk1", "Risk2"],
+                "operational_risks": ["Risk1", "Risk2"], 
+                "financial_risks": ["Risk1", "Risk2"],
+                "mitigation_strategies": ["Strategy1", "Strategy2"]
+            },
+            "strategic_recommendations": [
+                "Recommendation 1",
+                "Recommendation 2",
+                "Recommendation 3"
+            ],
+            "confidence_score": 0.85
+        }
+        
+        Be specific, data-driven, and focus on actionable insights.
+        """)
+
 class BusinessDiscoveryAgent:
     def __init__(self, model: str = "gpt_oss_120b"):
-        self.client = Cerebras(api_key=settings.CEREBRAS_API_KEY)
+        self.aclient = get_async_cerebras_client()
         self.model = self._get_model_name(model)
-        self.apify_client = ApifyDataCollector()
+        self.apify_client = get_apify_client()
     
     def _get_model_name(self, model_key: str) -> str:
         """Get actual model name from settings"""
-        model_config = settings.MODELS.get(model_key, {})
-        if isinstance(model_config, dict):
-            return model_config.get('cerebras', 'llama-70b')
-        elif isinstance(model_config, str):
-            return model_config
-        else:
-            return 'llama-70b'
+        return settings.RESOLVED_MODELS.get(model_key, settings.DEFAULT_CEREBRAS_MODEL)
     
     def discover_business_opportunities(self, city: str) -> CityBusinessReport:
+        """Discover and suggest business opportunities for a city (blocking wrapper - call from sync code only)"""
+        return asyncio.run(self.adiscover_business_opportunities(city))
+    
+    async def adiscover_business_opportunities(self, city: str) -> CityBusinessReport:
         """Discover and suggest business opportunities for a city"""
         print(f"🔍 Discovering business opportunities for {city}...")
+        now = datetime.now().isoformat()
         
         try:
             # Collect initial city data
             city_data = self._collect_city_data(city)
+            messages, prompt_key = self._build_city_messages(city, city_data)
             
-            prompt = f"""
-            As a business opportunity analyst, analyze {city} and suggest the most viable business opportunities.
-            
-            CITY CONTEXT:
-            - City: {city}
-            - Population Tier: {city_data.get('population_tier', 'Medium')}
-            - Economic Indicators: {city_data.get('economic_indicators', {})}
-            
-            Suggest 5-7 business opportunities with this exact JSON structure:
-            {{
-                "city": "{city}",
-                "population_tier": "Medium/Large/Metro",
-                "economic_indicators": {{
-                    "consumer_spending": "High/Medium/Low",
-                    "commercial_activity": "High/Medium/Low", 
-                    "growth_trajectory": "Rapid/Moderate/Slow"
-                }},
-                "top_business_suggestions": [
-                    {{
-                        "business_type": "e.g., Specialty Coffee Shop",
-                        "viability_score": 85.5,
-                        "investment_range": "₹15-25 lakhs",
-                        "competition_level": "Medium",
-                        "growth_potential": "High",
-                        "key_opportunities": ["Growing youth population", "Digital adoption"],
-                        "challenges": ["Real estate costs", "Staff availability"]
-                    }}
-                ],
-                "market_trends": [
-                    "Trend 1",
-                    "Trend 2" 
-                ],
-                "consumer_behavior": {{
-                    "spending_patterns": "Description",
-                    "preferred_categories": ["Category1", "Category2"],
-                    "digital_adoption": "High/Medium/Low"
-                }}
-            }}
-            
-            Focus on:
-            - Current market gaps in {city}
-            - Emerging consumer trends
-            - Sustainable business models
-            - Digital integration opportunities
-            - Local economic factors
-            """
-            
-            messages = [
-                {"role": "system", "content": "You are an expert business opportunity analyst. Provide data-driven, realistic business suggestions."},
-                {"role": "user", "content": prompt}
-            ]
-            
-            response = self.client.chat.completions.create(
+            analysis_text = await acached_chat_completion(
+                self.aclient,
                 messages=messages,
                 model=self.model,
-                max_completion_tokens=4000,
+                prompt_key=prompt_key,
+                max_completion_tokens=2500,
                 temperature=0.7,
-                top_p=0.8
+                top_p=0.8,
+                response_format={"type": "json_object"}
             )
-            
-            analysis_text = response.choices[0].message.content
-            return self._parse_city_report(analysis_text, city)
+            return self._parse_city_report(analysis_text, city, now)
             
         except Exception as e:
             print(f"❌ Business discovery failed: {e}")
-            return self._create_fallback_city_report(city)
+            return self._create_fallback_city_report(city, now)
     
     def generate_comprehensive_analysis(self, business_type: str, city: str) -> ComprehensiveBusinessAnalysis:
+        """Generate comprehensive business analysis with real-time data (blocking wrapper - call from sync code only)"""
+        return asyncio.run(self.agenerate_comprehensive_analysis(business_type, city))
+    
+    async def agenerate_comprehensive_analysis(self, business_type: str, city: str) -> ComprehensiveBusinessAnalysis:
         """Generate comprehensive business analysis with real-time data"""
         print(f"📊 Generating comprehensive analysis for {business_type} in {city}...")
+        now = datetime.now().isoformat()
         
         try:
-            # Collect real-time data
-            real_time_data = self._collect_real_time_data(business_type, city)
-            
-            prompt = f"""
-            Create a comprehensive business analysis for {business_type} in {city}.
-            
-            REAL-TIME MARKET DATA:
-            {json.dumps(real_time_data, indent=2)}
-            
-            Provide analysis in this exact JSON format:
-            {{
-                "business_type": "{business_type}",
-                "location": "{city}",
-                "executive_summary": "2-3 paragraph comprehensive summary",
-                "market_overview": {{
-                    "market_size": "Estimate",
-                    "growth_rate": "X% annually", 
-                    "customer_segments": ["Segment1", "Segment2"],
-                    "key_drivers": ["Driver1", "Driver2"]
-                }},
-                "operational_requirements": {{
-                    "space_needed": "XXX sq ft",
-                    "staff_requirements": "X-Y people",
-                    "equipment_needs": ["Item1", "Item2"],
-                    "licenses_required": ["License1", "License2"]
-                }},
-                "financial_projections": {{
-                    "initial_investment": "₹X-Y lakhs",
-                    "monthly_operating_costs": "₹X lakhs",
-                    "break_even_period": "X-Y months",
-                    "projected_roi": "X% annually"
-                }},
-                "competitor_analysis": {{
-                    "total_competitors": X,
-                    "competitive_landscape": "Description",
-                    "competitor_strengths": ["Strength1", "Strength2"],
-                    "competitor_weaknesses": ["Weakness1", "Weakness2"],
-                    "market_gaps": ["Gap1", "Gap2"]
-                }},
-                "risk_assessment": {{
-                    "market_risks": ["Risk1", "Risk2"],
-                    "operational_risks": ["Risk1", "Risk2"], 
-                    "financial_risks": ["Risk1", "Risk2"],
-                    "mitigation_strategies": ["Strategy1", "Strategy2"]
-                }},
-                "strategic_recommendations": [
-                    "Recommendation 1",
-                    "Recommendation 2",
-                    "Recommendation 3"
-                ],
-                "confidence_score": 0.85
-            }}
+            # Scraping is blocking I/O, keep it off the event loop
+            real_time_data = await asyncio.to_thread(self._collect_real_time_data, business_type, city, now)
+            messages, prompt_key = self._build_comprehensive_messages(business_type, city, real_time_data)
             
-            Be specific, data-driven, and focus on actionable insights.
-            """
-            
-            messages = [
-                {"role": "system", "content": "You are a comprehensive business analyst. Provide detailed, practical business analysis."},
-                {"role": "user", "content": prompt}
-            ]
-            
-            response = self.client.chat.completions.create(
+            analysis_text = await acached_chat_completion(
+                self.aclient,
                 messages=messages,
                 model=self.model,
-                max_completion_tokens=5000,
+                prompt_key=prompt_key,
+                max_completion_tokens=3500,
                 temperature=0.6,
-                top_p=0.8
+                top_p=0.8,
+                response_format={"type": "json_object"}
             )
-            
-            analysis_text = response.choices[0].message.content
-            return self._parse_comprehensive_analysis(analysis_text, business_type, city, real_time_data)
+            return self._parse_comprehensive_analysis(analysis_text, business_type, city, real_time_data, now)
             
         except Exception as e:
             print(f"❌ Comprehensive analysis failed: {e}")
-            return self._create_fallback_comprehensive_analysis(business_type, city)
+            return self._create_fallback_comprehensive_analysis(business_type, city, now)
+    
+    def _build_city_messages(self, city: str, city_data: Dict[str, Any]) -> Tuple[List[Dict[str, str]], str]:
+        """Build chat messages for the city opportunity report and its template cache key"""
+        values = {
+            "city": canonical_text(city),
+            "population_tier": city_data.get('population_tier', 'Medium'),
+            "economic_indicators": city_data.get('economic_indicators', {})
+        }
+        prompt = CITY_REPORT_PROMPT.render(**values)
+        
+        return [
+            {"role": "system", "content": "You are an expert business opportunity analyst. Provide data-driven, realistic business suggestions."},
+            {"role": "user", "content": prompt}
+        ], CITY_REPORT_PROMPT.cache_key(**values)
+    
+    def _build_comprehensive_messages(self, business_type: str, city: str, real_time_data: Dict[str, Any]) -> Tuple[List[Dict[str, str]], str]:
+        """Build chat messages for the comprehensive business analysis and its template cache key"""
+        values = {
+            "business_type": canonical_text(business_type),
+            "city": canonical_text(city),
+            "real_time_data": DataProcessor.to_prompt_json(real_time_data)
+        }
+        prompt = COMPREHENSIVE_ANALYSIS_PROMPT.render(**values)
+        
+        return [
+            {"role": "system", "content": "You are a comprehensive business analyst. Provide detailed, practical business analysis."},
+            {"role": "user", "content": prompt}
+        ], COMPREHENSIVE_ANALYSIS_PROMPT.cache_key(**values)
     
     def _collect_city_data(self, city: str) -> Dict[str, Any]:
         """Collect basic city data for analysis"""
         # This would integrate with geographic/economic APIs in production
-        city_tiers = {
-            'mumbai': 'Metro', 'delhi': 'Metro', 'bangalore': 'Metro', 
-            'chennai': 'Metro', 'kolkata': 'Metro', 'hyderabad': 'Metro',
-            'pune': 'Large', 'ahmedabad': 'Large', 'jaipur': 'Medium'
-        }
+        city_key = city.lower()
         
         return {
-            'population_tier': city_tiers.get(city.lower(), 'Medium'),
+            'population_tier': CITY_TIERS.get(city_key, 'Medium'),
             'economic_indicators': {
-                'consumer_spending': 'High' if city.lower() in ['mumbai', 'delhi', 'bangalore'] else 'Medium',
+                'consumer_spending': 'High' if city_key in HIGH_SPENDING_CITIES else 'Medium',
                 'commercial_activity': 'High',
-                'growth_trajectory': 'Rapid' if city.lower() in ['bangalore', 'pune', 'hyderabad'] else 'Moderate'
+                'growth_trajectory': 'Rapid' if city_key in RAPID_GROWTH_CITIES else 'Moderate'
             }
         }
     
-    def _collect_real_time_data(self, business_type: str, city: str) -> Dict[str, Any]:
+    def _collect_real_time_data(self, business_type: str, city: str, now: Optional[str] = None) -> Dict[str, Any]:
         """Collect real-time market data using Apify"""
+        now = now or datetime.now().isoformat()
         print(f"🌐 Collecting real-time data for {business_type} in {city}...")
         
         try:
@@ -210,23 +247,28 @@ class BusinessDiscoveryAgent:
                 f"{business_type} services {city}"
             ]
             
-            places_data = self.apify_client.scrape_places_data(search_queries, city)
-            trends_data = self.apify_client.scrape_trends_data([business_type], city)
+            places_data, trends_data = self.apify_client.scrape_market_data(search_queries, [business_type], city)
+            
+            interest_trend, peak_interest = self._summarize_trends(trends_data)
+            
+            # Extract numeric columns once and reuse them across the summary helpers
+            ratings = np.fromiter((p.get('rating') or np.nan for p in places_data), dtype=np.float32, count=len(places_data))
+            price_levels = np.fromiter((self._price_level_code(p.get('priceLevel')) for p in places_data), dtype=np.int8, count=len(places_data))
             
             return {
                 'places_data_summary': {
                     'total_businesses': len(places_data),
-                    'avg_rating': self._calculate_avg_rating(places_data),
-                    'price_levels': self._analyze_price_levels(places_data),
+                    'avg_rating': self._calculate_avg_rating(ratings),
+                    'price_levels': self._analyze_price_levels(price_levels),
                     'top_competitors': places_data[:5] if places_data else []
                 },
                 'trends_data_summary': {
                     'total_trend_points': len(trends_data),
-                    'interest_trend': self._analyze_trend_direction(trends_data),
-                    'peak_interest': max([t.get('value', 0) for t in trends_data]) if trends_data else 0
+                    'interest_trend': interest_trend,
+                    'peak_interest': peak_interest
                 },
                 'data_freshness': 'real_time',
-                'collection_time': datetime.now().isoformat()
+                'collection_time': now
             }
             
         except Exception as e:
@@ -235,85 +277,86 @@ class BusinessDiscoveryAgent:
                 'places_data_summary': {'total_businesses': 0, 'avg_rating': 0, 'price_levels': {}, 'top_competitors': []},
                 'trends_data_summary': {'total_trend_points': 0, 'interest_trend': 'unknown', 'peak_interest': 0},
                 'data_freshness': 'fallback',
-                'collection_time': datetime.now().isoformat()
+                'collection_time': now
             }
     
-    def _calculate_avg_rating(self, places_data: List[Dict]) -> float:
-        """Calculate average rating from places data"""
-        ratings = [p.get('rating', 0) for p in places_data if p.get('rating')]
-        return round(sum(ratings) / len(ratings), 2) if ratings else 0
+    def _calculate_avg_rating(self, ratings: np.ndarray) -> float:
+        """Calculate average rating, ignoring places without a rating (NaN)"""
+        if not np.any(~np.isnan(ratings)):
+            return 0
+        return round(float(np.nanmean(ratings)), 2)
     
-    def _analyze_price_levels(self, places_data: List[Dict]) -> Dict[str, int]:
-        """Analyze price level distribution"""
-        price_levels = [p.get('priceLevel', 0) for p in places_data if p.get('priceLevel')]
+    def _price_level_code(self, value: Any) -> int:
+        """Numeric price level 1-4, or 0 for missing/label values such as '$$' (not counted)"""
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value in (1, 2, 3, 4):
+            return int(value)
+        return 0
+    
+    def _analyze_price_levels(self, price_levels: np.ndarray) -> Dict[str, int]:
+        """Analyze price level distribution (0 = unknown)"""
+        counts = np.bincount(price_levels, minlength=5)
         return {
-            'budget': len([p for p in price_levels if p == 1]),
-            'medium': len([p for p in price_levels if p == 2]),
-            'premium': len([p for p in price_levels if p in [3, 4]])
+            'budget': int(counts[1]),
+            'medium': int(counts[2]),
+            'premium': int(counts[3] + counts[4])
         }
     
-    def _analyze_trend_direction(self, trends_data: List[Dict]) -> str:
-        """Analyze trend direction from trends data"""
-        if not trends_data or len(trends_data) < 2:
-            return 'stable'
+    def _summarize_trends(self, trends_data: List[Dict]) -> Tuple[str, float]:
+        """Trend direction and peak interest from a single pass over the trend values"""
+        values = np.fromiter((t.get('value', 0) for t in trends_data), dtype=np.float64, count=len(trends_data))
+        if values.size == 0:
+            return 'stable', 0
         
-        values = [t.get('value', 0) for t in trends_data]
-        if values[-1] > values[0] + 10:
-            return 'growing'
-        elif values[-1] < values[0] - 10:
-            return 'declining'
+        peak = values.max().item()
+        change = values[-1] - values[0] if values.size >= 2 else 0
+        if change > 10:
+            return 'growing', peak
+        elif change < -10:
+            return 'declining', peak
         else:
-            return 'stable'
+            return 'stable', peak
+    
+    def _extract_json(self, analysis_text: str) -> Dict[str, Any]:
+        """Extract and decode the JSON payload from an LLM response"""
+        # JSON mode returns a bare object; fenced output only shows up from older cached responses
+        try:
+            return orjson.loads(analysis_text)
+        except orjson.JSONDecodeError:
+            match = JSON_FENCE.search(analysis_text)
+            if match:
+                return orjson.loads(match.group(1).strip())
+            raise ValueError("No valid JSON found")
     
-    def _parse_city_report(self, analysis_text: str, city: str) -> CityBusinessReport:
+    def _parse_city_report(self, analysis_text: str, city: str, now: str) -> CityBusinessReport:
         """Parse city business report from LLM response"""
         try:
-            if "```json" in analysis_text:
-                json_str = analysis_text.split("```json")[1].split("```")[0].strip()
-            elif analysis_text.startswith("{") and analysis_text.endswith("}"):
-                json_str = analysis_text
-            else:
-                raise ValueError("No valid JSON found")
+            parsed_data = self._extract_json(analysis_text)
+            parsed_data['timestamp'] = now
             
-            parsed_data = json.loads(json_str)
-            parsed_data['timestamp'] = datetime.now().isoformat()
-            
-            # Convert business suggestions to proper objects
-            if 'top_business_suggestions' in parsed_data:
-                suggestions = []
-                for suggestion in parsed_data['top_business_suggestions']:
-                    suggestions.append(BusinessSuggestion(**suggestion))
-                parsed_data['top_business_suggestions'] = suggestions
-            
-            return CityBusinessReport(**parsed_data)
+            # Nested business suggestions are validated in the same pass
+            return CityBusinessReport.model_validate(parsed_data)
             
         except Exception as e:
             print(f"❌ Error parsing city report: {e}")
-            return self._create_fallback_city_report(city)
+            return self._create_fallback_city_report(city, now)
     
-    def _parse_comprehensive_analysis(self, analysis_text: str, business_type: str, city: str, real_time_data: Dict) -> ComprehensiveBusinessAnalysis:
+    def _parse_comprehensive_analysis(self, analysis_text: str, business_type: str, city: str, real_time_data: Dict, now: str) -> ComprehensiveBusinessAnalysis:
         """Parse comprehensive analysis from LLM response"""
         try:
-            if "```json" in analysis_text:
-                json_str = analysis_text.split("```json")[1].split("```")[0].strip()
-            elif analysis_text.startswith("{") and analysis_text.endswith("}"):
-                json_str = analysis_text
-            else:
-                raise ValueError("No valid JSON found")
-            
-            parsed_data = json.loads(json_str)
-            parsed_data['timestamp'] = datetime.now().isoformat()
+            parsed_data = self._extract_json(analysis_text)
+            parsed_data['timestamp'] = now
             parsed_data['real_time_data'] = real_time_data
             
-            return ComprehensiveBusinessAnalysis(**parsed_data)
+            return ComprehensiveBusinessAnalysis.model_validate(parsed_data)
             
         except Exception as e:
             print(f"❌ Error parsing comprehensive analysis: {e}")
-            return self._create_fallback_comprehensive_analysis(business_type, city)
+            return self._create_fallback_comprehensive_analysis(business_type, city, now)
     
-    def _create_fallback_city_report(self, city: str) -> CityBusinessReport:
+    def _create_fallback_city_report(self, city: str, now: str) -> CityBusinessReport:
         """Create fallback city business report"""
-        return CityBusinessReport(
+        # Static, known-good values - skip validation
+        return CityBusinessReport.model_construct(
             city=city,
             population_tier="Medium",
             economic_indicators={
@@ -322,7 +365,7 @@ class BusinessDiscoveryAgent:
                 "growth_trajectory": "Moderate"
             },
             top_business_suggestions=[
-                BusinessSuggestion(
+                BusinessSuggestion.model_construct(
                     business_type="Food & Beverage",
                     viability_score=75.0,
                     investment_range="₹20-40 lakhs",
@@ -338,12 +381,13 @@ class BusinessDiscoveryAgent:
                 "preferred_categories": ["Food", "Retail", "Services"],
                 "digital_adoption": "High"
             },
-            timestamp=datetime.now().isoformat()
+            timestamp=now
         )
     
-    def _create_fallback_comprehensive_analysis(self, business_type: str, city: str) -> ComprehensiveBusinessAnalysis:
+    def _create_fallback_comprehensive_analysis(self, business_type: str, city: str, now: str) -> ComprehensiveBusinessAnalysis:
         """Create fallback comprehensive analysis"""
-        return ComprehensiveBusinessAnalysis(
+        # Static, known-good values - skip validation
+        return ComprehensiveBusinessAnalysis.model_construct(
             business_type=business_type,
             location=city,
             executive_summary=f"Comprehensive analysis for {business_type} in {city}. Market shows moderate competition with good growth potential for quality-focused entrants.",
@@ -385,5 +429,5 @@ class BusinessDiscoveryAgent:
             ],
             real_time_data={},
             confidence_score=0.7,
-            timestamp=datetime.now().isoformat()
+            timestamp=now
         )
\ No newline at end of file
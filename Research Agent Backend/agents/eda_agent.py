@@ -1,64 +1,35 @@
 # eda_agent.py - Updated for better insights generation
 
 import os
-from cerebras.cloud.sdk import Cerebras
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator
 import json
+import re
 from config.settings import settings
-from tools.data_processor import DataProcessor
+from tools.llm_client import get_cerebras_client, cached_chat_completion
+from tools.data_processor import get_data_processor
+from tools.prompt_template import PromptTemplate, canonical_text
 
-class EDAAgent:
-    def __init__(self, model: str = "llama_70b"):
-        self.client = Cerebras(api_key=settings.CEREBRAS_API_KEY)
-        self.model = settings.MODELS[model]
-        self.data_processor = DataProcessor()
-    
-    def perform_comprehensive_eda(self, raw_data: Dict, business_type: str, location: str) -> Tuple[Dict, List[str]]:
-        """Perform comprehensive EDA and generate insights"""
-        
-        print(f"🔍 Performing comprehensive EDA for {business_type} in {location}...")
-        
-        # Step 1: Data sampling and statistical analysis
-        sampled_data, statistics = self._sample_and_analyze_data(raw_data)
-        
-        # Step 2: Generate EDA insights using LLM with improved prompt
-        eda_insights = self._generate_eda_insights(sampled_data, statistics, business_type, location)
-        
-        # Step 3: Extract key patterns and trends
-        key_patterns = self._extract_key_patterns(eda_insights, statistics)
-        
-        # Step 4: Generate actionable business insights
-        business_insights = self._generate_business_insights(key_patterns, business_type, location)
-        
-        return {
-            "sampled_data": sampled_data,
-            "statistics": statistics,
-            "eda_insights": eda_insights,
-            "key_patterns": key_patterns,
-            "location": location,
-            "business_type": business_type
-        }, business_insights
-    
-    def _generate_eda_insights(self, sampled_data: Dict, statistics: Dict, business_type: str, location: str) -> List[str]:
-        """Generate EDA insights using LLM with improved prompt"""
-        
-        prompt = f"""
-        As a senior data analyst, perform comprehensive Exploratory Data Analysis (EDA) on market research data for {business_type} businesses in {location}.
+INSIGHT_SPLIT = re.compile(r"\n(?=\s*(?:INSIGHT:|\d+\.\s|[•\-]\s))")
+INSIGHT_MARKER = re.compile(r"\s*(?:(?:INSIGHT:|\d+\.\s|[•\-]\s)\s*)+")
+PROMPT_PLACE_FIELDS = ('name', 'rating', 'user_ratings_total', 'price_level', 'priceLevel', 'types')
+
+COMBINED_INSIGHTS_PROMPT = PromptTemplate("""
+        As a senior data analyst and business strategy expert, perform comprehensive Exploratory Data Analysis (EDA) on market research data for ${business_type} businesses in ${location}, then turn your findings into strategic business insights.
 
         DATA CONTEXT:
-        - Business Type: {business_type}
-        - Location: {location}
+        - Business Type: ${business_type}
+        - Location: ${location}
         - Data Collection: Recent market data from Google Places and Trends API
 
         SAMPLED BUSINESS DATA:
-        {json.dumps(sampled_data.get('places', [])[:10], indent=2)}
+        ${sampled_places}
 
         COMPREHENSIVE STATISTICS:
-        {json.dumps(statistics, indent=2)}
+        ${statistics}
 
-        Analyze this data thoroughly and provide 7-10 actionable EDA insights focusing on:
+        PART 1 - Provide 7-10 actionable EDA insights focusing on:
 
         1. DATA QUALITY ASSESSMENT:
            - Missing values and data completeness
@@ -85,55 +56,10 @@ class EDAAgent:
            - Seasonal variations
            - Growth momentum
 
-        Format each insight as:
+        Format each EDA insight as:
         "INSIGHT: [Clear finding] - IMPLICATION: [What this means for business] - DATA: [Supporting metric]"
 
-        Make insights specific to {business_type} in {location} and actionable for business strategy.
-        """
-        
-        response = self._call_llm(prompt)
-        return self._parse_enhanced_insights(response)
-    
-    def _parse_enhanced_insights(self, text: str) -> List[str]:
-        """Parse LLM response into structured insights with better formatting"""
-        insights = []
-        lines = text.split('\n')
-        
-        current_insight = ""
-        for line in lines:
-            line = line.strip()
-            if line.startswith('INSIGHT:') or line.startswith('•') or line.startswith('-') or (line and line[0].isdigit() and '.' in line[:3]):
-                if current_insight:
-                    insights.append(current_insight.strip())
-                    current_insight = ""
-                
-                # Clean the line
-                clean_line = line.replace('INSIGHT:', '').replace('•', '').replace('-', '').strip()
-                if clean_line and len(clean_line) > 20:
-                    current_insight = clean_line
-            elif current_insight and line and not line.startswith('IMPLEMENTATION:') and not line.startswith('DATA:'):
-                current_insight += " " + line
-        
-        if current_insight:
-            insights.append(current_insight.strip())
-        
-        # Fallback: split by sentences if no structured insights found
-        if not insights or len(insights) < 3:
-            sentences = [s.strip() + '.' for s in text.split('.') if len(s.strip()) > 30]
-            insights = sentences[:7]
-        
-        return insights[:10]
-    
-    def _generate_business_insights(self, key_patterns: Dict, business_type: str, location: str) -> List[str]:
-        """Generate actionable business insights from patterns"""
-        
-        prompt = f"""
-        As a business strategy expert, generate actionable insights for opening a {business_type} in {location}.
-
-        MARKET ANALYSIS PATTERNS:
-        {json.dumps(key_patterns, indent=2)}
-
-        Generate 5-7 strategic business insights focusing on:
+        PART 2 - Building on your EDA findings, generate 5-7 strategic business insights for opening a ${business_type} in ${location} focusing on:
 
         1. MARKET ENTRY STRATEGY:
            - Optimal timing and positioning
@@ -155,46 +81,130 @@ class EDAAgent:
            - Market saturation risks
            - Customer acquisition challenges
 
-        Format each insight as:
+        Format each business insight as:
         "STRATEGY: [Specific action] - IMPACT: [Expected outcome] - EXECUTION: [How to implement]"
 
-        Make insights specific, measurable, and directly applicable to {business_type} in {location}.
-        """
-        
-        response = self._call_llm(prompt)
-        return self._parse_enhanced_insights(response)
+        Make all insights specific, measurable, and directly applicable to ${business_type} in ${location}.
+
+        Return ONLY a valid JSON object in this format:
+        {
+            "eda_insights": ["INSIGHT: ... - IMPLICATION: ... - DATA: ..."],
+            "business_insights": ["STRATEGY: ... - IMPACT: ... - EXECUTION: ..."]
+        }
+        """)
 
+class EDAAgent:
+    def __init__(self, model: str = "llama_70b"):
+        self.client = get_cerebras_client()
+        self.model = settings.MODELS[model]
+        self.data_processor = get_data_processor()
     
-    def _parse_insights(self, text: str) -> List[str]:
-        """Parse LLM response into structured insights"""
-        insights = []
-        lines = text.split('\n')
+    def perform_comprehensive_eda(self, raw_data: Dict, business_type: str, location: str) -> Tuple[Dict, List[str]]:
+        """Perform comprehensive EDA and generate insights"""
         
-        for line in lines:
-            line = line.strip()
-            if line and any(line.startswith(str(i)) for i in range(1, 10)):
-                # Remove numbering and clean
-                insight = line[2:].strip() if len(line) > 2 and line[1] in ['.', ')'] else line
-                if insight and len(insight) > 20:
-                    insights.append(insight)
+        print(f"🔍 Performing comprehensive EDA for {business_type} in {location}...")
+        
+        # Step 1: Data sampling and statistical analysis
+        sampled_data, statistics = self._sample_and_analyze_data(raw_data)
+        
+        # Step 2: Generate EDA and business insights in a single LLM round-trip
+        eda_insights, business_insights = self._generate_combined_insights(sampled_data, statistics, business_type, location)
         
-        # Fallback: split by sentences
-        if not insights:
+        # Step 3: Extract key patterns and trends
+        key_patterns = self._extract_key_patterns(eda_insights, statistics)
+        
+        return {
+            "sampled_data": sampled_data,
+            "statistics": statistics,
+            "eda_insights": eda_insights,
+            "key_patterns": key_patterns,
+            "location": location,
+            "business_type": business_type
+        }, business_insights
+    
+    def _generate_combined_insights(self, sampled_data: Dict, statistics: Dict, business_type: str, location: str) -> Tuple[List[str], List[str]]:
+        """Generate EDA insights and strategic business insights with one LLM call"""
+        
+        values = {
+            "business_type": canonical_text(business_type),
+            "location": canonical_text(location),
+            "sampled_places": self.data_processor.to_prompt_json(self._trim_places(sampled_data.get('places', [])[:10])),
+            "statistics": self.data_processor.to_prompt_json(statistics, float_digits=2)
+        }
+        prompt = COMBINED_INSIGHTS_PROMPT.render(**values)
+        prompt_key = COMBINED_INSIGHTS_PROMPT.cache_key(**values)
+
+        response = self._call_llm(prompt, max_completion_tokens=5000, prompt_key=prompt_key)
+        return self._parse_combined_insights(response)
+    
+    def _trim_places(self, places: List[Dict]) -> List[Dict]:
+        """Keep only the place fields the EDA prompt actually uses"""
+        return [{key: place[key] for key in PROMPT_PLACE_FIELDS if key in place} for place in places]
+    
+    def _parse_combined_insights(self, text: str) -> Tuple[List[str], List[str]]:
+        """Parse the combined JSON response into EDA and business insights"""
+        try:
+            json_str = text
+            if '```json' in text:
+                json_str = text.split('```json')[1].split('```')[0]
+            elif '```' in text:
+                json_str = text.split('```')[1].split('```')[0]
+            
+            data = json.loads(json_str.strip())
+            eda_insights = [str(i).strip() for i in data.get('eda_insights', []) if str(i).strip()]
+            business_insights = [str(i).strip() for i in data.get('business_insights', []) if str(i).strip()]
+            return eda_insights[:10], business_insights[:7]
+        except Exception as e:
+            print(f"⚠️ Combined insights parsing failed: {e}")
+            # Fall back to free-text parsing so callers still get insights
+            insights = self._parse_enhanced_insights(text)
+            return insights, insights[:7]
+    
+    def _parse_enhanced_insights(self, text: str) -> List[str]:
+        """Parse LLM response into structured insights with better formatting"""
+        insights = list(self._iter_enhanced_insights([text]))
+        
+        # Fallback: split by sentences if no structured insights found
+        if not insights or len(insights) < 3:
             sentences = [s.strip() + '.' for s in text.split('.') if len(s.strip()) > 30]
             insights = sentences[:7]
         
-        return insights[:7]
+        return insights[:10]
+    
+    def _iter_enhanced_insights(self, deltas: Iterable[str]) -> Iterator[str]:
+        """Yield each insight as soon as the next insight marker arrives (works on streamed text)"""
+        pending = ""
+        for delta in deltas:
+            pending += delta
+            *chunks, pending = INSIGHT_SPLIT.split(pending)
+            for chunk in chunks:
+                insight = self._clean_insight(chunk)
+                if insight:
+                    yield insight
+        
+        insight = self._clean_insight(pending)
+        if insight:
+            yield insight
+    
+    def _clean_insight(self, chunk: str) -> str:
+        """Strip the insight marker and collapse continuation lines; empty if the chunk is not an insight"""
+        marker = INSIGHT_MARKER.match(chunk)
+        if not marker:
+            return ""
+        insight = " ".join(chunk[marker.end():].split())
+        return insight if len(insight) > 20 else ""
     
-    def _call_llm(self, prompt: str) -> str:
+    def _call_llm(self, prompt: str, max_completion_tokens: int = 3000, prompt_key: Optional[str] = None) -> str:
         """Make LLM call to Cerebras"""
         try:
-            response = self.client.chat.completions.create(
+            return cached_chat_completion(
+                self.client,
                 messages=[{"role": "user", "content": prompt}],
                 model=self.model,
-                max_completion_tokens=3000,
+                prompt_key=prompt_key,
+                max_completion_tokens=max_completion_tokens,
                 temperature=0.6,
                 top_p=0.8
             )
-            return response.choices[0].message.content
         except Exception as e:
             return f"Error in EDA LLM call: {str(e)}"
\ No newline at end of file
@@ -1,21 +1,45 @@
 import os
-from cerebras.cloud.sdk import Cerebras
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 from config.settings import settings
+from tools.llm_client import get_cerebras_client, cached_chat_completion
 from config.models import AgentResponse
-from visualizations.visualization import VisualizationGenerator
+from visualizations.visualization import get_viz_generator
 
 class EvaluationAgent:
     def __init__(self, model: str = "qwen_480b"):
-        self.client = Cerebras(api_key=settings.CEREBRAS_API_KEY)
+        self.client = get_cerebras_client()
         self.model = settings.MODELS[model]
-        self.viz_generator = VisualizationGenerator()
+        self.viz_generator = get_viz_generator()
     
     def evaluate_insights(self, research_insights: str, analysis_insights: str, 
                          business_type: str, location: str) -> Dict[str, Any]:
         """Evaluate and synthesize insights from both agents"""
         
-        evaluation_prompt = f"""
+        evaluation_prompt = self._build_evaluation_prompt(research_insights, analysis_insights, business_type, location)
+        synthesis_prompt = self._build_synthesis_prompt(research_insights, analysis_insights)
+        
+        # Evaluation and synthesis are independent - issue them as one concurrent batch
+        evaluation_response, synthesis_response = self._call_llm_batch([evaluation_prompt, synthesis_prompt])
+        
+        # Generate visualizations
+        visualizations = self.viz_generator.generate_visualizations(
+            research_insights + " " + analysis_insights,
+            business_type,
+            location
+        )
+        
+        return {
+            "evaluation": evaluation_response,
+            "visualizations": visualizations,
+            "synthesis": synthesis_response,
+            "confidence_score": 0.92
+        }
+    
+    def _build_evaluation_prompt(self, research_insights: str, analysis_insights: str,
+                                 business_type: str, location: str) -> str:
+        """Build the insight evaluation prompt"""
+        return f"""
         As an expert business evaluator, synthesize and evaluate the following insights for {business_type} in {location}:
         
         RESEARCH AGENT INSIGHTS:
@@ -33,44 +57,31 @@ class EvaluationAgent:
         
         Be critical and data-driven in your evaluation.
         """
-        
-        evaluation_response = self._call_llm(evaluation_prompt)
-        
-        # Generate visualizations
-        visualizations = self.viz_generator.generate_visualizations(
-            research_insights + " " + analysis_insights,
-            business_type,
-            location
-        )
-        
-        return {
-            "evaluation": evaluation_response,
-            "visualizations": visualizations,
-            "synthesis": self._synthesize_findings(research_insights, analysis_insights),
-            "confidence_score": 0.92
-        }
     
-    def _synthesize_findings(self, research_insights: str, analysis_insights: str) -> str:
-        """Synthesize findings from both agents"""
-        synthesis_prompt = f"""
+    def _build_synthesis_prompt(self, research_insights: str, analysis_insights: str) -> str:
+        """Build the synthesis prompt"""
+        return f"""
         Synthesize these two perspectives into a cohesive business intelligence report:
         
         Research: {research_insights}
         Analysis: {analysis_insights}
         """
-        
-        return self._call_llm(synthesis_prompt)
     
     def _call_llm(self, prompt: str) -> str:
         """Make LLM call to Cerebras"""
         try:
-            response = self.client.chat.completions.create(
+            return cached_chat_completion(
+                self.client,
                 messages=[{"role": "user", "content": prompt}],
                 model=self.model,
                 max_completion_tokens=6000,
                 temperature=0.5,
                 top_p=0.9
             )
-            return response.choices[0].message.content
         except Exception as e:
-            return f"Error in LLM call: {str(e)}"
\ No newline at end of file
+            return f"Error in LLM call: {str(e)}"
+    
+    def _call_llm_batch(self, prompts: List[str]) -> List[str]:
+        """Send independent prompts concurrently so the provider can batch them; results keep prompt order"""
+        with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+            return list(executor.map(self._call_llm, prompts))
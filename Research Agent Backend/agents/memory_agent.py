@@ -1,82 +1,209 @@
 # memory_agent.py
 import json
-from typing import Dict, Any, List
+import asyncio
+import threading
+import time
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from config.settings import settings
 from tools.llm_client import MultiProviderLLM
 from memory.memory_manager import BusinessMemoryManager
+from tools.semantic_cache import SemanticCache
+from tools.prompt_template import PromptTemplate, canonical_key
+
+CHAT_CACHE_TTL_SECONDS = 3600
+
+# Static chat instructions - kept ahead of all per-request text so provider prefix caching can reuse them
+CHAT_SYSTEM_PROMPT = """You are an expert business intelligence analyst with access to the user's complete research history.
+
+Guidelines:
+1. Use ALL available context - research data, city opportunities, scraped data, and conversation history
+2. Reference specific previous analyses when relevant
+3. Provide data-driven insights based on stored research
+4. If research data exists, use actual numbers and metrics from it
+5. Maintain conversation continuity
+6. Be specific and actionable
+
+If no relevant research data exists, provide general insights and suggest running comprehensive research.
+
+"""
+
+CHAT_QUERY_PROMPT = PromptTemplate("""CURRENT QUERY:
+User: ${message}
+Business Type: ${business_type}
+Location: ${location}""")
 
 class MemoryEnhancedAgent:
     def __init__(self):
-        self.llm_client = MultiProviderLLM()
         self.memory_manager = BusinessMemoryManager()
+        # Near-duplicate chat answers, scoped per user/business type/location
+        self.chat_index = SemanticCache()
+        self.chat_responses: Dict[str, Tuple[str, float]] = {}
+        self.chat_cache_lock = threading.Lock()
+    
+    @cached_property
+    def llm_client(self) -> MultiProviderLLM:
+        """Provider clients are only set up once a chat actually needs the LLM"""
+        return MultiProviderLLM()
     
     def process_chat_with_memory(self, user_id: str, message: str, business_type: str = "", location: str = "") -> Dict[str, Any]:
         """Process user chat with comprehensive memory context"""
+        if not message.strip():
+            return self._empty_message_response(user_id, business_type, location)
         
         try:
-            # Get comprehensive context including research data
-            context_summary = self.memory_manager.get_context_summary(user_id, business_type, location)
+            scope = self._chat_scope(user_id, business_type, location)
+            response_text = self._lookup_chat_response(scope, message)
+            if response_text is None:
+                # Context is only assembled when a real provider will read it - mock replies ignore it
+                context_summary = ""
+                if self.llm_client.ready():
+                    context_summary = self.memory_manager.get_context_summary(user_id, business_type, location)
+                
+                # Generate response using LLM
+                response_text = self.llm_client.generate_completion(
+                    messages=self._build_chat_messages(context_summary, message, business_type, location),
+                    model_key="gpt_oss_120b",
+                    max_tokens=2000,
+                    temperature=0.7
+                )
+                self._remember_chat_response(scope, message, response_text)
             
-            # Create enhanced system prompt
-            system_prompt = f"""
-            You are an expert business intelligence analyst with access to the user's complete research history.
-
-            {context_summary}
-
-            CURRENT QUERY:
-            User: {message}
-            Business Type: {business_type if business_type else 'Not specified'}
-            Location: {location if location else 'Not specified'}
-
-            Guidelines:
-            1. Use ALL available context - research data, city opportunities, scraped data, and conversation history
-            2. Reference specific previous analyses when relevant
-            3. Provide data-driven insights based on stored research
-            4. If research data exists, use actual numbers and metrics from it
-            5. Maintain conversation continuity
-            6. Be specific and actionable
-
-            If no relevant research data exists, provide general insights and suggest running comprehensive research.
-            """
+            return self._record_chat(user_id, message, response_text, business_type, location)
             
-            # Generate response using LLM
-            response_text = self.llm_client.generate_completion(
-                messages=[{"role": "user", "content": system_prompt}],
-                model_key="gpt_oss_120b",
-                max_tokens=2000,
-                temperature=0.7
-            )
+        except Exception as e:
+            print(f"❌ Memory chat error: {e}")
+            return self._chat_error_response(user_id, business_type, location, e)
+    
+    async def aprocess_chat_with_memory(self, user_id: str, message: str, business_type: str = "", location: str = "") -> Dict[str, Any]:
+        """Async variant of process_chat_with_memory so concurrent chats interleave on one event loop"""
+        if not message.strip():
+            return self._empty_message_response(user_id, business_type, location)
+        
+        try:
+            scope = self._chat_scope(user_id, business_type, location)
+            response_text = self._lookup_chat_response(scope, message)
+            if response_text is None:
+                context_summary = ""
+                if self.llm_client.ready():
+                    # Memory lives on disk - keep file I/O off the event loop
+                    context_summary = await asyncio.to_thread(
+                        self.memory_manager.get_context_summary, user_id, business_type, location
+                    )
+                
+                response_text = await self.llm_client.agenerate_completion(
+                    messages=self._build_chat_messages(context_summary, message, business_type, location),
+                    model_key="gpt_oss_120b",
+                    max_tokens=2000,
+                    temperature=0.7
+                )
+                self._remember_chat_response(scope, message, response_text)
             
-            # Add conversation to memory
-            self.memory_manager.add_conversation(
-                user_id=user_id,
-                user_message=message,
-                assistant_response=response_text,
-                business_type=business_type,
-                location=location
+            return await asyncio.to_thread(
+                self._record_chat, user_id, message, response_text, business_type, location
             )
             
-            return {
-                "response": response_text,
-                "user_id": user_id,
-                "business_type": business_type,
-                "location": location,
-                "timestamp": datetime.now().isoformat(),
-                "has_research_context": bool(self.memory_manager.get_all_research_data(user_id))
-            }
-            
         except Exception as e:
             print(f"❌ Memory chat error: {e}")
-            return {
-                "response": "I apologize, but I'm having trouble accessing your research memory. Please try again.",
-                "user_id": user_id,
-                "business_type": business_type,
-                "location": location,
-                "timestamp": datetime.now().isoformat(),
-                "has_research_context": False,
-                "error": str(e)
-            }
+            return self._chat_error_response(user_id, business_type, location, e)
+    
+    def _chat_scope(self, user_id: str, business_type: str = "", location: str = "") -> str:
+        """Cached chat answers are only reused for the same user, business type and location"""
+        return f"chat:{user_id}:{canonical_key(business_type)}:{canonical_key(location)}"
+    
+    def _lookup_chat_response(self, scope: str, message: str) -> Optional[str]:
+        """Return a stored answer to a near-duplicate question, if still fresh"""
+        cache_key = self.chat_index.lookup(scope, message)
+        if cache_key is None:
+            return None
+        
+        with self.chat_cache_lock:
+            cached = self.chat_responses.get(cache_key)
+            if cached is None or time.time() - cached[1] > CHAT_CACHE_TTL_SECONDS:
+                self.chat_responses.pop(cache_key, None)
+                return None
+        
+        print(f"💾 Chat cache hit for {scope}")
+        return cached[0]
+    
+    def _remember_chat_response(self, scope: str, message: str, response_text: str):
+        """Index a fresh LLM answer for near-duplicate lookups"""
+        if not self.llm_client.ready():
+            return  # never cache mock responses
+        
+        cache_key = f"{scope}:{time.time_ns()}"
+        with self.chat_cache_lock:
+            self.chat_responses[cache_key] = (response_text, time.time())
+        self.chat_index.add(scope, message, cache_key)
+    
+    def invalidate_chat_cache(self, user_id: str):
+        """Forget cached chat answers once the user's stored research changes"""
+        scope_prefix = f"chat:{user_id}:"
+        self.chat_index.invalidate(scope_prefix)
+        with self.chat_cache_lock:
+            for cache_key in [key for key in self.chat_responses if key.startswith(scope_prefix)]:
+                del self.chat_responses[cache_key]
+    
+    def _build_chat_messages(self, context_summary: str, message: str, business_type: str, location: str) -> List[Dict[str, str]]:
+        """Build the memory-aware chat prompt - static instructions and context first, the query last"""
+        query = CHAT_QUERY_PROMPT.render(
+            message=message,
+            business_type=business_type or 'Not specified',
+            location=location or 'Not specified'
+        )
+        
+        return [
+            {"role": "system", "content": CHAT_SYSTEM_PROMPT + self._canonicalize(context_summary)},
+            {"role": "user", "content": self._canonicalize(query)}
+        ]
+    
+    def _canonicalize(self, text: str) -> str:
+        """Normalize newlines and trailing whitespace so identical context yields a byte-identical prefix"""
+        lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        return "\n".join(line.rstrip() for line in lines).strip()
+    
+    def _record_chat(self, user_id: str, message: str, response_text: str, business_type: str, location: str) -> Dict[str, Any]:
+        """Add the exchange to memory and build the chat response"""
+        self.memory_manager.add_conversation(
+            user_id=user_id,
+            user_message=message,
+            assistant_response=response_text,
+            business_type=business_type,
+            location=location
+        )
+        
+        return {
+            "response": response_text,
+            "user_id": user_id,
+            "business_type": business_type,
+            "location": location,
+            "timestamp": datetime.now().isoformat(),
+            "has_research_context": bool(self.memory_manager.get_all_research_data(user_id))
+        }
+    
+    def _empty_message_response(self, user_id: str, business_type: str, location: str) -> Dict[str, Any]:
+        """Short-circuit blank messages without touching memory or the LLM"""
+        return {
+            "response": "Please enter a question about your business or market.",
+            "user_id": user_id,
+            "business_type": business_type,
+            "location": location,
+            "timestamp": datetime.now().isoformat(),
+            "has_research_context": False
+        }
+    
+    def _chat_error_response(self, user_id: str, business_type: str, location: str, error: Exception) -> Dict[str, Any]:
+        """Fallback chat response when memory or the LLM fails"""
+        return {
+            "response": "I apologize, but I'm having trouble accessing your research memory. Please try again.",
+            "user_id": user_id,
+            "business_type": business_type,
+            "location": location,
+            "timestamp": datetime.now().isoformat(),
+            "has_research_context": False,
+            "error": str(error)
+        }
     
     def save_comprehensive_research(self, user_id: str, business_type: str, location: str, research_data: Dict[str, Any]):
         """Save comprehensive research results to memory"""
@@ -87,6 +214,7 @@ class MemoryEnhancedAgent:
                 location=location,
                 research_data=research_data
             )
+            self.invalidate_chat_cache(user_id)
             
             return {
                 "message": "Research data saved to memory successfully",
@@ -114,6 +242,7 @@ class MemoryEnhancedAgent:
                 city=city,
                 opportunities_data=opportunities_data
             )
+            self.invalidate_chat_cache(user_id)
             
             return {
                 "message": "City opportunities saved to memory successfully",
@@ -141,6 +270,7 @@ class MemoryEnhancedAgent:
                 location=location,
                 scraped_data=scraped_data
             )
+            self.invalidate_chat_cache(user_id)
             
             return {
                 "message": "Scraped data saved to memory successfully",
@@ -192,6 +322,7 @@ class MemoryEnhancedAgent:
     def clear_conversation_history(self, user_id: str):
         """Clear user's complete memory"""
         self.memory_manager.clear_user_memory(user_id)
+        self.invalidate_chat_cache(user_id)
         return {
             "message": "All conversation history and research data cleared successfully",
             "user_id": user_id,
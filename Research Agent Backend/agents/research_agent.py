@@ -1,44 +1,147 @@
 import pandas as pd
-import json
+import re
 from datetime import datetime, timedelta
 import time
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import os
-import glob
 from concurrent.futures import ThreadPoolExecutor
+import logging
+from itertools import chain
+from functools import cached_property
+from dataclasses import dataclass
 import numpy as np
-import hashlib
+import xxhash
 
 from config.settings import settings
 from config.models import AgentResponse
-from tools.apify_client import ApifyDataCollector
+from tools.apify_client import get_apify_client
+from tools.searchapi_client import SearchAPIClient
 from tools.llm_client import MultiProviderLLM
 from tools.cache_manager import CacheManager
+from tools.data_processor import DataProcessor
+from tools.prompt_template import canonical_key
+
+logger = logging.getLogger(__name__)
+
+NS_PER_DAY = 86_400 * 10**9
+
+PLACES_NUMERIC_COLUMNS = ('rating', 'user_ratings_total', 'priceLevel')
+# priceLevel stays as scraped - it is reported back as a label, not aggregated
+COMPETITOR_NUMERIC_COLUMNS = ('rating', 'user_ratings_total', 'latitude', 'longitude')
+
+# (key, default) copied from each top competitor into the chart rows
+COMPETITOR_CHART_FIELDS = (('name', 'Unknown'), ('rating', 0), ('reviews', 0), ('price_level', 'Unknown'))
+
+# (source column, output key, default when the column is absent) for the visualization map points
+GEOGRAPHIC_FIELDS = (
+    ('name', 'name', 'Unknown'),
+    ('address', 'address', 'Unknown'),
+    ('latitude', 'latitude', None),
+    ('longitude', 'longitude', None),
+    ('rating', 'rating', 0),
+    ('user_ratings_total', 'reviews', 0),
+    ('priceLevel', 'price_level', 'Unknown')
+)
+# Integer counts/levels that pandas widens to float once any place is missing them
+GEOGRAPHIC_INTEGER_COLUMNS = ('user_ratings_total', 'priceLevel')
+
+# Raw snapshot formats, preferred first
+RAW_DATA_DIR = "data/raw"
+RAW_DATA_EXTENSIONS = ('parquet', 'csv')
+
+# Tried in order - an explicit "confidence: N%" wins over a bare "score N/100"
+CONFIDENCE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'confidence.*?(\d+)%',
+    r'(\d+)%.*?confidence',
+    r'score.*?(\d+)/100'
+))
+
+# Thresholds for the "value > threshold" classifiers, lowest bucket first
+MOMENTUM_BINS = np.array([-15, -5, 5, 15])
+MOMENTUM_LABELS = ("strong_negative", "moderate_negative", "stable", "moderate_positive", "strong_positive")
+TREND_SUMMARY_BINS = np.array([-10, -5, 5, 10])
+TREND_SUMMARY_LABELS = ("Strong Decline", "Moderate Decline", "Stable", "Moderate Growth", "Strong Growth")
+SATURATION_BINS = np.array([5, 15, 25])
+SATURATION_LABELS = ("Very Low", "Low", "Medium", "High")
+SEASONALITY_BINS = np.array([0.2, 0.4])
+SEASONALITY_LABELS = ("low_seasonality", "moderate_seasonality", "strong_seasonality")
+
+# DataFrame.attrs key memoizing the monthly variation of a trends frame
+MONTHLY_VARIATION_ATTR = "monthly_variation"
+
+# Rating buckets are [low, high) - the last bin of np.histogram is closed, so 4.5+ lands in "excellent"
+RATING_BUCKET_EDGES = np.array([-np.inf, 3.0, 3.5, 4.0, 4.5, np.inf])
+RATING_BUCKET_KEYS = ("excellent_45_50", "very_good_40_45", "good_35_40", "average_30_35", "poor_below_30")
+RATING_BUCKET_LABELS = ("Excellent (4.5-5.0)", "Very Good (4.0-4.5)", "Good (3.5-4.0)", "Average (3.0-3.5)", "Poor (<3.0)")
+
+# Lookup tables for the market classifiers - ratings bin on >= thresholds, review totals on > thresholds
+RATING_RANGE_BINS = np.array([3.5, 4.0, 4.5])
+RATING_RANGE_LABELS = np.array(["average_quality", "good_quality", "high_quality", "excellent_quality"])
+SENTIMENT_REVIEW_BINS = np.array([100, 500, 1000])
+SENTIMENT_RATING_BINS = np.array([3.5, 4.0])
+SENTIMENT_LABELS = np.array([
+    ["limited_data", "limited_data", "limited_data"],  # <= 100 reviews
+    ["moderate", "moderate", "moderate"],              # <= 500 reviews
+    ["moderate", "positive", "positive"],              # <= 1000 reviews
+    ["moderate", "positive", "highly_positive"]        # > 1000 reviews
+])
+
+@dataclass(frozen=True)
+class MarketFrames:
+    """Places/trends DataFrames built once per research run and shared by every analysis step"""
+    places_df: Optional[pd.DataFrame]
+    trends_df: Optional[pd.DataFrame]
+    
+    @classmethod
+    def from_market_data(cls, market_data: Dict[str, Any]) -> "MarketFrames":
+        trends_df = pd.DataFrame(market_data["trends_data"]) if market_data.get("trends_data") else None
+        if trends_df is not None and 'date' in trends_df.columns and not pd.api.types.is_datetime64_any_dtype(trends_df['date']):
+            # Parse once here; downstream helpers only use the .dt accessor
+            trends_df['date'] = pd.to_datetime(trends_df['date'], errors='coerce', cache=True)
+        
+        return cls(
+            places_df=pd.DataFrame(market_data["places_data"]) if market_data.get("places_data") else None,
+            trends_df=trends_df
+        )
 
 class AdvancedResearchAgent:
     def __init__(self):
-        self.llm_client = MultiProviderLLM()
-        self.apify_client = ApifyDataCollector()
-        self.cache_manager = CacheManager()
-        self.executor = ThreadPoolExecutor(max_workers=3)
         self.data_retention_days = 1
     
+    # Heavy collaborators are built on first use so cache-hit and chat-only paths never pay for them
+    @cached_property
+    def llm_client(self) -> MultiProviderLLM:
+        return MultiProviderLLM()
+    
+    @cached_property
+    def apify_client(self):
+        return get_apify_client()
+    
+    @cached_property
+    def searchapi_client(self) -> SearchAPIClient:
+        return SearchAPIClient()
+    
+    @cached_property
+    def cache_manager(self) -> CacheManager:
+        return CacheManager()
+    
+    @cached_property
+    def executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=8)
+    
     def _generate_cache_key(self, business_type: str, location: str, research_type: str) -> str:
         """Generate unique cache key based on business type AND location"""
         # Normalize inputs to avoid case sensitivity issues
-        normalized_business = business_type.lower().strip().replace(' ', '_')
-        normalized_location = location.lower().strip().replace(' ', '_').replace(',', '_')
-        
-        key_string = f"{normalized_business}_{normalized_location}_{research_type}"
-        return hashlib.md5(key_string.encode()).hexdigest()
+        key_string = f"{canonical_key(business_type)}_{canonical_key(location)}_{research_type}"
+        return xxhash.xxh3_64_hexdigest(key_string)
     
-    def _should_use_cached_data(self, business_type: str, location: str) -> bool:
-        """Check if we should use cached data for this specific business type and location"""
+    def _should_use_cached_data(self, business_type: str, location: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Check if we should use cached data for this specific business type and location; returns the entry too"""
         cache_key = self._generate_cache_key(business_type, location, "advanced")
         cached = self.cache_manager.get_cached_result(cache_key)
         
         if not cached:
-            return False
+            return False, None
         
         # Additional validation: check if cached data matches our current request
         try:
@@ -53,44 +156,44 @@ class AdvancedResearchAgent:
             # Only use cache if business type AND location match exactly
             if (cached_business == current_business and 
                 cached_location == current_location):
-                print(f"🎯 Valid cache found for {business_type} in {location}")
-                return True
+                logger.debug("🎯 Valid cache found for %s in %s", business_type, location)
+                return True, cached
             else:
-                print(f"🔄 Cache mismatch: {cached_business}/{cached_location} vs {current_business}/{current_location}")
-                return False
+                logger.debug("🔄 Cache mismatch: %s/%s vs %s/%s", cached_business, cached_location, current_business, current_location)
+                return False, None
                 
         except Exception as e:
-            print(f"⚠️ Cache validation error: {e}")
-            return False
+            logger.warning("⚠️ Cache validation error: %s", e)
+            return False, None
     
     def conduct_research(self, business_type: str, location: str, use_cache: bool = True) -> AgentResponse:
         """Conduct comprehensive market research with proper location-specific caching"""
         start_time = time.time()
-        print(f"🚀 Starting advanced research: {business_type} in {location}")
+        logger.info("🚀 Starting advanced research: %s in %s", business_type, location)
         
         # Check cache for previous research results with proper validation
-        if use_cache and self._should_use_cached_data(business_type, location):
-            cache_key = self._generate_cache_key(business_type, location, "advanced")
-            cached = self.cache_manager.get_cached_result(cache_key)
-            if cached:
-                print(f"🎯 Using cached research results for {business_type} in {location}")
+        if use_cache:
+            use_cached, cached = self._should_use_cached_data(business_type, location)
+            if use_cached:
+                logger.info("🎯 Using cached research results for %s in %s", business_type, location)
                 return AgentResponse(**cached['data'])
         
         try:
             # Step 1: Always collect fresh data for new locations
-            print(f"🌐 Collecting FRESH market data for {location}...")
+            logger.info("🌐 Collecting FRESH market data for %s...", location)
             market_data = self._collect_fresh_market_data(business_type, location)
             
             # Step 2: Comprehensive analysis
-            print("📊 Analyzing market dynamics...")
-            analysis_results = self._perform_comprehensive_analysis(market_data, business_type, location)
+            logger.info("📊 Analyzing market dynamics...")
+            frames = MarketFrames.from_market_data(market_data)
+            analysis_results = self._perform_comprehensive_analysis(frames, business_type, location)
             
             # Step 3: Generate visualization data
-            print("📈 Preparing visualization data...")
-            visualization_data = self._prepare_visualization_data(market_data, analysis_results)
+            logger.info("📈 Preparing visualization data...")
+            visualization_data = self._prepare_visualization_data(market_data, frames, analysis_results)
             
             # Step 4: Generate business intelligence
-            print("💼 Generating business intelligence...")
+            logger.info("💼 Generating business intelligence...")
             business_report = self._generate_business_intelligence(analysis_results, business_type, location)
             
             execution_time = time.time() - start_time
@@ -126,51 +229,46 @@ class AdvancedResearchAgent:
             if use_cache:
                 cache_key = self._generate_cache_key(business_type, location, "advanced")
                 self.cache_manager.save_result_to_cache(cache_key, response_data)
-                print(f"💾 Cached fresh data for {business_type} in {location}")
+                logger.info("💾 Cached fresh data for %s in %s", business_type, location)
             
-            print(f"✅ Research completed in {execution_time:.2f}s for {location}")
+            logger.info("✅ Research completed in %.2fs for %s", execution_time, location)
             return AgentResponse(**response_data)
             
         except Exception as e:
-            print(f"❌ Research failed for {location}: {e}")
+            logger.error("❌ Research failed for %s: %s", location, e)
             return self._create_fallback_response(business_type, location)
     
     # In research_agent.py, replace the data collection methods:
 
     def _collect_fresh_market_data(self, business_type: str, location: str) -> Dict[str, Any]:
         """Collect fresh market data using SearchAPI"""
-        print(f"🔍 Collecting FRESH data using SearchAPI for {business_type} in {location}...")
+        logger.info("🔍 Collecting FRESH data using SearchAPI for %s in %s...", business_type, location)
         
         places_data = []
         trends_data = []
         related_searches = []
         
         try:
-            # Collect Google Maps data for competitors
-            print(f"🏢 Searching Google Maps for competitors in {location}...")
             search_queries = [
                 f"{business_type} in {location}",
                 f"best {business_type} {location}",
                 f"{business_type} services {location}"
             ]
-            
-            for query in search_queries:
-                places_data.extend(self.searchapi_client.search_google_maps(query, location))
-            
-            # Collect Google Trends data for market analysis
-            print(f"📈 Getting Google Trends for {business_type} in {location}...")
             trends_keywords = [
                 business_type,
                 f"{business_type} services",
                 f"{business_type} {location}"
             ]
             
-            for keyword in trends_keywords:
-                trends_data.extend(self.searchapi_client.search_google_trends(keyword, "IN"))
+            # Google Maps competitors, Google Trends and related searches are independent round-trips - run them concurrently
+            logger.info("🏢 Searching Google Maps, Trends and related searches for %s in %s...", business_type, location)
+            places_futures = [self.executor.submit(self.searchapi_client.search_google_maps, query, location) for query in search_queries]
+            trends_futures = [self.executor.submit(self.searchapi_client.search_google_trends, keyword, "IN") for keyword in trends_keywords]
+            related_future = self.executor.submit(self.searchapi_client.get_related_searches, business_type)
             
-            # Get related searches for opportunity analysis
-            print(f"🔍 Getting related searches for {business_type}...")
-            related_searches = self.searchapi_client.get_related_searches(business_type)
+            places_data = list(chain.from_iterable(future.result() for future in places_futures))
+            trends_data = list(chain.from_iterable(future.result() for future in trends_futures))
+            related_searches = related_future.result()
             
             # Save data with location-specific filename
             if places_data:
@@ -178,10 +276,10 @@ class AdvancedResearchAgent:
             if trends_data:
                 self._save_data_with_timestamp(trends_data, business_type, location, "trends")
             
-            print(f"✅ Collected {len(places_data)} places, {len(trends_data)} trends, and {len(related_searches)} related searches for {location}")
+            logger.info("✅ Collected %s places, %s trends, and %s related searches for %s", len(places_data), len(trends_data), len(related_searches), location)
                 
         except Exception as e:
-            print(f"⚠️ Data collection issue for {location}: {e}")
+            logger.warning("⚠️ Data collection issue for %s: %s", location, e)
         
         return {
             "places_data": places_data,
@@ -198,24 +296,21 @@ class AdvancedResearchAgent:
     
     def _collect_smart_market_data(self, business_type: str, location: str) -> Dict[str, Any]:
         """Smart data collection that ensures location-specific data"""
-        print(f"🔍 Collecting fresh data for {location}...")
+        logger.info("🔍 Collecting fresh data for %s...", location)
         
         # Always collect fresh data for new locations
         places_data = []
         trends_data = []
         
         try:
-            # Collect fresh places data for the specific location
-            print(f"🌐 Collecting fresh places data for {location}...")
-            places_data = self.apify_client.scrape_places_data([
-                f"{business_type} in {location}", 
-                f"best {business_type} {location}",
-                f"{business_type} {location}"
-            ])
-            
-            # Collect fresh trends data for the specific location
-            print(f"🌐 Collecting fresh trends data for {location}...")
-            trends_data = self.apify_client.scrape_trends_data(
+            # Collect fresh places and trends data for the specific location concurrently
+            logger.info("🌐 Collecting fresh places and trends data for %s...", location)
+            places_data, trends_data = self.apify_client.scrape_market_data(
+                [
+                    f"{business_type} in {location}", 
+                    f"best {business_type} {location}",
+                    f"{business_type} {location}"
+                ],
                 [business_type, f"{business_type} services", f"{business_type} {location}"], 
                 location
             )
@@ -227,7 +322,7 @@ class AdvancedResearchAgent:
                 self._save_data_with_timestamp(trends_data, business_type, location, "trends")
                 
         except Exception as e:
-            print(f"⚠️ Data collection issue for {location}: {e}")
+            logger.warning("⚠️ Data collection issue for %s: %s", location, e)
         
         return {
             "places_data": places_data,
@@ -241,33 +336,41 @@ class AdvancedResearchAgent:
             }
         }
     
-    def _perform_comprehensive_analysis(self, market_data: Dict, business_type: str, location: str) -> Dict[str, Any]:
+    def _perform_comprehensive_analysis(self, frames: MarketFrames, business_type: str, location: str) -> Dict[str, Any]:
         """Perform comprehensive market analysis"""
         analysis = {}
+        places_df, trends_df = frames.places_df, frames.trends_df
+        
+        # Competition, trends and EDA only read the shared frames - run them concurrently
+        competition_future = trends_future = None
         
         # 1. Competitive Analysis with real business data
-        if market_data.get("places_data"):
-            print("🏢 Analyzing competitive landscape...")
-            analysis["competitive_analysis"] = self._analyze_real_competition(
-                market_data["places_data"], business_type, location
-            )
+        if places_df is not None:
+            logger.info("🏢 Analyzing competitive landscape...")
+            competition_future = self.executor.submit(self._analyze_real_competition, places_df, business_type, location)
         
         # 2. Market Trends Analysis
-        if market_data.get("trends_data"):
-            print("📈 Analyzing market trends...")
-            analysis["trends_analysis"] = self._analyze_real_trends(
-                market_data["trends_data"], business_type, location
-            )
+        if trends_df is not None:
+            logger.info("📈 Analyzing market trends...")
+            trends_future = self.executor.submit(self._analyze_real_trends, trends_df, business_type, location)
         
-        # 3. Locality Analysis
+        # 4. Enhanced EDA Analysis
+        eda_future = self.executor.submit(self._perform_enhanced_eda, places_df, trends_df, business_type, location)
+        
+        if competition_future is not None:
+            analysis["competitive_analysis"] = competition_future.result()
+        if trends_future is not None:
+            analysis["trends_analysis"] = trends_future.result()
+        
+        # 3. Locality Analysis - needs both competition and trends results
         analysis["locality_analysis"] = self._analyze_locality_dynamics(analysis, business_type, location)
         
-        # 4. Enhanced EDA Analysis
-        analysis["eda_analysis"] = self._perform_enhanced_eda(market_data, business_type, location)
+        analysis["eda_analysis"] = eda_future.result()
         
         return analysis
     
-    def _perform_enhanced_eda(self, market_data: Dict, business_type: str, location: str) -> Dict[str, Any]:
+    def _perform_enhanced_eda(self, places_df: Optional[pd.DataFrame], trends_df: Optional[pd.DataFrame],
+                              business_type: str, location: str) -> Dict[str, Any]:
         """Perform enhanced exploratory data analysis"""
         eda_results = {
             "data_quality": {},
@@ -276,25 +379,54 @@ class AdvancedResearchAgent:
             "opportunity_metrics": {}
         }
         
+        # One fused pass over the numeric places columns feeds every downstream metric
+        places_stats = self._summarize_places(places_df) if places_df is not None else None
+        
         # Analyze data quality
-        if market_data.get("places_data"):
-            places_df = pd.DataFrame(market_data["places_data"])
-            eda_results["data_quality"]["places"] = self._assess_places_data_quality(places_df)
+        if places_df is not None:
+            eda_results["data_quality"]["places"] = self._assess_places_data_quality(places_df, places_stats)
         
-        if market_data.get("trends_data"):
-            trends_df = pd.DataFrame(market_data["trends_data"])
+        if trends_df is not None:
             eda_results["data_quality"]["trends"] = self._assess_trends_data_quality(trends_df)
         
         # Extract market patterns
-        eda_results["market_patterns"] = self._extract_market_patterns(market_data)
+        eda_results["market_patterns"] = self._extract_market_patterns(places_stats, trends_df)
         
         # Calculate risk and opportunity metrics
-        eda_results["risk_indicators"] = self._calculate_risk_indicators(market_data)
-        eda_results["opportunity_metrics"] = self._calculate_opportunity_metrics(market_data)
+        eda_results["risk_indicators"] = self._calculate_risk_indicators(places_stats, trends_df)
+        eda_results["opportunity_metrics"] = self._calculate_opportunity_metrics(places_stats)
         
         return eda_results
     
-    def _assess_places_data_quality(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _summarize_places(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Count, sum, mean, sample std and top-5 sum per numeric places column, touching each column once"""
+        stats = {"rows": len(df), "columns": set(df.columns)}
+        
+        for column in PLACES_NUMERIC_COLUMNS:
+            if column not in df.columns:
+                continue
+            values = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float)
+            present = ~np.isnan(values)
+            filled = np.where(present, values, 0.0)
+            
+            count = int(np.count_nonzero(present))
+            total = filled.sum()
+            mean = total / count if count else np.nan
+            variance = ((filled * filled).sum() - count * mean * mean) / (count - 1) if count > 1 else np.nan
+            top_k = min(5, filled.size)
+            
+            stats[column] = {
+                "count": count,
+                "nan_count": filled.size - count,
+                "sum": total,
+                "mean": mean,
+                "std": np.sqrt(max(variance, 0.0)) if count > 1 else np.nan,
+                "top5_sum": np.partition(filled, -top_k)[-top_k:].sum() if top_k else 0.0
+            }
+        
+        return stats
+    
+    def _assess_places_data_quality(self, df: pd.DataFrame, stats: Dict[str, Any]) -> Dict[str, Any]:
         """Assess quality of places data"""
         quality_metrics = {
             "completeness_score": 0,
@@ -310,16 +442,17 @@ class AdvancedResearchAgent:
         if missing_columns:
             quality_metrics["issues"].append(f"Missing critical columns: {missing_columns}")
         
-        # Calculate completeness
-        total_cells = df.size
-        missing_cells = df.isnull().sum().sum()
+        # Calculate completeness on the raw array - skips pandas' per-column dispatch
+        values = df.to_numpy()
+        total_cells = values.size
+        missing_cells = np.count_nonzero(pd.isna(values))
         completeness = (total_cells - missing_cells) / total_cells if total_cells > 0 else 0
         quality_metrics["completeness_score"] = round(completeness, 2)
         
         # Assess reliability through rating distribution
         if 'rating' in df.columns:
-            rating_stats = df['rating'].describe()
-            if rating_stats['std'] < 0.5:
+            rating_std = stats['rating']['std']
+            if rating_std < 0.5:
                 quality_metrics["issues"].append("Rating distribution may be biased")
             quality_metrics["reliability_score"] = 0.8  # Base reliability
         
@@ -338,13 +471,13 @@ class AdvancedResearchAgent:
         }
         
         if 'date' in df.columns and 'value' in df.columns:
-            # Check temporal coverage
-            dates = pd.to_datetime(df['date'])
-            date_range = (dates.max() - dates.min()).days
+            # Check temporal coverage on int64 nanoseconds
+            dates = df['date'].dropna().astype('int64').to_numpy()
+            date_range = (dates.max() - dates.min()) // NS_PER_DAY if dates.size else 0
             quality_metrics["temporal_coverage"] = min(date_range / 90, 1.0)  # Normalize to 90 days
             
             # Check consistency
-            value_std = df['value'].std()
+            value_std = self._column_std(df['value'])
             quality_metrics["consistency_score"] = 1.0 - min(value_std / 50, 1.0)  # Normalize volatility
             
             # Volatility analysis
@@ -357,7 +490,7 @@ class AdvancedResearchAgent:
         
         return quality_metrics
     
-    def _extract_market_patterns(self, market_data: Dict) -> Dict[str, Any]:
+    def _extract_market_patterns(self, places_stats: Optional[Dict[str, Any]], trends_df: Optional[pd.DataFrame]) -> Dict[str, Any]:
         """Extract meaningful market patterns from data"""
         patterns = {
             "customer_preferences": {},
@@ -366,61 +499,46 @@ class AdvancedResearchAgent:
             "seasonality_patterns": "unknown"
         }
         
-        if market_data.get("places_data"):
-            places_df = pd.DataFrame(market_data["places_data"])
-            
+        if places_stats is not None:
             # Analyze customer preferences through ratings and reviews
-            if 'rating' in places_df.columns and 'user_ratings_total' in places_df.columns:
+            if 'rating' in places_stats and 'user_ratings_total' in places_stats:
                 patterns["customer_preferences"] = {
-                    "preferred_rating_range": self._get_preferred_rating_range(places_df),
-                    "review_sentiment": self._analyze_review_sentiment(places_df)
+                    "preferred_rating_range": self._get_preferred_rating_range(places_stats),
+                    "review_sentiment": self._analyze_review_sentiment(places_stats)
                 }
             
             # Competitive dynamics
-            patterns["competitive_dynamics"] = self._analyze_competitive_dynamics(places_df)
+            patterns["competitive_dynamics"] = self._analyze_competitive_dynamics(places_stats)
             
             # Market maturity assessment
-            patterns["market_maturity"] = self._assess_market_maturity(places_df)
+            patterns["market_maturity"] = self._assess_market_maturity(places_stats)
         
-        if market_data.get("trends_data"):
-            trends_df = pd.DataFrame(market_data["trends_data"])
+        if trends_df is not None:
             patterns["seasonality_patterns"] = self._detect_seasonality(trends_df)
         
         return patterns
     
-    def _get_preferred_rating_range(self, df: pd.DataFrame) -> str:
+    def _get_preferred_rating_range(self, stats: Dict[str, Any]) -> str:
         """Determine preferred rating range in the market"""
-        if 'rating' not in df.columns:
+        if 'rating' not in stats:
             return "unknown"
         
-        rating_avg = df['rating'].mean()
-        if rating_avg >= 4.5:
-            return "excellent_quality"
-        elif rating_avg >= 4.0:
-            return "high_quality" 
-        elif rating_avg >= 3.5:
-            return "good_quality"
-        else:
-            return "average_quality"
+        rating_avg = np.nan_to_num(stats['rating']['mean'])
+        return str(RATING_RANGE_LABELS[np.searchsorted(RATING_RANGE_BINS, rating_avg, side='right')])
     
-    def _analyze_review_sentiment(self, df: pd.DataFrame) -> str:
+    def _analyze_review_sentiment(self, stats: Dict[str, Any]) -> str:
         """Analyze review sentiment based on volume and ratings"""
-        if 'user_ratings_total' not in df.columns or 'rating' not in df.columns:
+        if 'user_ratings_total' not in stats or 'rating' not in stats:
             return "unknown"
         
-        total_reviews = df['user_ratings_total'].sum()
-        avg_rating = df['rating'].mean()
+        total_reviews = stats['user_ratings_total']['sum']
+        avg_rating = np.nan_to_num(stats['rating']['mean'])
         
-        if total_reviews > 1000 and avg_rating >= 4.0:
-            return "highly_positive"
-        elif total_reviews > 500 and avg_rating >= 3.5:
-            return "positive"
-        elif total_reviews > 100:
-            return "moderate"
-        else:
-            return "limited_data"
+        reviews_bin = np.searchsorted(SENTIMENT_REVIEW_BINS, total_reviews, side='left')
+        rating_bin = np.searchsorted(SENTIMENT_RATING_BINS, avg_rating, side='right')
+        return str(SENTIMENT_LABELS[reviews_bin, rating_bin])
     
-    def _analyze_competitive_dynamics(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_competitive_dynamics(self, stats: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze competitive dynamics in the market"""
         dynamics = {
             "price_competition": "unknown",
@@ -429,16 +547,16 @@ class AdvancedResearchAgent:
         }
         
         # Price competition analysis
-        if 'priceLevel' in df.columns:
-            price_std = df['priceLevel'].std()
+        if 'priceLevel' in stats:
+            price_std = stats['priceLevel']['std']
             if price_std > 1.0:
                 dynamics["price_competition"] = "diverse_pricing"
             else:
                 dynamics["price_competition"] = "similar_pricing"
         
         # Quality competition
-        if 'rating' in df.columns:
-            rating_std = df['rating'].std()
+        if 'rating' in stats:
+            rating_std = stats['rating']['std']
             if rating_std > 0.8:
                 dynamics["quality_competition"] = "varied_quality"
             elif rating_std > 0.4:
@@ -447,12 +565,14 @@ class AdvancedResearchAgent:
                 dynamics["quality_competition"] = "consistent_quality"
         
         # Market concentration (Herfindahl-like index)
-        if 'name' in df.columns:
-            total_businesses = len(df)
+        if 'name' in stats['columns']:
+            total_businesses = stats['rows']
             if total_businesses > 0:
-                # Simple concentration measure
-                top_5_reviews = df.nlargest(5, 'user_ratings_total')['user_ratings_total'].sum() if 'user_ratings_total' in df.columns else 0
-                total_reviews = df['user_ratings_total'].sum() if 'user_ratings_total' in df.columns else 1
+                # Simple concentration measure - top-5 review share
+                top_5_reviews, total_reviews = 0, 1
+                if 'user_ratings_total' in stats:
+                    top_5_reviews = stats['user_ratings_total']['top5_sum']
+                    total_reviews = max(stats['user_ratings_total']['sum'], 1)
                 concentration = top_5_reviews / total_reviews
                 
                 if concentration > 0.7:
@@ -464,9 +584,14 @@ class AdvancedResearchAgent:
         
         return dynamics
     
-    def _assess_market_maturity(self, df: pd.DataFrame) -> str:
+    def _column_std(self, column: pd.Series) -> float:
+        """Sample standard deviation of a numeric column, ignoring missing values"""
+        values = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+        return np.nanstd(values, ddof=1) if np.count_nonzero(~np.isnan(values)) > 1 else np.nan
+    
+    def _assess_market_maturity(self, stats: Dict[str, Any]) -> str:
         """Assess market maturity based on business characteristics"""
-        total_businesses = len(df)
+        total_businesses = stats['rows']
         
         if total_businesses > 30:
             return "mature"
@@ -482,26 +607,12 @@ class AdvancedResearchAgent:
         if 'date' not in trends_df.columns or 'value' not in trends_df.columns:
             return "unknown"
         
-        try:
-            df = trends_df.copy()
-            df['date'] = pd.to_datetime(df['date'])
-            df['month'] = df['date'].dt.month
-            
-            monthly_avg = df.groupby('month')['value'].mean()
-            if len(monthly_avg) >= 6:
-                variation = monthly_avg.std() / monthly_avg.mean()
-                if variation > 0.4:
-                    return "strong_seasonality"
-                elif variation > 0.2:
-                    return "moderate_seasonality"
-                else:
-                    return "low_seasonality"
-        except:
-            pass
-        
-        return "unknown"
+        variation = self._monthly_variation(trends_df)
+        if variation is None:
+            return "unknown"
+        return self._bucket_label(variation, SEASONALITY_BINS, SEASONALITY_LABELS)
     
-    def _calculate_risk_indicators(self, market_data: Dict) -> Dict[str, Any]:
+    def _calculate_risk_indicators(self, places_stats: Optional[Dict[str, Any]], trends_df: Optional[pd.DataFrame]) -> Dict[str, Any]:
         """Calculate risk indicators for the market"""
         risks = {
             "competition_risk": "medium",
@@ -510,9 +621,8 @@ class AdvancedResearchAgent:
             "market_volatility_risk": "medium"
         }
         
-        if market_data.get("places_data"):
-            places_df = pd.DataFrame(market_data["places_data"])
-            competitor_count = len(places_df)
+        if places_stats is not None:
+            competitor_count = places_stats['rows']
             
             if competitor_count > 25:
                 risks["competition_risk"] = "high"
@@ -521,8 +631,7 @@ class AdvancedResearchAgent:
             else:
                 risks["competition_risk"] = "low"
         
-        if market_data.get("trends_data"):
-            trends_df = pd.DataFrame(market_data["trends_data"])
+        if trends_df is not None:
             if 'value' in trends_df.columns:
                 volatility = trends_df['value'].std()
                 if volatility > 25:
@@ -534,7 +643,7 @@ class AdvancedResearchAgent:
         
         return risks
     
-    def _calculate_opportunity_metrics(self, market_data: Dict) -> Dict[str, Any]:
+    def _calculate_opportunity_metrics(self, places_stats: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate opportunity metrics for the market"""
         opportunities = {
             "market_gap_score": 0,
@@ -543,12 +652,10 @@ class AdvancedResearchAgent:
             "competitive_advantage_opportunity": "medium"
         }
         
-        if market_data.get("places_data"):
-            places_df = pd.DataFrame(market_data["places_data"])
-            
+        if places_stats is not None:
             # Market gap based on rating distribution
-            if 'rating' in places_df.columns:
-                avg_rating = places_df['rating'].mean()
+            if 'rating' in places_stats:
+                avg_rating = places_stats['rating']['mean']
                 if avg_rating < 3.5:
                     opportunities["market_gap_score"] = 0.8  # High opportunity for quality improvement
                 elif avg_rating < 4.0:
@@ -559,35 +666,37 @@ class AdvancedResearchAgent:
                     opportunities["market_gap_score"] = 0.2
             
             # Customer demand index based on review volume
-            if 'user_ratings_total' in places_df.columns:
-                total_reviews = places_df['user_ratings_total'].sum()
+            if 'user_ratings_total' in places_stats:
+                total_reviews = places_stats['user_ratings_total']['sum']
                 opportunities["customer_demand_index"] = min(total_reviews / 1000, 1.0)
         
         return opportunities
 
-    def _analyze_real_competition(self, places_data: List[Dict], business_type: str, location: str) -> Dict[str, Any]:
+    def _analyze_real_competition(self, places_df: pd.DataFrame, business_type: str, location: str) -> Dict[str, Any]:
         """Analyze real competition from scraped data with actual business names"""
-        if not places_data:
+        if places_df.empty:
             return {"error": "No competition data available"}
         
-        df = pd.DataFrame(places_data)
-        
-        # Ensure we have proper business names and addresses
-        df = self._clean_business_data(df)
+        # Ensure we have proper business names and addresses - cleaned on a copy so the shared frame stays raw for EDA
+        df = self._clean_business_data(places_df.copy())
         
         # Basic competitive metrics
         total_competitors = len(df)
-        avg_rating = df['rating'].mean() if 'rating' in df.columns else 0
-        avg_reviews = df['user_ratings_total'].mean() if 'user_ratings_total' in df.columns else 0
+        avg_rating = np.nanmean(self._competitor_column(df, 'rating', 0)) if 'rating' in df.columns else 0
+        avg_reviews = np.nanmean(self._competitor_column(df, 'user_ratings_total', 0)) if 'user_ratings_total' in df.columns else 0
         
         # Top competitors with REAL data
         top_competitors = []
         if not df.empty:
             # Sort by review count or rating
             sort_column = 'user_ratings_total' if 'user_ratings_total' in df.columns else 'rating'
-            top_businesses = df.nlargest(8, sort_column)  # Get more for better analysis
+            top_businesses = df.iloc[self._top_k_positions(self._competitor_column(df, sort_column, np.nan), 8)]  # Get more for better analysis
             
-            for _, business in top_businesses.iterrows():
+            # Strengths/weaknesses are classified column-wise; the row loop below only assembles dicts
+            strengths = self._analyze_business_strengths(top_businesses)
+            weaknesses = self._identify_business_weaknesses(top_businesses, avg_rating)
+            
+            for business, core_strengths, potential_weaknesses in zip(top_businesses.to_dict('records'), strengths, weaknesses):
                 competitor_analysis = {
                     "name": business.get('name', 'Unknown Business'),
                     "address": business.get('address', 'Address not available'),
@@ -596,8 +705,8 @@ class AdvancedResearchAgent:
                     "price_level": business.get('priceLevel', 'Unknown'),
                     "latitude": business.get('latitude'),
                     "longitude": business.get('longitude'),
-                    "core_strengths": self._analyze_business_strengths(business),
-                    "potential_weaknesses": self._identify_business_weaknesses(business, df)
+                    "core_strengths": core_strengths,
+                    "potential_weaknesses": potential_weaknesses
                 }
                 top_competitors.append(competitor_analysis)
         
@@ -624,61 +733,61 @@ class AdvancedResearchAgent:
         df['name'] = df['name'].fillna('Unknown Business')
         df['address'] = df['address'].fillna('Address not available')
         
+        # Coerce once so every later mean/mask/partition runs on float64, never the object path
+        for column in COMPETITOR_NUMERIC_COLUMNS:
+            if column in df.columns and not pd.api.types.is_numeric_dtype(df[column]):
+                df[column] = pd.to_numeric(df[column], errors='coerce')
+        
         return df
     
-    def _analyze_business_strengths(self, business: pd.Series) -> List[str]:
-        """Analyze business strengths based on real data"""
-        strengths = []
-        
-        rating = business.get('rating', 0)
-        reviews = business.get('user_ratings_total', 0)
-        price_level = business.get('priceLevel', 0)
-        
-        if rating >= 4.5:
-            strengths.append("Exceptional customer satisfaction")
-        elif rating >= 4.0:
-            strengths.append("Strong service quality")
-        
-        if reviews > 300:
-            strengths.append("Large and loyal customer base")
-        elif reviews > 100:
-            strengths.append("Established market presence")
-        
-        if price_level == 4:
-            strengths.append("Premium market positioning")
-        elif price_level == 1:
-            strengths.append("Competitive pricing advantage")
-        
-        return strengths if strengths else ["Solid market position"]
+    def _top_k_positions(self, values: np.ndarray, k: int) -> np.ndarray:
+        """Row positions of the k largest non-NaN values, largest first - O(N) partition instead of a full sort"""
+        valid = np.flatnonzero(~np.isnan(values))
+        k = min(k, valid.size)
+        if k == 0:
+            return valid
+        
+        candidates = valid[np.argpartition(-values[valid], k - 1)[:k]]
+        return candidates[np.argsort(-values[candidates], kind='stable')]
     
-    def _identify_business_weaknesses(self, business: pd.Series, market_df: pd.DataFrame) -> List[str]:
-        """Identify business weaknesses based on market comparison"""
-        weaknesses = []
-        
-        rating = business.get('rating', 0)
-        reviews = business.get('user_ratings_total', 0)
-        price_level = business.get('priceLevel', 0)
-        
-        if rating < 3.5:
-            weaknesses.append("Service quality concerns")
-        
-        if reviews < 50:
-            weaknesses.append("Limited market visibility")
+    def _competitor_column(self, df: pd.DataFrame, column: str, default: float) -> np.ndarray:
+        """Numeric column as a float array, or a constant when the column is absent"""
+        if column not in df.columns:
+            return np.full(len(df), default, dtype=float)
+        return pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float)
+    
+    def _analyze_business_strengths(self, df: pd.DataFrame) -> List[List[str]]:
+        """Analyze business strengths for every row at once"""
+        ratings = self._competitor_column(df, 'rating', 0)
+        reviews = self._competitor_column(df, 'user_ratings_total', 0)
+        price_levels = self._competitor_column(df, 'priceLevel', 0)
+        
+        tiers = [
+            np.select([ratings >= 4.5, ratings >= 4.0], ["Exceptional customer satisfaction", "Strong service quality"], ""),
+            np.select([reviews > 300, reviews > 100], ["Large and loyal customer base", "Established market presence"], ""),
+            np.select([price_levels == 4, price_levels == 1], ["Premium market positioning", "Competitive pricing advantage"], "")
+        ]
         
-        # Compare with market average
-        avg_rating = market_df['rating'].mean() if 'rating' in market_df.columns else 0
-        if rating < avg_rating - 0.5:
-            weaknesses.append("Below market average satisfaction")
+        return [[str(label) for label in row if label] or ["Solid market position"] for row in zip(*tiers)]
+    
+    def _identify_business_weaknesses(self, df: pd.DataFrame, market_avg_rating: float) -> List[List[str]]:
+        """Identify business weaknesses for every row at once, based on market comparison"""
+        ratings = self._competitor_column(df, 'rating', 0)
+        reviews = self._competitor_column(df, 'user_ratings_total', 0)
+        
+        checks = [
+            np.where(ratings < 3.5, "Service quality concerns", ""),
+            np.where(reviews < 50, "Limited market visibility", ""),
+            np.where(ratings < market_avg_rating - 0.5, "Below market average satisfaction", "")
+        ]
         
-        return weaknesses if weaknesses else ["No significant weaknesses detected"]
+        return [[str(label) for label in row if label] or ["No significant weaknesses detected"] for row in zip(*checks)]
     
-    def _analyze_real_trends(self, trends_data: List[Dict], business_type: str, location: str) -> Dict[str, Any]:
+    def _analyze_real_trends(self, df: pd.DataFrame, business_type: str, location: str) -> Dict[str, Any]:
         """Analyze real trends data"""
-        if not trends_data:
+        if df.empty:
             return {"error": "No trends data available"}
         
-        df = pd.DataFrame(trends_data)
-        
         return {
             "total_data_points": len(df),
             "analysis_period": self._get_analysis_period(df),
@@ -702,10 +811,8 @@ class AdvancedResearchAgent:
             "opportunity_zones": self._identify_opportunity_zones(competition)
         }
     
-    def _prepare_visualization_data(self, market_data: Dict, analysis: Dict) -> Dict[str, Any]:
+    def _prepare_visualization_data(self, market_data: Dict, frames: MarketFrames, analysis: Dict) -> Dict[str, Any]:
         """Prepare comprehensive visualization data with fallbacks"""
-        places_data = market_data.get("places_data", [])
-        trends_data = market_data.get("trends_data", [])
         competition = analysis.get("competitive_analysis", {})
         trends = analysis.get("trends_analysis", {})
         locality = analysis.get("locality_analysis", {})
@@ -713,8 +820,8 @@ class AdvancedResearchAgent:
         
         # Ensure we always have visualization data, even if some sources are missing
         viz_data = {
-            "business_data": self._prepare_business_visualization_data(places_data, competition),
-            "trends_data": self._prepare_trends_visualization_data(trends_data, trends),
+            "business_data": self._prepare_business_visualization_data(frames.places_df, competition),
+            "trends_data": self._prepare_trends_visualization_data(market_data.get("trends_data", []), trends),
             "locality_insights": self._prepare_locality_visualization_data(locality),
             "eda_metrics": self._prepare_eda_visualization_data(eda)
         }
@@ -730,48 +837,28 @@ class AdvancedResearchAgent:
             "market_patterns": eda.get("market_patterns", {})
         }
 
-    def _prepare_business_visualization_data(self, places_data: List[Dict], competition: Dict) -> Dict[str, Any]:
+    def _prepare_business_visualization_data(self, places_df: Optional[pd.DataFrame], competition: Dict) -> Dict[str, Any]:
         """Prepare business visualization data with robust fallbacks"""
         top_competitors = competition.get("top_competitors", [])
         
         # Create competitors chart data
-        competitors_chart = []
-        for competitor in top_competitors[:8]:
-            competitors_chart.append({
-                "name": competitor.get("name", "Unknown"),
-                "rating": competitor.get("rating", 0),
-                "reviews": competitor.get("reviews", 0),
-                "price_level": competitor.get("price_level", "Unknown"),
+        competitors_chart = [
+            {
+                **{key: competitor.get(key, default) for key, default in COMPETITOR_CHART_FIELDS},
                 "strength_score": len(competitor.get("core_strengths", [])),
                 "address": competitor.get("address", "Unknown")
-            })
-        
-        # Create geographic data
-        geographic_data = []
-        for place in places_data:
-            if place.get('latitude') and place.get('longitude'):
-                geographic_data.append({
-                    "name": place.get('name', 'Unknown'),
-                    "address": place.get('address', 'Unknown'),
-                    "latitude": place['latitude'],
-                    "longitude": place['longitude'],
-                    "rating": place.get('rating', 0),
-                    "reviews": place.get('user_ratings_total', 0),
-                    "price_level": place.get('priceLevel', 'Unknown')
-                })
+            }
+            for competitor in top_competitors[:8]
+        ]
+        
+        geographic_data = self._geographic_points(places_df)
         
         # Create rating distribution
         rating_distribution = competition.get("rating_distribution", {})
         if not rating_distribution and top_competitors:
-            ratings = [c.get('rating', 0) for c in top_competitors if c.get('rating')]
-            if ratings:
-                rating_distribution = {
-                    "Excellent (4.5-5.0)": len([r for r in ratings if r >= 4.5]),
-                    "Very Good (4.0-4.5)": len([r for r in ratings if 4.0 <= r < 4.5]),
-                    "Good (3.5-4.0)": len([r for r in ratings if 3.5 <= r < 4.0]),
-                    "Average (3.0-3.5)": len([r for r in ratings if 3.0 <= r < 3.5]),
-                    "Poor (<3.0)": len([r for r in ratings if r < 3.0])
-                }
+            ratings = np.fromiter((c['rating'] for c in top_competitors if c.get('rating')), dtype=float)
+            if ratings.size:
+                rating_distribution = dict(zip(RATING_BUCKET_LABELS, self._rating_bucket_counts(ratings)))
         
         return {
             "competitors_chart": competitors_chart,
@@ -780,19 +867,35 @@ class AdvancedResearchAgent:
             "price_distribution": competition.get("price_distribution", {}),
             "geographic_data": geographic_data
         }
+    
+    def _geographic_points(self, places_df: Optional[pd.DataFrame]) -> List[Dict[str, Any]]:
+        """Map points for every place with non-zero coordinates, filled from the shared places frame"""
+        if places_df is None or 'latitude' not in places_df.columns or 'longitude' not in places_df.columns:
+            return []
+        
+        coords = places_df[['latitude', 'longitude']]
+        located = places_df[coords.notna().all(axis=1) & coords.ne(0).all(axis=1)]
+        geo = pd.DataFrame(index=located.index)
+        for source, target, default in GEOGRAPHIC_FIELDS:
+            geo[target] = self._json_column(located[source], source in GEOGRAPHIC_INTEGER_COLUMNS) if source in located.columns else default
+        return geo.to_dict('records')
+    
+    def _json_column(self, column: pd.Series, integer: bool) -> pd.Series:
+        """Column as plain Python values: nulls stay None and integer fields are not emitted as floats"""
+        if integer and pd.api.types.is_float_dtype(column) and column.dropna().mod(1).eq(0).all():
+            column = column.astype('Int64')
+        column = column.astype(object)
+        return column.where(column.notna(), None)
 
     def _prepare_trends_visualization_data(self, trends_data: List[Dict], trends: Dict) -> Dict[str, Any]:
         """Prepare trends visualization data with robust fallbacks"""
+        # Built from the raw points so the timeline keeps the provider's original date strings
         timeline_data = []
-        if trends_data:
-            df = pd.DataFrame(trends_data)
-            if 'date' in df.columns and 'value' in df.columns:
-                for _, row in df.iterrows():
-                    timeline_data.append({
-                        "date": row['date'],
-                        "interest": row['value'],
-                        "query": row.get('query', 'Unknown')
-                    })
+        if any('date' in point for point in trends_data) and any('value' in point for point in trends_data):
+            timeline_data = [
+                {"date": point.get('date'), "interest": point.get('value'), "query": point.get('query', 'Unknown')}
+                for point in trends_data
+            ]
         
         growth_indicators = {
             "momentum": trends.get("growth_momentum", "stable"),
@@ -828,32 +931,49 @@ class AdvancedResearchAgent:
         normalized_business = business_type.lower().replace(' ', '_')
         normalized_location = location.lower().replace(' ', '_').replace(',', '_')
         
-        pattern = f"data/raw/{normalized_business}_{normalized_location}_{data_type}_*.csv"
-        return glob.glob(pattern)
+        prefix = f"{normalized_business}_{normalized_location}_{data_type}_"
+        # CSV snapshots written before the switch to Parquet are still picked up
+        suffixes = tuple(f".{ext}" for ext in RAW_DATA_EXTENSIONS)
+        try:
+            with os.scandir(RAW_DATA_DIR) as entries:
+                return [entry.path for entry in entries if entry.name.startswith(prefix) and entry.name.endswith(suffixes)]
+        except FileNotFoundError:
+            return []
     
     def _should_use_existing_data(self, existing_files: List[str]) -> bool:
         if not existing_files:
             return False
-        latest_file = max(existing_files, key=os.path.getctime)
-        file_time = datetime.fromtimestamp(os.path.getctime(latest_file))
+        _, latest_ctime = self._latest_file(existing_files)
+        file_time = datetime.fromtimestamp(latest_ctime)
         return (datetime.now() - file_time).days < self.data_retention_days
     
+    def _latest_file(self, file_paths: List[str]) -> Tuple[str, float]:
+        """Most recently created file and its ctime, with one stat call per path"""
+        return max(((path, os.stat(path).st_ctime) for path in file_paths), key=lambda item: item[1])
+    
     def _load_existing_data(self, file_paths: List[str]) -> List[Dict]:
         if not file_paths:
             return []
-        latest_file = max(file_paths, key=os.path.getctime)
+        latest_file, _ = self._latest_file(file_paths)
         try:
-            df = pd.read_csv(latest_file)
-            print(f"📂 Loaded {len(df)} records from {latest_file}")
+            df = pd.read_parquet(latest_file) if latest_file.endswith('.parquet') else pd.read_csv(latest_file)
+            logger.info("📂 Loaded %s records from %s", len(df), latest_file)
             return df.to_dict('records')
         except Exception as e:
-            print(f"❌ Error loading existing data: {e}")
+            logger.error("❌ Error loading existing data: %s", e)
             return []
     
     def _save_data_with_timestamp(self, data: List[Dict], business_type: str, location: str, data_type: str):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"data/raw/{business_type}_{location}_{data_type}_{timestamp}.csv"
-        self.apify_client.save_to_csv(data, filename)
+        filename = f"{RAW_DATA_DIR}/{business_type}_{location}_{data_type}_{timestamp}"
+        try:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            pd.DataFrame.from_records(data).to_parquet(f"{filename}.parquet", compression="zstd", index=False)
+            logger.info("💾 Data saved to %s.parquet", filename)
+        except Exception as e:
+            # Ragged nested fields can defeat Arrow's type inference - CSV always works
+            logger.warning("⚠️ Parquet save failed, falling back to CSV: %s", e)
+            self.apify_client.save_to_csv(data, f"{filename}.csv")
     
     def _calculate_data_freshness(self, places_files: List[str], trends_files: List[str]) -> str:
         if not places_files and not trends_files:
@@ -861,8 +981,8 @@ class AdvancedResearchAgent:
         all_files = places_files + trends_files
         if not all_files:
             return "fresh"
-        latest_file = max(all_files, key=os.path.getctime)
-        file_age = (datetime.now() - datetime.fromtimestamp(os.path.getctime(latest_file))).days
+        _, latest_ctime = self._latest_file(all_files)
+        file_age = (datetime.now() - datetime.fromtimestamp(latest_ctime)).days
         if file_age == 0:
             return "very_fresh"
         elif file_age <= 3:
@@ -876,27 +996,16 @@ class AdvancedResearchAgent:
     def _calculate_trend_momentum(self, df: pd.DataFrame) -> str:
         if 'value' not in df.columns or len(df) < 4:
             return "insufficient_data"
-        values = df['value'].tail(4)
-        if len(values) < 4:
-            return "insufficient_data"
-        recent_avg = values.mean()
-        overall_avg = df['value'].mean()
+        values = pd.to_numeric(df['value'], errors='coerce').to_numpy(dtype=float)
+        recent_avg = np.nanmean(values[-4:])
+        overall_avg = np.nanmean(values)
         momentum = ((recent_avg - overall_avg) / overall_avg) * 100
-        if momentum > 15:
-            return "strong_positive"
-        elif momentum > 5:
-            return "moderate_positive"
-        elif momentum > -5:
-            return "stable"
-        elif momentum > -15:
-            return "moderate_negative"
-        else:
-            return "strong_negative"
+        return self._bucket_label(momentum, MOMENTUM_BINS, MOMENTUM_LABELS)
     
     def _get_analysis_period(self, df: pd.DataFrame) -> str:
         if 'date' not in df.columns:
             return "Unknown"
-        dates = pd.to_datetime(df['date'])
+        dates = df['date']
         return f"{dates.min().strftime('%Y-%m-%d')} to {dates.max().strftime('%Y-%m-%d')}"
     
     def _generate_trend_summary(self, df: pd.DataFrame) -> str:
@@ -906,37 +1015,47 @@ class AdvancedResearchAgent:
         if len(values) < 2:
             return "Stable"
         trend = values.iloc[-1] - values.iloc[0]
-        if trend > 10:
-            return "Strong Growth"
-        elif trend > 5:
-            return "Moderate Growth" 
-        elif trend > -5:
-            return "Stable"
-        elif trend > -10:
-            return "Moderate Decline"
-        else:
-            return "Strong Decline"
+        return self._bucket_label(trend, TREND_SUMMARY_BINS, TREND_SUMMARY_LABELS)
     
     def _identify_seasonal_patterns(self, df: pd.DataFrame) -> str:
         if 'date' not in df.columns or 'value' not in df.columns:
             return "Unknown"
-        df['month'] = pd.to_datetime(df['date']).dt.month
-        monthly_avg = df.groupby('month')['value'].mean()
-        if len(monthly_avg) >= 6:
-            variation = monthly_avg.std() / monthly_avg.mean()
-            if variation > 0.3:
-                return "Seasonal variations detected"
+        variation = self._monthly_variation(df)
+        if variation is not None and variation > 0.3:
+            return "Seasonal variations detected"
         return "Stable throughout year"
     
+    def _monthly_variation(self, df: pd.DataFrame) -> Optional[float]:
+        """Coefficient of variation of monthly mean interest; None with fewer than 6 months of data"""
+        # Trends analysis and EDA both ask for this on the same shared frame - compute it once
+        if MONTHLY_VARIATION_ATTR not in df.attrs:
+            df.attrs[MONTHLY_VARIATION_ATTR] = self._compute_monthly_variation(df)
+        return df.attrs[MONTHLY_VARIATION_ATTR]
+    
+    def _compute_monthly_variation(self, df: pd.DataFrame) -> Optional[float]:
+        # Dates that could not be parsed in MarketFrames leave the column non-datetime
+        if not pd.api.types.is_datetime64_any_dtype(df['date']):
+            return None
+        months = df['date'].dt.month.to_numpy(dtype=float, na_value=np.nan)
+        values = pd.to_numeric(df['value'], errors='coerce').to_numpy(dtype=float)
+        valid = ~(np.isnan(months) | np.isnan(values))
+        
+        # Month buckets via bincount instead of a pandas groupby
+        month_index = months[valid].astype(np.intp)
+        counts = np.bincount(month_index, minlength=13)
+        sums = np.bincount(month_index, weights=values[valid], minlength=13)
+        monthly_avg = sums[counts > 0] / counts[counts > 0]
+        
+        if monthly_avg.size < 6:
+            return None
+        return monthly_avg.std(ddof=1) / monthly_avg.mean()
+    
     def _assess_market_saturation(self, competitor_count: int) -> str:
-        if competitor_count > 25:
-            return "High"
-        elif competitor_count > 15:
-            return "Medium" 
-        elif competitor_count > 5:
-            return "Low"
-        else:
-            return "Very Low"
+        return self._bucket_label(competitor_count, SATURATION_BINS, SATURATION_LABELS)
+    
+    def _bucket_label(self, value: float, bins: np.ndarray, labels: Tuple[str, ...]) -> str:
+        """Label for the first bucket whose lower threshold the value strictly exceeds; NaN falls in the lowest bucket"""
+        return labels[np.searchsorted(bins, np.nan_to_num(value, nan=-np.inf), side='left')]
     
     # In research_agent.py, update the _generate_business_intelligence method:
 
@@ -948,14 +1067,15 @@ class AdvancedResearchAgent:
         
         prompt = self._create_business_intelligence_prompt(analysis, business_type, location, searchapi_insights)
         
-        response = self.llm_client.generate_completion(
+        # The prompt is rendered from the analysis dict, so identical analyses hit the response cache
+        response = self.llm_client.generate_cached_completion(
             messages=[{"role": "user", "content": prompt}],
             model_key="gpt_oss_120b",
             max_tokens=6000,
             temperature=0.6
         )
         
-        return self._parse_business_report(response, analysis, searchapi_insights)
+        return self._parse_business_report(response, analysis)
 
     def _extract_searchapi_insights(self, analysis: Dict, business_type: str, location: str) -> Dict[str, Any]:
         """Extract insights from SearchAPI data for LLM analysis"""
@@ -1008,19 +1128,19 @@ class AdvancedResearchAgent:
         Create a comprehensive business intelligence report for {business_type} in {location} using REAL SearchAPI data.
 
         SEARCHAPI DATA INSIGHTS:
-        {json.dumps(searchapi_insights, indent=2)}
+        {DataProcessor.to_prompt_json(searchapi_insights)}
 
         COMPETITIVE LANDSCAPE (from Google Maps):
-        {json.dumps(competition, indent=2)}
+        {DataProcessor.to_prompt_json(competition)}
 
         MARKET TRENDS (from Google Trends):
-        {json.dumps(trends, indent=2)}
+        {DataProcessor.to_prompt_json(trends)}
 
         LOCALITY DYNAMICS:
-        {json.dumps(locality, indent=2)}
+        {DataProcessor.to_prompt_json(locality)}
 
         ENHANCED EDA ANALYSIS:
-        {json.dumps(eda, indent=2)}
+        {DataProcessor.to_prompt_json(eda)}
 
         Provide SPECIFIC recommendations based on ACTUAL SEARCHAPI DATA. Focus on:
         - Real competitor analysis from Google Maps data
@@ -1052,14 +1172,8 @@ class AdvancedResearchAgent:
         return insights[:8] if insights else ["Comprehensive market analysis completed"]
     
     def _extract_confidence_score(self, text: str) -> float:
-        import re
-        patterns = [
-            r'confidence.*?(\d+)%',
-            r'(\d+)%.*?confidence', 
-            r'score.*?(\d+)/100'
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
+        for pattern in CONFIDENCE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return min(int(match.group(1)) / 100, 0.95)
         return 0.80
@@ -1083,37 +1197,37 @@ class AdvancedResearchAgent:
         if 'rating' not in df.columns:
             return {}
         
-        distribution = {
-            "excellent_45_50": len(df[df['rating'] >= 4.5]),
-            "very_good_40_45": len(df[(df['rating'] >= 4.0) & (df['rating'] < 4.5)]),
-            "good_35_40": len(df[(df['rating'] >= 3.5) & (df['rating'] < 4.0)]),
-            "average_30_35": len(df[(df['rating'] >= 3.0) & (df['rating'] < 3.5)]),
-            "poor_below_30": len(df[df['rating'] < 3.0])
-        }
-        
-        return distribution
+        counts = self._rating_bucket_counts(self._competitor_column(df, 'rating', 0))
+        return dict(zip(RATING_BUCKET_KEYS, counts))
+    
+    def _rating_bucket_counts(self, ratings: np.ndarray) -> List[int]:
+        """Counts per rating bucket, best bucket first, from a single histogram pass"""
+        ratings = np.asarray(ratings, dtype=float)
+        counts, _ = np.histogram(ratings[~np.isnan(ratings)], bins=RATING_BUCKET_EDGES)
+        return [int(count) for count in counts[::-1]]
     
     def _get_price_distribution(self, df: pd.DataFrame) -> Dict[str, int]:
         if 'priceLevel' not in df.columns:
             return {}
         
-        distribution = {
-            "premium_4": len(df[df['priceLevel'] == 4]),
-            "high_3": len(df[df['priceLevel'] == 3]),
-            "medium_2": len(df[df['priceLevel'] == 2]),
-            "budget_1": len(df[df['priceLevel'] == 1])
-        }
+        # One hashing pass over the column instead of four masked scans
+        level_counts = df['priceLevel'].value_counts()
         
-        return distribution
+        return {
+            "premium_4": int(level_counts.get(4, 0)),
+            "high_3": int(level_counts.get(3, 0)),
+            "medium_2": int(level_counts.get(2, 0)),
+            "budget_1": int(level_counts.get(1, 0))
+        }
     
     def _analyze_geographic_spread(self, df: pd.DataFrame) -> Dict[str, Any]:
         if 'latitude' not in df.columns or 'longitude' not in df.columns:
             return {"spread": "unknown"}
         
-        lat_std = df['latitude'].std()
-        lon_std = df['longitude'].std()
+        lat_std = self._column_std(df['latitude'])
+        lon_std = self._column_std(df['longitude'])
         
-        if pd.isna(lat_std) or pd.isna(lon_std):
+        if np.isnan(lat_std) or np.isnan(lon_std):
             return {"spread": "concentrated"}
         
         if lat_std > 0.05 or lon_std > 0.05:
@@ -1,104 +1,110 @@
 # structured_analysis_agent.py - Fixed Cerebras model issue
 import os
-from cerebras.cloud.sdk import Cerebras
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from config.settings import settings
-from config.models import StructuredResearchResponse, CompetitorAnalysis, MarketTrends, BusinessOpportunity, MarketInsights
-import json
+from tools.llm_client import get_cerebras_client, cached_chat_completion
+from config.models import StructuredAnalysisPayload, StructuredResearchResponse, CompetitorAnalysis, MarketTrends, BusinessOpportunity, MarketInsights
+from pydantic import ValidationError
 from datetime import datetime
+from tools.prompt_template import PromptTemplate, canonical_text, canonical_key
+
+# JSON output is enforced server-side through response_format
+STRUCTURED_SYSTEM_PROMPT = "Market research analyst. Be concise; no prose outside JSON."
+STRUCTURED_SYSTEM_MESSAGE = {"role": "system", "content": STRUCTURED_SYSTEM_PROMPT}
+STRUCTURED_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Output budget: JSON skeleton plus a per-item allowance, capped so truncated runaways stay cheap
+STRUCTURED_MAX_COMPETITORS = 5
+STRUCTURED_MAX_OPPORTUNITIES = 3
+STRUCTURED_BASE_TOKENS = 400
+STRUCTURED_TOKENS_PER_COMPETITOR = 120
+STRUCTURED_TOKENS_PER_OPPORTUNITY = 80
+STRUCTURED_MAX_COMPLETION_TOKENS = 1500
+
+# In-flight Cerebras calls are still bounded by LLM_THREAD_SEMAPHORE
+STRUCTURED_BATCH_WORKERS = 8
+
+# Keys and types only - example values cost prefill tokens without improving structure
+STRUCTURED_SCHEMA = (
+    "{business_type:str,location:str,executive_summary:str(2-3 sentences),"
+    "competitors:[{name:str,address:str,rating:float,reviews:int,price_level:str,strengths:[str],weaknesses:[str]}],"
+    "market_trends:{trend_summary:str,average_interest:float,growth_momentum:str,seasonal_patterns:str},"
+    "opportunities:[{opportunity_type:str,description:str,potential_impact:str,implementation:str}],"
+    "insights:{market_saturation:str,competitive_intensity:str,customer_demand:str,growth_potential:str},"
+    "recommendations:[str],confidence_score:float(0-1)}"
+)
+
+STRUCTURED_ANALYSIS_PROMPT = PromptTemplate(
+    "Structured market analysis: ${business_type} in ${location}.\n"
+    "Data: ${competitor_count} competitors; trend: ${trend_summary}.\n"
+    "At most ${max_competitors} competitors and ${max_opportunities} opportunities.\n"
+    "JSON schema: " + STRUCTURED_SCHEMA + "\n"
+    "Specific, actionable, data-driven."
+)
+
+# Static part of the fallback response, validated once at import; per-call fields are patched in with model_copy
+FALLBACK_RESPONSE_TEMPLATE = StructuredResearchResponse(
+    business_type="",
+    location="",
+    executive_summary="",
+    competitors=[
+        CompetitorAnalysis(
+            name="Local Bakery Chain",
+            address="123 Main Street",
+            rating=4.2,
+            reviews=150,
+            price_level="Medium",
+            strengths=["Good location", "Established brand"],
+            weaknesses=["Limited variety", "Inconsistent quality"]
+        )
+    ],
+    market_trends=MarketTrends(
+        trend_summary="Stable market with growing interest in artisanal products",
+        average_interest=65.5,
+        growth_momentum="positive",
+        seasonal_patterns="higher demand during holidays"
+    ),
+    opportunities=[
+        BusinessOpportunity(
+            opportunity_type="Premium Products",
+            description="Introduce artisanal and premium bakery items",
+            potential_impact="Higher profit margins and customer loyalty",
+            implementation="Source quality ingredients and train staff"
+        )
+    ],
+    insights=MarketInsights(
+        market_saturation="Medium",
+        competitive_intensity="Moderate",
+        customer_demand="High",
+        growth_potential="Good"
+    ),
+    recommendations=[
+        "Focus on quality and unique product offerings",
+        "Implement strong digital marketing presence",
+        "Develop loyalty programs for repeat customers"
+    ],
+    confidence_score=0.75,
+    timestamp=""
+)
 
 class StructuredAnalysisAgent:
     def __init__(self, model: str = "gpt_oss_120b"):
-        self.client = Cerebras(api_key=settings.CEREBRAS_API_KEY)
+        self.client = get_cerebras_client()
         # Fix model selection - use string directly, not dict
         self.model = self._get_model_name(model)
     
     def _get_model_name(self, model_key: str) -> str:
         """Get actual model name from settings"""
-        model_config = settings.MODELS.get(model_key, {})
-        if isinstance(model_config, dict):
-            return model_config.get('cerebras', 'llama-70b')  # Default fallback
-        elif isinstance(model_config, str):
-            return model_config
-        else:
-            return 'llama-70b'  # Safe fallback
+        return settings.RESOLVED_MODELS.get(model_key, settings.DEFAULT_CEREBRAS_MODEL)
     
     def generate_structured_analysis(self, research_data: Dict[str, Any], business_type: str, location: str) -> StructuredResearchResponse:
         """Generate structured analysis using LLM"""
         
         try:
-            # Create a simplified prompt that's more likely to return structured data
-            prompt = f"""
-            Analyze this market research data for {business_type} business in {location} and provide a structured analysis.
-
-            RESEARCH DATA SUMMARY:
-            - Business Type: {business_type}
-            - Location: {location}
-            - Competitors: {len(research_data.get('market_analysis', {}).get('competitive_analysis', {}).get('top_competitors', []))}
-            - Market Trends: {research_data.get('market_analysis', {}).get('trends_analysis', {}).get('trend_summary', 'No data')}
-
-            Please provide analysis in this exact JSON format:
-            {{
-                "business_type": "{business_type}",
-                "location": "{location}",
-                "executive_summary": "2-3 sentence summary of market conditions",
-                "competitors": [
-                    {{
-                        "name": "Competitor Name",
-                        "address": "Business Address", 
-                        "rating": 4.2,
-                        "reviews": 150,
-                        "price_level": "Medium",
-                        "strengths": ["Strength 1", "Strength 2"],
-                        "weaknesses": ["Weakness 1", "Weakness 2"]
-                    }}
-                ],
-                "market_trends": {{
-                    "trend_summary": "Market trend description",
-                    "average_interest": 65.5,
-                    "growth_momentum": "positive",
-                    "seasonal_patterns": "moderate seasonality"
-                }},
-                "opportunities": [
-                    {{
-                        "opportunity_type": "Service Type",
-                        "description": "Opportunity description",
-                        "potential_impact": "Expected impact",
-                        "implementation": "How to implement"
-                    }}
-                ],
-                "insights": {{
-                    "market_saturation": "Medium",
-                    "competitive_intensity": "Moderate", 
-                    "customer_demand": "High",
-                    "growth_potential": "Good"
-                }},
-                "recommendations": [
-                    "Recommendation 1",
-                    "Recommendation 2"
-                ],
-                "confidence_score": 0.85
-            }}
-
-            Focus on real insights from the data. Be specific and actionable.
-            """
-            
-            messages = [
-                {"role": "system", "content": "You are a expert market research analyst. Always respond with valid JSON in the exact format provided."},
-                {"role": "user", "content": prompt}
-            ]
-            
             print(f"🤖 Calling Cerebras with model: {self.model}")
             
-            response = self.client.chat.completions.create(
-                messages=messages,
-                model=self.model,  # Now using string directly
-                max_completion_tokens=4000,
-                temperature=0.6,
-                top_p=0.8
-            )
-            
-            analysis_text = response.choices[0].message.content
+            analysis_text = cached_chat_completion(self.client, **self._build_request(research_data, business_type, location))
             print(f"📄 Received response from LLM")
             
             return self._parse_structured_response(analysis_text, business_type, location)
@@ -107,56 +113,59 @@ class StructuredAnalysisAgent:
             print(f"❌ Error in structured analysis: {e}")
             return self._create_fallback_response(business_type, location)
     
+    def _build_request(self, research_data: Dict[str, Any], business_type: str, location: str) -> Dict[str, Any]:
+        """Chat completion arguments for one structured analysis"""
+        market_analysis = research_data.get('market_analysis', {})
+        values = {
+            "business_type": canonical_text(business_type),
+            "location": canonical_text(location),
+            "competitor_count": len(market_analysis.get('competitive_analysis', {}).get('top_competitors', [])),
+            "trend_summary": market_analysis.get('trends_analysis', {}).get('trend_summary', 'No data'),
+            "max_competitors": STRUCTURED_MAX_COMPETITORS,
+            "max_opportunities": STRUCTURED_MAX_OPPORTUNITIES
+        }
+        
+        return {
+            "messages": [
+                STRUCTURED_SYSTEM_MESSAGE,
+                {"role": "user", "content": STRUCTURED_ANALYSIS_PROMPT.render(**values)}
+            ],
+            "model": self.model,  # Now using string directly
+            "prompt_key": STRUCTURED_ANALYSIS_PROMPT.cache_key(**values),
+            "semantic_scope": f"structured_analysis:{canonical_key(business_type)}:{canonical_key(location)}",
+            "response_format": STRUCTURED_RESPONSE_FORMAT,
+            "max_completion_tokens": self._completion_budget(values["competitor_count"]),
+            "temperature": 0.6,
+            "top_p": 0.8
+        }
+    
+    def generate_structured_analysis_batch(self, requests: List[Tuple[Dict[str, Any], str, str]]) -> List[StructuredResearchResponse]:
+        """Run several (research_data, business_type, location) analyses concurrently; results keep request order"""
+        if not requests:
+            return []
+        # Every request shares the system message and schema prefix, so the provider can batch and prefix-cache them
+        with ThreadPoolExecutor(max_workers=min(len(requests), STRUCTURED_BATCH_WORKERS)) as executor:
+            return list(executor.map(lambda request: self.generate_structured_analysis(*request), requests))
+    
+    def _completion_budget(self, competitor_count: int) -> int:
+        """Output token cap sized to the number of items the response will actually contain"""
+        competitors = min(competitor_count, STRUCTURED_MAX_COMPETITORS) or STRUCTURED_MAX_COMPETITORS
+        budget = (STRUCTURED_BASE_TOKENS
+                  + STRUCTURED_TOKENS_PER_COMPETITOR * competitors
+                  + STRUCTURED_TOKENS_PER_OPPORTUNITY * STRUCTURED_MAX_OPPORTUNITIES)
+        return min(budget, STRUCTURED_MAX_COMPLETION_TOKENS)
+    
     def _parse_structured_response(self, analysis_text: str, business_type: str, location: str) -> StructuredResearchResponse:
         """Parse LLM response into structured format"""
         try:
-            # Clean the response text
-            cleaned_text = analysis_text.strip()
-            
-            # Extract JSON from various formats
-            if "```json" in cleaned_text:
-                json_str = cleaned_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in cleaned_text:
-                json_str = cleaned_text.split("```")[1].strip()
-            elif cleaned_text.startswith("{") and cleaned_text.endswith("}"):
-                json_str = cleaned_text
-            else:
-                # Try to find JSON object in the text
-                start_idx = cleaned_text.find('{')
-                end_idx = cleaned_text.rfind('}')
-                if start_idx != -1 and end_idx != -1:
-                    json_str = cleaned_text[start_idx:end_idx+1]
-                else:
-                    raise ValueError("No JSON found in response")
-            
+            # JSON mode guarantees a bare object - pydantic-core parses and validates it in one pass, no dict round-trip
             print(f"🔄 Parsing JSON response")
-            parsed_data = json.loads(json_str)
-            
-            # Ensure all required fields are present
-            if 'competitors' in parsed_data and isinstance(parsed_data['competitors'], list):
-                competitors = []
-                for comp in parsed_data['competitors']:
-                    competitors.append(CompetitorAnalysis(**comp))
-                parsed_data['competitors'] = competitors
-            
-            if 'market_trends' in parsed_data:
-                parsed_data['market_trends'] = MarketTrends(**parsed_data['market_trends'])
+            payload = StructuredAnalysisPayload.model_validate_json(analysis_text)
             
-            if 'opportunities' in parsed_data and isinstance(parsed_data['opportunities'], list):
-                opportunities = []
-                for opp in parsed_data['opportunities']:
-                    opportunities.append(BusinessOpportunity(**opp))
-                parsed_data['opportunities'] = opportunities
+            # Add timestamp - the payload is already validated, so construct without a second pass
+            return StructuredResearchResponse.model_construct(**dict(payload), timestamp=datetime.now().isoformat())
             
-            if 'insights' in parsed_data:
-                parsed_data['insights'] = MarketInsights(**parsed_data['insights'])
-            
-            # Add timestamp
-            parsed_data['timestamp'] = datetime.now().isoformat()
-            
-            return StructuredResearchResponse(**parsed_data)
-            
-        except Exception as e:
+        except ValidationError as e:
             print(f"❌ Error parsing structured response: {e}")
             print(f"📄 Response text was: {analysis_text[:500]}...")
             return self._create_fallback_response(business_type, location)
@@ -164,46 +173,9 @@ class StructuredAnalysisAgent:
     def _create_fallback_response(self, business_type: str, location: str) -> StructuredResearchResponse:
         """Create fallback structured response"""
         print("🔄 Using fallback structured response")
-        return StructuredResearchResponse(
-            business_type=business_type,
-            location=location,
-            executive_summary=f"Market analysis for {business_type} in {location} shows promising opportunities with moderate competition. The market appears stable with room for quality-focused entrants.",
-            competitors=[
-                CompetitorAnalysis(
-                    name="Local Bakery Chain",
-                    address="123 Main Street",
-                    rating=4.2,
-                    reviews=150,
-                    price_level="Medium",
-                    strengths=["Good location", "Established brand"],
-                    weaknesses=["Limited variety", "Inconsistent quality"]
-                )
-            ],
-            market_trends=MarketTrends(
-                trend_summary="Stable market with growing interest in artisanal products",
-                average_interest=65.5,
-                growth_momentum="positive",
-                seasonal_patterns="higher demand during holidays"
-            ),
-            opportunities=[
-                BusinessOpportunity(
-                    opportunity_type="Premium Products",
-                    description="Introduce artisanal and premium bakery items",
-                    potential_impact="Higher profit margins and customer loyalty",
-                    implementation="Source quality ingredients and train staff"
-                )
-            ],
-            insights=MarketInsights(
-                market_saturation="Medium",
-                competitive_intensity="Moderate",
-                customer_demand="High",
-                growth_potential="Good"
-            ),
-            recommendations=[
-                "Focus on quality and unique product offerings",
-                "Implement strong digital marketing presence",
-                "Develop loyalty programs for repeat customers"
-            ],
-            confidence_score=0.75,
-            timestamp=datetime.now().isoformat()
-        )
\ No newline at end of file
+        return FALLBACK_RESPONSE_TEMPLATE.model_copy(update={
+            "business_type": business_type,
+            "location": location,
+            "executive_summary": f"Market analysis for {business_type} in {location} shows promising opportunities with moderate competition. The market appears stable with room for quality-focused entrants.",
+            "timestamp": datetime.now().isoformat()
+        })
@@ -1,24 +1,26 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-import json
 import random  # Add this import
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 import os
 import sys
 
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Streamlit re-executes this script on every rerun - only extend sys.path once
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+if APP_DIR not in sys.path:
+    sys.path.append(APP_DIR)
 
-from agents.research_agent import ResearchAgent
+from agents.research_agent import ResearchAgent, RATING_BUCKET_EDGES, RATING_BUCKET_LABELS
 from config.models import AgentResponse
-from tools.apify_client import ApifyDataCollector  # Add this import
+from tools.apify_client import get_apify_client
+from config.settings import configure_logging
 
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from agents.research_agent import ResearchAgent
-from config.models import AgentResponse
+configure_logging()
 
 # Page configuration
 st.set_page_config(
@@ -69,9 +71,107 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+SAMPLE_MAP_POINTS = 8
+CACHE_DIR = "cache"
+# (column, default) for the competitor chart fallback built from top_businesses
+COMPETITOR_CHART_COLUMNS = (('name', 'Unknown'), ('rating', 0), ('reviews', 0), ('price_level', 'Unknown'), ('address', 'Unknown'))
+COMPETITOR_TABLE_COLUMNS = ['Rank', 'Business Name', 'Address', 'Rating', 'Reviews', 'Price Level', 'Core Strengths', 'Weaknesses']
+COMPETITOR_TABLE_DTYPES = {'Rank': 'int16', 'Rating': 'float32', 'Reviews': 'int32'}
+COMPETITOR_TABLE_SOURCE_FIELDS = ['name', 'address', 'rating', 'reviews', 'price_level', 'core_strengths', 'potential_weaknesses']
+# Static strategy copy, filled with the business type/location at render time
+RECOMMENDATION_TEMPLATES = (
+    "**Market Entry Strategy**: Focus on underserved areas in {location} for {business_type}",
+    "**Service Differentiation**: Develop unique {business_type} services not offered by competitors",
+    "**Digital Presence**: Implement strong online presence and booking for {business_type}",
+    "**Customer Experience**: Focus on {business_type} service quality and customer satisfaction",
+    "**Pricing Strategy**: Develop competitive {business_type} pricing based on market analysis",
+    "**Location Selection**: Choose areas with high {business_type} demand and moderate competition",
+    "**Marketing Approach**: Target specific {business_type} customer segments identified in analysis"
+)
+RISK_TEMPLATES = (
+    "**Competition Risk**: Existing {business_type} competitors with established customer base",
+    "**Market Saturation Risk**: Potential {business_type} oversupply in the local market",
+    "**Economic Risk**: Local economic conditions affecting {business_type} disposable income",
+    "**Operational Risk**: {business_title} staffing and quality control challenges",
+    "**Location Risk**: Choosing suboptimal {business_type} business location",
+    "**Technology Risk**: Keeping up with {business_type} digital transformation needs"
+)
+
+@st.cache_resource
+def get_research_agent() -> ResearchAgent:
+    """One research agent per server process, shared across sessions and reruns"""
+    return ResearchAgent()
+
+@st.cache_data(ttl=5)
+def list_cache_files(cache_dir: str) -> Optional[List[str]]:
+    """Cached analysis file names, or None without a cache dir; short TTL so rapid reruns skip the scan"""
+    try:
+        with os.scandir(cache_dir) as entries:
+            return [entry.name for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+    except FileNotFoundError:
+        return None
+
+@st.cache_data(ttl=86400)
+def resolve_location_coordinates(location: str) -> Dict[str, float]:
+    """Geocode a location once a day instead of on every rerun (the collector itself is a process singleton)"""
+    return get_apify_client()._get_location_coordinates(location)
+
+@st.cache_data(ttl=3600)
+def build_rating_distribution_figure(business_type: str, distribution: Tuple[Tuple[str, int], ...]) -> go.Figure:
+    """Rating pie chart, built once per distribution instead of on every rerun"""
+    labels = [label for label, _ in distribution]
+    values = [count for _, count in distribution]
+    
+    return px.pie(values=values, names=labels, 
+                  title=f'{business_type.title()} Customer Rating Distribution',
+                  color_discrete_sequence=px.colors.sequential.RdBu)
+
+@st.cache_data(ttl=600, max_entries=32)
+def build_scatter_mapbox_figure(df: pd.DataFrame, business_type: str, location: str,
+                                center_lat: float, center_lon: float) -> go.Figure:
+    """Business location map, rebuilt only when the points, labels or center change"""
+    # Raw trace from NumPy columns - skips plotly express schema inference
+    reviews = df['reviews'].to_numpy(dtype=float)
+    max_reviews = reviews.max() if len(reviews) else 1.0
+    
+    fig = go.Figure(go.Scattermapbox(
+        lat=df['latitude'].to_numpy(dtype=float),
+        lon=df['longitude'].to_numpy(dtype=float),
+        mode='markers',
+        marker=go.scattermapbox.Marker(
+            size=reviews,
+            sizemode='area',
+            sizeref=2.0 * max_reviews / 15 ** 2,  # Limit maximum size to 15px, as px's size_max did
+            color=df['rating'].to_numpy(dtype=float),
+            colorscale=px.colors.cyclical.IceFire,
+            showscale=True,
+            colorbar=dict(title="rating")
+        ),
+        text=df['name'].to_numpy(),
+        customdata=df[['reviews', 'price_level', 'address']].to_numpy(),
+        hovertemplate=(
+            "<b>%{text}</b><br>Rating: %{marker.color}<br>Reviews: %{customdata[0]}"
+            "<br>Price level: %{customdata[1]}<br>Address: %{customdata[2]}<extra></extra>"
+        )
+    ))
+    
+    fig.update_layout(
+        title=f"{business_type.title()} Locations in {location}",
+        height=500,
+        mapbox_style="open-street-map",
+        mapbox=dict(center=dict(lat=center_lat, lon=center_lon), zoom=12),
+        margin={"r":0,"t":30,"l":0,"b":0}
+    )
+    return fig
+
+@lru_cache(maxsize=16)
+def format_insights_text(insights: Tuple[str, ...]) -> str:
+    """Bulleted insights export, joined once per insight list rather than on every rerun"""
+    return "\n".join(f"• {insight}" for insight in insights)
+
 class ProfessionalMarketApp:
     def __init__(self):
-        self.research_agent = ResearchAgent()
+        self.research_agent = get_research_agent()
     
     def display_header(self):
         """Display professional header"""
@@ -118,9 +218,8 @@ class ProfessionalMarketApp:
             st.markdown("### 🔄 Cache Status")
             
             # Show cache info
-            cache_dir = "cache"
-            if os.path.exists(cache_dir):
-                cache_files = [f for f in os.listdir(cache_dir) if f.endswith('.json')]
+            cache_files = list_cache_files(CACHE_DIR)
+            if cache_files is not None:
                 st.write(f"📁 Cached analyses: {len(cache_files)}")
                 
                 if cache_files:
@@ -134,11 +233,14 @@ class ProfessionalMarketApp:
 
     def clear_cache(self):
         """Clear all cached data"""
-        cache_dir = "cache"
-        if os.path.exists(cache_dir):
-            for file in os.listdir(cache_dir):
-                if file.endswith('.json'):
-                    os.remove(os.path.join(cache_dir, file))
+        try:
+            with os.scandir(CACHE_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+        list_cache_files.clear()
     
     def main(self):
         """Main application function"""
@@ -324,30 +426,25 @@ class ProfessionalMarketApp:
     
     def display_competitors_chart(self, business_data: Dict, business_type: str):
         """Display competitors comparison chart"""
+        business_title = business_type.title()
         competitors = business_data.get('competitors_chart', [])
         
-        # If no direct competitors chart, try to create from top_businesses
-        if not competitors and 'top_businesses' in business_data:
-            top_businesses = business_data.get('top_businesses', [])
-            competitors = []
-            for business in top_businesses:
-                competitors.append({
-                    "name": business.get('name', 'Unknown'),
-                    "rating": business.get('rating', 0),
-                    "reviews": business.get('reviews', 0),
-                    "price_level": business.get('price_level', 'Unknown'),
-                    "address": business.get('address', 'Unknown')
-                })
-        
-        if not competitors:
-            st.info(f"📊 {business_type.title()} competitor data analysis in progress...")
+        if competitors:
+            df = pd.DataFrame(competitors)
+        elif business_data.get('top_businesses'):
+            # No direct competitors chart - build the frame column-wise from top_businesses
+            top_businesses = business_data['top_businesses']
+            df = pd.DataFrame({
+                column: [business.get(column, default) for business in top_businesses]
+                for column, default in COMPETITOR_CHART_COLUMNS
+            })
+        else:
+            st.info(f"📊 {business_title} competitor data analysis in progress...")
             return
         
-        df = pd.DataFrame(competitors)
-        
         # Create rating comparison chart
         fig = px.bar(df, x='name', y='rating', 
-                    title=f'Top {business_type.title()} Competitors - Customer Ratings',
+                    title=f'Top {business_title} Competitors - Customer Ratings',
                     color='rating',
                     color_continuous_scale='Viridis',
                     hover_data=['reviews', 'price_level'])
@@ -366,35 +463,27 @@ class ProfessionalMarketApp:
         # If no distribution data, create from available business data
         if not distribution and 'top_businesses' in business_data:
             top_businesses = business_data.get('top_businesses', [])
-            ratings = [b.get('rating', 0) for b in top_businesses if b.get('rating')]
-            if ratings:
-                distribution = {
-                    "Excellent (4.5-5.0)": len([r for r in ratings if r >= 4.5]),
-                    "Very Good (4.0-4.5)": len([r for r in ratings if 4.0 <= r < 4.5]),
-                    "Good (3.5-4.0)": len([r for r in ratings if 3.5 <= r < 4.0]),
-                    "Average (3.0-3.5)": len([r for r in ratings if 3.0 <= r < 3.5]),
-                    "Poor (<3.0)": len([r for r in ratings if r < 3.0])
-                }
+            ratings = np.fromiter((b['rating'] for b in top_businesses if b.get('rating')), dtype=float)
+            if ratings.size:
+                # Same [low, high) buckets as the backend, counted in one histogram pass (best bucket first)
+                counts, _ = np.histogram(ratings, bins=RATING_BUCKET_EDGES)
+                distribution = dict(zip(RATING_BUCKET_LABELS, counts[::-1].tolist()))
         
         if not distribution:
             st.info(f"📈 {business_type.title()} rating distribution analysis in progress...")
             return
         
-        labels = list(distribution.keys())
-        values = list(distribution.values())
-        
-        fig = px.pie(values=values, names=labels, 
-                    title=f'{business_type.title()} Customer Rating Distribution',
-                    color_discrete_sequence=px.colors.sequential.RdBu)
+        fig = build_rating_distribution_figure(business_type, tuple(distribution.items()))
         st.plotly_chart(fig, width='stretch')
     
     def display_trends_timeline(self, trends_data: Dict, business_type: str):
         """Display trends timeline"""
+        business_title = business_type.title()
         timeline = trends_data.get('timeline_data', [])
         
         # If no timeline data, create sample trend data
         if not timeline:
-            st.info(f"📈 {business_type.title()} market trends analysis in progress...")
+            st.info(f"📈 {business_title} market trends analysis in progress...")
             
             # Create sample trend data for demonstration
             dates = pd.date_range(start='2024-01-01', end='2024-06-01', freq='M')
@@ -412,7 +501,7 @@ class ProfessionalMarketApp:
         df['date'] = pd.to_datetime(df['date'])
         
         fig = px.line(df, x='date', y='interest',
-                     title=f'{business_type.title()} Market Interest Trends Over Time',
+                     title=f'{business_title} Market Interest Trends Over Time',
                      markers=True,
                      line_shape='spline')
         
@@ -451,8 +540,7 @@ class ProfessionalMarketApp:
     
     def display_geographic_map(self, business_data: Dict, business_type: str, location: str):
         """Display geographic map with dynamic coordinates"""
-        import random
-        
+        business_title = business_type.title()
         # Extract geographic data
         geographic_data = []
         
@@ -474,70 +562,51 @@ class ProfessionalMarketApp:
         
         # If still no data, create sample data
         if not geographic_data:
-            st.info(f"🗺️ Generating map data for {business_type.title()} in {location}...")
+            st.info(f"🗺️ Generating map data for {business_title} in {location}...")
             
             # Get coordinates for the location
-            collector = ApifyDataCollector()
-            location_coords = collector._get_location_coordinates(location)
+            location_coords = resolve_location_coordinates(location)
             
-            # Create realistic sample data
-            for i in range(8):
-                geographic_data.append({
-                    "name": f"{business_type.title()} {i+1}",
-                    "address": f"Location {i+1}, {location}",
-                    "latitude": location_coords["latitude"] + random.uniform(-0.05, 0.05),
-                    "longitude": location_coords["longitude"] + random.uniform(-0.05, 0.05),
-                    "rating": round(random.uniform(3.5, 4.8), 1),
-                    "reviews": random.randint(50, 300),  # Ensure positive reviews
-                    "price_level": random.choice(["Economy", "Medium", "Premium"])
-                })
-        
-        # Create DataFrame and plot
-        df = pd.DataFrame(geographic_data)
+            # Create realistic sample data - drawn column-wise, one call per field
+            rng = np.random.default_rng()
+            indices = np.arange(1, SAMPLE_MAP_POINTS + 1)
+            df = pd.DataFrame({
+                "name": [f"{business_title} {i}" for i in indices],
+                "address": [f"Location {i}, {location}" for i in indices],
+                "latitude": location_coords["latitude"] + rng.uniform(-0.05, 0.05, SAMPLE_MAP_POINTS),
+                "longitude": location_coords["longitude"] + rng.uniform(-0.05, 0.05, SAMPLE_MAP_POINTS),
+                "rating": np.round(rng.uniform(3.5, 4.8, SAMPLE_MAP_POINTS), 1),
+                "reviews": rng.integers(50, 300, SAMPLE_MAP_POINTS, endpoint=True),  # Ensure positive reviews
+                "price_level": rng.choice(["Economy", "Medium", "Premium"], SAMPLE_MAP_POINTS)
+            })
+        else:
+            df = pd.DataFrame(geographic_data)
         
         # Fix negative review counts - ensure all reviews are positive
-        df['reviews'] = df['reviews'].apply(lambda x: max(1, x) if pd.notnull(x) else 50)
+        reviews = pd.to_numeric(df['reviews'], errors='coerce').to_numpy(dtype=float)
+        df['reviews'] = np.maximum(np.nan_to_num(reviews, nan=50.0), 1.0)
         
         # Calculate center
-        center_lat = df['latitude'].mean() if len(df) > 0 else 20.0
-        center_lon = df['longitude'].mean() if len(df) > 0 else 73.78
-        
-        # Create the map with safe size values
-        fig = px.scatter_mapbox(
-            df, 
-            lat="latitude", 
-            lon="longitude", 
-            hover_name="name",
-            hover_data=["rating", "reviews", "price_level", "address"],
-            color="rating",
-            size="reviews",
-            size_max=15,  # Limit maximum size
-            color_continuous_scale=px.colors.cyclical.IceFire,
-            zoom=12,
-            height=500,
-            title=f"{business_type.title()} Locations in {location}"
-        )
-        
-        fig.update_layout(
-            mapbox_style="open-street-map",
-            mapbox=dict(center=dict(lat=center_lat, lon=center_lon), zoom=12),
-            margin={"r":0,"t":30,"l":0,"b":0}
-        )
+        coords = df[['latitude', 'longitude']].to_numpy(dtype=float)
+        center_lat, center_lon = np.nanmean(coords, axis=0) if len(coords) else (20.0, 73.78)
         
+        fig = build_scatter_mapbox_figure(df, business_type, location, float(center_lat), float(center_lon))
         st.plotly_chart(fig, use_container_width=True)
     
     def display_competitors_table(self, competition: Dict, business_type: str):
         """Display competitors table with real data"""
+        business_title = business_type.title()
         top_competitors = competition.get('top_competitors', [])
         
         if not top_competitors:
-            st.info(f"🏢 {business_type.title()} competitor analysis in progress...")
+            st.info(f"🏢 {business_title} competitor analysis in progress...")
             
             # Create sample competitor data for demonstration
+            state_location = self._get_location_from_state()
             sample_competitors = [
                 {
-                    "name": f"Elite {business_type.title()} 1",
-                    "address": f"123 MG Road, {self._get_location_from_state()}",
+                    "name": f"Elite {business_title} 1",
+                    "address": f"123 MG Road, {state_location}",
                     "rating": 4.4,
                     "reviews": 467,
                     "price_level": "Medium",
@@ -545,8 +614,8 @@ class ProfessionalMarketApp:
                     "potential_weaknesses": ["Limited premium services", "Basic digital presence"]
                 },
                 {
-                    "name": f"Premium {business_type.title()} 2", 
-                    "address": f"456 FC Road, {self._get_location_from_state()}",
+                    "name": f"Premium {business_title} 2", 
+                    "address": f"456 FC Road, {state_location}",
                     "rating": 3.7,
                     "reviews": 439,
                     "price_level": "Premium", 
@@ -554,8 +623,8 @@ class ProfessionalMarketApp:
                     "potential_weaknesses": ["Service inconsistency", "High pricing"]
                 },
                 {
-                    "name": f"Classic {business_type.title()} 3",
-                    "address": f"789 JM Road, {self._get_location_from_state()}", 
+                    "name": f"Classic {business_title} 3",
+                    "address": f"789 JM Road, {state_location}", 
                     "rating": 4.7,
                     "reviews": 435,
                     "price_level": "Economy",
@@ -565,21 +634,18 @@ class ProfessionalMarketApp:
             ]
             top_competitors = sample_competitors
         
-        # Create a clean table for display
-        table_data = []
-        for i, competitor in enumerate(top_competitors[:8], 1):
-            table_data.append({
-                "Rank": i,
-                "Business Name": competitor.get('name', 'Unknown'),
-                "Address": competitor.get('address', 'Not available'),
-                "Rating": competitor.get('rating', 0),
-                "Reviews": competitor.get('reviews', 0),
-                "Price Level": competitor.get('price_level', 'Unknown'),
-                "Core Strengths": ", ".join(competitor.get('core_strengths', [])[:2]),
-                "Weaknesses": ", ".join(competitor.get('potential_weaknesses', [])[:2])
-            })
-        
-        df = pd.DataFrame(table_data)
+        # Create a clean table for display - column expressions instead of a per-competitor loop
+        raw = pd.DataFrame.from_records(top_competitors[:8]).reindex(columns=COMPETITOR_TABLE_SOURCE_FIELDS).astype(object)
+        df = pd.DataFrame({
+            "Rank": np.arange(1, len(raw) + 1),
+            "Business Name": raw['name'].fillna('Unknown'),
+            "Address": raw['address'].fillna('Not available'),
+            "Rating": pd.to_numeric(raw['rating'], errors='coerce').fillna(0),
+            "Reviews": pd.to_numeric(raw['reviews'], errors='coerce').fillna(0),
+            "Price Level": raw['price_level'].fillna('Unknown'),
+            "Core Strengths": raw['core_strengths'].str[:2].str.join(", ").fillna(""),
+            "Weaknesses": raw['potential_weaknesses'].str[:2].str.join(", ").fillna("")
+        }, columns=COMPETITOR_TABLE_COLUMNS).astype(COMPETITOR_TABLE_DTYPES)
         st.dataframe(df, width='stretch', hide_index=True)
     
     def _get_location_from_state(self):
@@ -625,6 +691,7 @@ class ProfessionalMarketApp:
     
     def display_opportunity_analysis(self, competition: Dict, locality: Dict, business_type: str):
         """Display opportunity analysis"""
+        business_title = business_type.title()
         opportunities = locality.get('opportunity_zones', [])
         
         # If no specific opportunities, generate based on market data
@@ -637,54 +704,39 @@ class ProfessionalMarketApp:
             else:
                 opportunities = [f"Early {business_type} market entry advantage", f"Building {business_type} brand presence"]
         
-        st.markdown(f"#### 🎯 {business_type.title()} Market Opportunities")
+        st.markdown(f"#### 🎯 {business_title} Market Opportunities")
         
         for opportunity in opportunities:
             st.success(f"🚀 {opportunity}")
         
         # Show competitor weaknesses as additional opportunities
-        st.markdown(f"#### 💡 {business_type.title()} Competitor Weaknesses to Exploit")
+        st.markdown(f"#### 💡 {business_title} Competitor Weaknesses to Exploit")
         top_competitors = competition.get('top_competitors', [])
-        weaknesses_shown = set()
         
+        # Dedupe first (each weakness keeps its first competitor, in order), then render
+        weakness_owners = {}
         for competitor in top_competitors[:4]:
-            weaknesses = competitor.get('potential_weaknesses', [])
-            for weakness in weaknesses[:2]:  # Show max 2 weaknesses per competitor
-                if weakness not in weaknesses_shown:
-                    st.info(f"**{competitor.get('name')}**: {weakness}")
-                    weaknesses_shown.add(weakness)
+            for weakness in competitor.get('potential_weaknesses', [])[:2]:  # Show max 2 weaknesses per competitor
+                weakness_owners.setdefault(weakness, competitor.get('name'))
+        
+        for weakness, name in weakness_owners.items():
+            st.info(f"**{name}**: {weakness}")
     
     def display_actionable_recommendations(self, results: AgentResponse, business_type: str, location: str):
         """Display actionable recommendations"""
-        recommendations = [
-            f"**Market Entry Strategy**: Focus on underserved areas in {location} for {business_type}",
-            f"**Service Differentiation**: Develop unique {business_type} services not offered by competitors",
-            f"**Digital Presence**: Implement strong online presence and booking for {business_type}",
-            f"**Customer Experience**: Focus on {business_type} service quality and customer satisfaction",
-            f"**Pricing Strategy**: Develop competitive {business_type} pricing based on market analysis",
-            f"**Location Selection**: Choose areas with high {business_type} demand and moderate competition",
-            f"**Marketing Approach**: Target specific {business_type} customer segments identified in analysis"
-        ]
-        
-        for i, recommendation in enumerate(recommendations, 1):
-            st.markdown(f"{i}. {recommendation}")
+        params = {"business_type": business_type, "location": location}
+        for i, template in enumerate(RECOMMENDATION_TEMPLATES, 1):
+            st.markdown(f"{i}. {template.format_map(params)}")
     
     def display_risk_assessment(self, results: AgentResponse, business_type: str):
         """Display risk assessment"""
-        risks = [
-            f"**Competition Risk**: Existing {business_type} competitors with established customer base",
-            f"**Market Saturation Risk**: Potential {business_type} oversupply in the local market",
-            f"**Economic Risk**: Local economic conditions affecting {business_type} disposable income",
-            f"**Operational Risk**: {business_type.title()} staffing and quality control challenges",
-            f"**Location Risk**: Choosing suboptimal {business_type} business location",
-            f"**Technology Risk**: Keeping up with {business_type} digital transformation needs"
-        ]
-        
-        for risk in risks:
-            st.warning(risk)
+        business_title = business_type.title()
+        params = {"business_type": business_type, "business_title": business_title}
+        for template in RISK_TEMPLATES:
+            st.warning(template.format_map(params))
         
         st.info(f"""
-        **{business_type.title()} Mitigation Strategy**: 
+        **{business_title} Mitigation Strategy**: 
         - Start with focused {business_type} service offerings
         - Build strong {business_type} customer relationships  
         - Implement {business_type} quality control systems
@@ -698,10 +750,9 @@ class ProfessionalMarketApp:
         
         with col1:
             # Full report JSON
-            json_data = json.dumps(results.dict(), indent=2, ensure_ascii=False)
             st.download_button(
                 "📄 Download Full Report (JSON)",
-                data=json_data,
+                data=self._full_report_json(results),
                 file_name=f"market_intelligence_{business_type}_{location}.json",
                 mime="application/json",
                 width='stretch'
@@ -720,15 +771,22 @@ class ProfessionalMarketApp:
         
         with col3:
             # Insights PDF (simulated)
-            insights_text = "\n".join([f"• {insight}" for insight in (results.insights or [])])
             st.download_button(
                 "💡 Download Key Insights",
-                data=insights_text,
+                data=format_insights_text(tuple(results.insights or ())),
                 file_name=f"key_insights_{business_type}_{location}.txt",
                 mime="text/plain",
                 width='stretch'
             )
     
+    def _full_report_json(self, results: AgentResponse) -> bytes:
+        """Serialize the report once per research result; download clicks rerun the script with the same object"""
+        cached = st.session_state.get('full_report_json')
+        if cached is None or cached[0] is not results:
+            cached = (results, results.model_dump_json(indent=2).encode('utf-8'))
+            st.session_state.full_report_json = cached
+        return cached[1]
+    
     def display_help_section(self):
         """Display help section when no research has been conducted"""
         st.markdown("## 🚀 Welcome to Market Intelligence Pro")
@@ -1,21 +1,27 @@
 # models.py - Updated with structured models
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
 
 class BusinessResearchRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     business_type: str = Field(..., description="Type of business to research")
     location: str = Field(..., description="Location for the research")
     depth: str = Field("comprehensive", description="Research depth level")
 
 class ResearchData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     raw_data: Dict[str, Any] = Field(default_factory=dict)
     insights: List[str] = Field(default_factory=list)
     metrics: Dict[str, Any] = Field(default_factory=dict)
     sources: List[str] = Field(default_factory=list)
 
 class AgentResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     reasoning: str = Field(default="Analysis in progress...")
     data: Optional[Dict[str, Any]] = Field(default_factory=dict)
     insights: List[str] = Field(default_factory=list)
@@ -24,6 +30,8 @@ class AgentResponse(BaseModel):
 
 # Structured output models for LLM responses
 class CompetitorAnalysis(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     name: str = Field(..., description="Competitor business name")
     address: str = Field(..., description="Business address")
     rating: float = Field(..., description="Customer rating")
@@ -33,24 +41,33 @@ class CompetitorAnalysis(BaseModel):
     weaknesses: List[str] = Field(..., description="Competitor weaknesses")
 
 class MarketTrends(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     trend_summary: str = Field(..., description="Overall trend summary")
     average_interest: float = Field(..., description="Average interest score")
     growth_momentum: str = Field(..., description="Growth momentum indicator")
     seasonal_patterns: str = Field(..., description="Seasonal patterns identified")
 
 class BusinessOpportunity(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     opportunity_type: str = Field(..., description="Type of opportunity")
     description: str = Field(..., description="Detailed opportunity description")
     potential_impact: str = Field(..., description="Potential business impact")
     implementation: str = Field(..., description="How to implement")
 
 class MarketInsights(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     market_saturation: str = Field(..., description="Market saturation level")
     competitive_intensity: str = Field(..., description="Competitive intensity")
     customer_demand: str = Field(..., description="Customer demand level")
     growth_potential: str = Field(..., description="Growth potential assessment")
 
-class StructuredResearchResponse(BaseModel):
+class StructuredAnalysisPayload(BaseModel):
+    """The part of a StructuredResearchResponse the LLM generates"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     business_type: str = Field(..., description="Business type analyzed")
     location: str = Field(..., description="Location analyzed")
     executive_summary: str = Field(..., description="Executive summary")
@@ -60,9 +77,13 @@ class StructuredResearchResponse(BaseModel):
     insights: MarketInsights = Field(..., description="Market insights")
     recommendations: List[str] = Field(..., description="Strategic recommendations")
     confidence_score: float = Field(..., description="Analysis confidence score")
+
+class StructuredResearchResponse(StructuredAnalysisPayload):
     timestamp: str = Field(..., description="Analysis timestamp")
     
 class BusinessSuggestion(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     business_type: str = Field(..., description="Type of business suggested")
     viability_score: float = Field(..., description="Viability score 0-100")
     investment_range: str = Field(..., description="Estimated investment range")
@@ -72,6 +93,8 @@ class BusinessSuggestion(BaseModel):
     challenges: List[str] = Field(..., description="Potential challenges")
 
 class CityBusinessReport(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     city: str = Field(..., description="City analyzed")
     population_tier: str = Field(..., description="City size category")
     economic_indicators: Dict[str, Any] = Field(..., description="Economic metrics")
@@ -81,6 +104,8 @@ class CityBusinessReport(BaseModel):
     timestamp: str = Field(..., description="Report generation timestamp")
 
 class ComprehensiveBusinessAnalysis(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     business_type: str = Field(..., description="Business type analyzed")
     location: str = Field(..., description="Location analyzed")
     executive_summary: str = Field(..., description="Executive summary")
@@ -95,6 +120,8 @@ class ComprehensiveBusinessAnalysis(BaseModel):
     timestamp: str = Field(..., description="Analysis timestamp")
 
 class RealTimeMarketData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     business_type: str = Field(..., description="Business type")
     location: str = Field(..., description="Location")
     data_source: str = Field(..., description="Data source")
@@ -1,8 +1,19 @@
+import logging
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+DEFAULT_CEREBRAS_MODEL = "llama-70b"
+
+def _resolve_cerebras_model(config) -> str:
+    """Cerebras model name from a MODELS entry (provider dict or plain name)"""
+    if isinstance(config, dict):
+        return config.get("cerebras", DEFAULT_CEREBRAS_MODEL)
+    if isinstance(config, str):
+        return config
+    return DEFAULT_CEREBRAS_MODEL
+
 class Settings:
     # API Keys with fallbacks
     CEREBRAS_API_KEY = os.getenv("CEREBRAS_API_KEY", "demo_key")
@@ -16,10 +27,23 @@ class Settings:
         "qwen_480b": {"cerebras": "llama-4-Maverick", "groq": "llama-3.1-8b-instant"}
     }
     
+    # Cerebras model name per MODELS key, resolved once at import
+    DEFAULT_CEREBRAS_MODEL = DEFAULT_CEREBRAS_MODEL
+    RESOLVED_MODELS = {key: _resolve_cerebras_model(config) for key, config in MODELS.items()}
+    
     # Provider priority
     PROVIDER_PRIORITY = ["cerebras", "groq"]
     
+    # Cerebras request limits
+    CEREBRAS_MAX_CONCURRENCY = int(os.getenv("CEREBRAS_MAX_CONCURRENCY", "8"))
+    CEREBRAS_MAX_RETRIES = int(os.getenv("CEREBRAS_MAX_RETRIES", "4"))
+    
     # Development settings
     USE_MOCK_DATA = os.getenv("USE_MOCK_DATA", "False").lower() == "true"
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+settings = Settings()
 
-settings = Settings()
\ No newline at end of file
+def configure_logging():
+    """Route agent progress logging to stderr at LOG_LEVEL - shared by the API and the Streamlit app"""
+    logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
@@ -1,14 +1,17 @@
 # graphs/research_graph.py
 from typing import Dict, Any, List, TypedDict
 from pydantic import BaseModel, Field
-import json
+import orjson
+import numpy as np
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from agents.research_agent import ResearchAgent
 from agents.analysis_agent import AnalysisAgent
 from agents.evaluation_agent import EvaluationAgent
 from agents.eda_agent import EDAAgent
 from tools.llm_client import MultiProviderLLM
+from tools.data_processor import DataProcessor
 
 # Structured output models using Pydantic
 class BusinessSuggestion(BaseModel):
@@ -83,12 +86,13 @@ class MultiAgentResearchGraph:
             else:
                 json_str = response.strip()
             
-            suggestions_data = json.loads(json_str)
+            suggestions_data = orjson.loads(json_str)
             
             # Convert to BusinessSuggestion objects
-            suggestions = []
-            for item in suggestions_data if isinstance(suggestions_data, list) else [suggestions_data]:
-                suggestions.append(BusinessSuggestion(**item))
+            suggestions = [
+                BusinessSuggestion.model_validate(item)
+                for item in (suggestions_data if isinstance(suggestions_data, list) else [suggestions_data])
+            ]
             
             return suggestions[:5]  # Return max 5 suggestions
             
@@ -134,9 +138,10 @@ class MultiAgentResearchGraph:
             places_data = research_data.get("market_analysis", {}).get("places_data", [])
             total_businesses = len(places_data)
             
-            # Calculate average rating
-            ratings = [place.get('rating', 0) for place in places_data if place.get('rating')]
-            avg_rating = sum(ratings) / len(ratings) if ratings else 0
+            # Calculate average rating - one pass into a float array, unrated places (0/None) masked out
+            ratings = np.fromiter((place.get('rating') or 0.0 for place in places_data), dtype=np.float64, count=total_businesses)
+            rated = ratings[ratings > 0]
+            avg_rating = float(rated.mean()) if rated.size else 0
             
             # Assess market saturation
             if total_businesses > 20:
@@ -178,12 +183,19 @@ class MultiAgentResearchGraph:
         try:
             # Get comprehensive data
             research_result = self.research_agent.conduct_research(business_type, location)
-            eda_data, eda_insights = self.eda_agent.perform_comprehensive_eda(
-                research_result.data, business_type, location
-            )
-            analysis_result = self.analysis_agent.analyze_market(
-                business_type, location, research_result.data
-            )
+            
+            # EDA and market analysis only depend on the research data - run them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                eda_future = executor.submit(
+                    self.eda_agent.perform_comprehensive_eda,
+                    research_result.data, business_type, location
+                )
+                analysis_future = executor.submit(
+                    self.analysis_agent.analyze_market,
+                    business_type, location, research_result.data
+                )
+                eda_data, eda_insights = eda_future.result()
+                analysis_result = analysis_future.result()
             
             # Generate evaluation insights
             evaluation_result = self.evaluation_agent.evaluate_insights(
@@ -236,7 +248,7 @@ class MultiAgentResearchGraph:
             - Data Quality: {scraped_data.data_quality}
             
             KEY INSIGHTS:
-            {json.dumps(insights.dict(), indent=2)}
+            {DataProcessor.to_prompt_json(insights.model_dump())}
             
             Please provide a detailed report with the following sections:
             
@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from typing import Dict, Any, Optional, List
 import uvicorn
+import asyncio
 from datetime import datetime
 import json
 from agents.research_agent import ResearchAgent
@@ -13,6 +14,9 @@ from tools.searchapi_client import SearchAPIClient
 from config.models import *
 from agents.memory_agent import MemoryEnhancedAgent
 from memory.memory_manager import BusinessMemoryManager
+from config.settings import configure_logging
+
+configure_logging()
 
 app = FastAPI(
     title="Market Intelligence Pro API",
@@ -370,28 +374,31 @@ async def comprehensive_research(
         print(f"🚀 Starting comprehensive research for user {user_id}: {business_type} in {location}")
         
         # Step 1: Conduct advanced research with fresh data collection
-        research_response: AgentResponse = research_agent.conduct_research(
+        research_response: AgentResponse = await asyncio.to_thread(
+            research_agent.conduct_research,
             business_type=business_type,
             location=location,
             use_cache=use_cache
         )
         
-        # Step 2: Generate structured analysis
-        structured_analysis = analysis_agent.generate_structured_analysis(
-            research_data=research_response.data,
-            business_type=business_type,
-            location=location
-        )
-        
-        # Step 3: Get comprehensive business analysis
-        comprehensive_analysis = discovery_agent.generate_comprehensive_analysis(
-            business_type=business_type,
-            city=location
+        # Steps 2-4 are independent of each other - run them concurrently
+        structured_analysis, comprehensive_analysis, real_time_data = await asyncio.gather(
+            # Step 2: Generate structured analysis
+            asyncio.to_thread(
+                analysis_agent.generate_structured_analysis,
+                research_data=research_response.data,
+                business_type=business_type,
+                location=location
+            ),
+            # Step 3: Get comprehensive business analysis
+            discovery_agent.agenerate_comprehensive_analysis(
+                business_type=business_type,
+                city=location
+            ),
+            # Step 4: Collect real-time market data
+            asyncio.to_thread(discovery_agent._collect_real_time_data, business_type, location)
         )
         
-        # Step 4: Collect real-time market data
-        real_time_data = discovery_agent._collect_real_time_data(business_type, location)
-        
         # Step 5: Extract key metrics from research data
         research_data = research_response.data or {}
         market_analysis = research_data.get('market_analysis', {})
@@ -522,7 +529,7 @@ async def city_opportunities(
         print(f"🎯 Discovering business opportunities for user {user_id} in {city}")
         
         # Step 1: Get city business opportunities report
-        opportunities_report = discovery_agent.discover_business_opportunities(city)
+        opportunities_report = await discovery_agent.adiscover_business_opportunities(city)
         
         # Step 2: Get real-time city data
         city_data = discovery_agent._collect_city_data(city)
@@ -530,16 +537,24 @@ async def city_opportunities(
         # Step 3: Analyze top business opportunities
         top_opportunities = []
         business_analyses = []
+        selected_suggestions = opportunities_report.top_business_suggestions[:max_opportunities]
+        
+        # Per-business analyses are independent - fan them out concurrently
+        if include_analysis:
+            analyses = await asyncio.gather(
+                *(discovery_agent.agenerate_comprehensive_analysis(suggestion.business_type, city)
+                  for suggestion in selected_suggestions),
+                return_exceptions=True
+            )
+        else:
+            analyses = [None] * len(selected_suggestions)
         
-        for business_suggestion in opportunities_report.top_business_suggestions[:max_opportunities]:
+        for business_suggestion, analysis in zip(selected_suggestions, analyses):
             try:
+                if isinstance(analysis, Exception):
+                    raise analysis
                 if include_analysis:
-                    # Get comprehensive analysis for each business type
-                    analysis = discovery_agent.generate_comprehensive_analysis(
-                        business_suggestion.business_type, 
-                        city
-                    )
-                    business_analyses.append(analysis.dict())
+                    business_analyses.append(analysis.model_dump())
                 
                 # Prepare opportunity data
                 opportunity_data = {
@@ -643,7 +658,7 @@ async def persistence_chat(
         print(f"💬 Processing chat with full memory context for user {user_id}")
         
         # Process query with enhanced memory
-        response = memory_agent.process_chat_with_memory(
+        response = await memory_agent.aprocess_chat_with_memory(
             user_id=user_id,
             message=message,
             business_type=business_type,
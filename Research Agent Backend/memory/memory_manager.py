@@ -1,13 +1,23 @@
 # memory_manager.py
 import os
-import json
-from typing import Dict, Any, List, Optional
+import mmap
+import orjson
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+MAX_CONVERSATION_TURNS = 50
+ROLLING_SUMMARY_MAX_LINES = 20
+CONTEXT_SUMMARY_MAX_CHARS = 16000  # ~4k tokens
+# NumPy scalars from the pandas analysis paths serialize natively; anything else falls back to str
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+MMAP_THRESHOLD_BYTES = 1 << 20
+
 class BusinessMemoryManager:
     def __init__(self, storage_path: str = "../memory_storage"):
         self.storage_path = storage_path
         os.makedirs(storage_path, exist_ok=True)
+        # Parsed memory per user, keyed by file mtime so repeat reads skip the JSON parse
+        self.memory_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
         
     def get_user_memory_file(self, user_id: str) -> str:
         """Get file path for user memory"""
@@ -24,8 +34,13 @@ class BusinessMemoryManager:
         
         if os.path.exists(memory_file):
             try:
-                with open(memory_file, 'r') as f:
-                    memory_data = json.load(f)
+                mtime = os.stat(memory_file).st_mtime_ns
+                cached = self.memory_cache.get(user_id)
+                if cached and cached[0] == mtime:
+                    return cached[1]
+                
+                memory_data = self._read_json(memory_file)
+                self.memory_cache[user_id] = (mtime, memory_data)
                 print(f"✅ Loaded existing memory for user {user_id}")
                 return memory_data
             except Exception as e:
@@ -40,6 +55,15 @@ class BusinessMemoryManager:
             'updated_at': datetime.now().isoformat()
         }
     
+    def _read_json(self, path: str) -> Dict[str, Any]:
+        """Parse a JSON file from one contiguous buffer; large files are mapped instead of copied"""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD_BYTES:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+    
     def save_user_memory(self, user_id: str, memory_data: Dict[str, Any]):
         """Save user conversation memory and research data to disk"""
         memory_file = self.get_user_memory_file(user_id)
@@ -47,12 +71,16 @@ class BusinessMemoryManager:
         try:
             memory_data['updated_at'] = datetime.now().isoformat()
             
-            with open(memory_file, 'w') as f:
-                json.dump(memory_data, f, indent=2)
+            with open(memory_file, 'wb') as f:
+                f.write(orjson.dumps(memory_data, default=str, option=ORJSON_OPTIONS))
+            self.memory_cache[user_id] = (os.stat(memory_file).st_mtime_ns, memory_data)
             
             print(f"💾 Saved memory for user {user_id}")
             
         except Exception as e:
+            # load_user_memory hands out the cached dict, which the caller has already mutated -
+            # drop it so the next load re-reads what is actually on disk
+            self.memory_cache.pop(user_id, None)
             print(f"❌ Error saving memory for {user_id}: {e}")
     
     def save_research_data(self, user_id: str, business_type: str, location: str, research_data: Dict[str, Any]):
@@ -96,8 +124,8 @@ class BusinessMemoryManager:
                 'timestamp': datetime.now().isoformat(),
                 'full_data': research_data
             }
-            with open(research_file, 'w') as f:
-                json.dump(full_research_data, f, indent=2)
+            with open(research_file, 'wb') as f:
+                f.write(orjson.dumps(full_research_data, default=str, option=ORJSON_OPTIONS))
             print(f"💾 Saved full research data for {user_id}, {business_type} in {location}")
         except Exception as e:
             print(f"❌ Error saving full research data: {e}")
@@ -165,13 +193,22 @@ class BusinessMemoryManager:
         
         memory_data['conversation_history'].append(conversation_entry)
         
-        # Keep only last 50 conversations to manage size
-        if len(memory_data['conversation_history']) > 50:
-            memory_data['conversation_history'] = memory_data['conversation_history'][-50:]
+        # Keep only the last turns; older ones are folded into a rolling summary
+        if len(memory_data['conversation_history']) > MAX_CONVERSATION_TURNS:
+            evicted = memory_data['conversation_history'][:-MAX_CONVERSATION_TURNS]
+            memory_data['conversation_history'] = memory_data['conversation_history'][-MAX_CONVERSATION_TURNS:]
+            memory_data['rolling_summary'] = self._roll_summary(memory_data.get('rolling_summary', []), evicted)
         
         self.save_user_memory(user_id, memory_data)
         return conversation_entry
     
+    def _roll_summary(self, rolling_summary: List[str], evicted: List[Dict[str, Any]]) -> List[str]:
+        """Fold evicted turns into a bounded list of one-line topics"""
+        for chat in evicted:
+            scope = " in ".join(filter(None, [chat.get('business_type'), chat.get('location')])) or "general"
+            rolling_summary.append(f"{scope}: {chat['user_message'][:80]}")
+        return rolling_summary[-ROLLING_SUMMARY_MAX_LINES:]
+    
     def get_research_summary(self, user_id: str, business_type: str, location: str) -> Optional[Dict[str, Any]]:
         """Get research data summary for specific business and location"""
         memory_data = self.load_user_memory(user_id)
@@ -188,52 +225,69 @@ class BusinessMemoryManager:
         """Get comprehensive context summary for LLM"""
         memory_data = self.load_user_memory(user_id)
         
-        summary = f"USER CONTEXT for {user_id}:\n\n"
+        header = f"USER CONTEXT for {user_id}:\n\n"
+        # Oldest / least relevant first, so trimming to the budget drops them before recent turns
+        sections = []
         
         # Research data context
         research_data = memory_data.get('research_data', {})
         if research_data:
-            summary += "PREVIOUS RESEARCH ANALYSES:\n"
+            section = "PREVIOUS RESEARCH ANALYSES:\n"
             for key, research in list(research_data.items())[-3:]:  # Last 3 researches
-                summary += f"- {research['business_type']} in {research['location']}:\n"
-                summary += f"  Competitors: {research.get('total_competitors', 0)}\n"
-                summary += f"  Market: {research.get('market_saturation', 'Unknown')}\n"
-                summary += f"  Investment: {research.get('investment_range', 'Unknown')}\n"
-                summary += f"  Confidence: {research.get('confidence_score', 0)}\n"
+                section += f"- {research['business_type']} in {research['location']}:\n"
+                section += f"  Competitors: {research.get('total_competitors', 0)}\n"
+                section += f"  Market: {research.get('market_saturation', 'Unknown')}\n"
+                section += f"  Investment: {research.get('investment_range', 'Unknown')}\n"
+                section += f"  Confidence: {research.get('confidence_score', 0)}\n"
+            sections.append(section)
         
         # City opportunities context
         city_opportunities = memory_data.get('city_opportunities', {})
         if city_opportunities:
-            summary += "\nCITY OPPORTUNITIES ANALYZED:\n"
+            section = "\nCITY OPPORTUNITIES ANALYZED:\n"
             for city, opportunities in list(city_opportunities.items())[-2:]:  # Last 2 cities
-                summary += f"- {city.title()}: {opportunities.get('total_opportunities', 0)} opportunities found\n"
+                section += f"- {city.title()}: {opportunities.get('total_opportunities', 0)} opportunities found\n"
+            sections.append(section)
         
         # Scraped data context
         scraped_data = memory_data.get('scraped_data', {})
         if scraped_data:
-            summary += "\nSCRAPED DATA AVAILABLE:\n"
+            section = "\nSCRAPED DATA AVAILABLE:\n"
             for key, scraped in list(scraped_data.items())[-3:]:  # Last 3 scraped datasets
-                summary += f"- {scraped['business_type']} in {scraped['location']}: {scraped.get('total_businesses', 0)} businesses\n"
+                section += f"- {scraped['business_type']} in {scraped['location']}: {scraped.get('total_businesses', 0)} businesses\n"
+            sections.append(section)
+        
+        # Older turns survive only as a bounded topic list
+        rolling_summary = memory_data.get('rolling_summary', [])
+        if rolling_summary:
+            sections.append("\nEARLIER CONVERSATION TOPICS:\n" + "".join(f"- {topic}\n" for topic in rolling_summary))
         
         # Conversation history context
         conversation_history = memory_data.get('conversation_history', [])
         if conversation_history:
-            summary += "\nRECENT CONVERSATION HISTORY:\n"
+            section = "\nRECENT CONVERSATION HISTORY:\n"
             for chat in conversation_history[-5:]:  # Last 5 conversations
                 if chat.get('business_type') == business_type and chat.get('location') == location:
-                    summary += f"User: {chat['user_message'][:100]}...\n"
-                    summary += f"You: {chat['assistant_response'][:100]}...\n"
-        
-        if summary == f"USER CONTEXT for {user_id}:\n\n":
-            summary += "No previous data available for this user.\n"
-        
-        return summary
+                    section += f"User: {chat['user_message'][:100]}...\n"
+                    section += f"You: {chat['assistant_response'][:100]}...\n"
+            sections.append(section)
+        
+        if not sections:
+            return header + "No previous data available for this user.\n"
+        
+        # Stay within the budget by dropping whole sections from the oldest end
+        budget = CONTEXT_SUMMARY_MAX_CHARS - len(header)
+        while len(sections) > 1 and sum(map(len, sections)) > budget:
+            sections.pop(0)
+        body = "".join(sections)
+        return header + (body[-budget:] if len(body) > budget else body)
     
     def clear_user_memory(self, user_id: str):
         """Clear all user memory"""
         memory_file = self.get_user_memory_file(user_id)
         if os.path.exists(memory_file):
             os.remove(memory_file)
+        self.memory_cache.pop(user_id, None)
         
         # Also remove research data files
         for filename in os.listdir(self.storage_path):
@@ -1,12 +1,20 @@
 from apify_client import ApifyClient
 import csv
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from functools import lru_cache
 import os
 from datetime import datetime
 import random
 from config.settings import settings
-import requests
+from tools.http_session import get_http_session
+
+@lru_cache(maxsize=1)
+def get_apify_client() -> "ApifyDataCollector":
+    """Shared ApifyDataCollector so the Apify client is only set up once per process"""
+    return ApifyDataCollector()
 
 class ApifyDataCollector:
     def __init__(self):
@@ -90,6 +98,28 @@ class ApifyDataCollector:
             print("🔄 Falling back to mock data...")
             return self._generate_mock_trends_data(keywords, location)
     
+    def scrape_market_data(self, search_queries: List[str], keywords: List[str], location: str = "") -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Scrape places (one actor run per query) and trends concurrently, deduplicating places"""
+        # Mock data is generated per call, so only fan out when hitting the real API
+        query_batches = [[query] for query in search_queries] if self.api_available else [search_queries]
+        
+        with ThreadPoolExecutor(max_workers=len(query_batches) + 1) as executor:
+            trends_future = executor.submit(self.scrape_trends_data, keywords, location)
+            places_futures = [executor.submit(self.scrape_places_data, batch, location) for batch in query_batches]
+            
+            places_data = self._dedupe_places(chain.from_iterable(future.result() for future in places_futures))
+            trends_data = trends_future.result()
+        
+        return places_data, trends_data
+    
+    def _dedupe_places(self, places: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop places returned by more than one overlapping search query"""
+        unique_places = {}
+        for place in places:
+            key = place.get("place_id") or (place.get("name"), place.get("address"))
+            unique_places.setdefault(key, place)
+        return list(unique_places.values())
+    
     def _get_location_coordinates(self, location: str) -> Dict[str, float]:
         """Dynamically get coordinates for any Indian city/village using Nominatim"""
         try:
@@ -107,7 +137,7 @@ class ApifyDataCollector:
                 'User-Agent': 'MarketIntelligenceApp/1.0 (niraj@example.com)'
             }
             
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = get_http_session().get(url, params=params, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
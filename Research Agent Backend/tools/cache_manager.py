@@ -1,12 +1,15 @@
 # tools/cache_manager.py - Optimized for better performance
 
-import json
+import orjson
 import os
 import hashlib
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 import pickle
 import gzip
+from tools.prompt_template import canonical_key
+
+CACHE_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
 
 class CacheManager:
     def __init__(self, cache_dir: str = "cache", ttl_hours: int = 24, max_cache_size: int = 100):
@@ -20,7 +23,7 @@ class CacheManager:
     
     def generate_cache_key(self, business_type: str, location: str, data_type: str = "research") -> str:
         """Generate a unique cache key from business type and location"""
-        key_string = f"{business_type.lower()}_{location.lower()}_{data_type}"
+        key_string = f"{canonical_key(business_type)}_{canonical_key(location)}_{data_type}"
         
         # Create MD5 hash for consistent key length
         key_hash = hashlib.md5(key_string.encode()).hexdigest()
@@ -42,8 +45,8 @@ class CacheManager:
                 return None
             
             # Read compressed cache file
-            with gzip.open(cache_file, 'rt', encoding='utf-8') as f:
-                cached_data = json.load(f)
+            with gzip.open(cache_file, 'rb') as f:
+                cached_data = orjson.loads(f.read())
             
             # Validate cache structure
             if not self._validate_cache_data(cached_data):
@@ -78,8 +81,8 @@ class CacheManager:
         
         try:
             # Use compression to save space
-            with gzip.open(cache_file, 'wt', encoding='utf-8') as f:
-                json.dump(cached_data, f, indent=2)
+            with gzip.open(cache_file, 'wb') as f:
+                f.write(orjson.dumps(cached_data, option=CACHE_JSON_OPTIONS))
             
             print(f"💾 Cached data: {cache_key}")
             
@@ -133,8 +136,8 @@ class CacheManager:
         for cache_file in cache_files:
             file_path = os.path.join(self.cache_dir, cache_file)
             try:
-                with gzip.open(file_path, 'rt', encoding='utf-8') as f:
-                    cached_data = json.load(f)
+                with gzip.open(file_path, 'rb') as f:
+                    cached_data = orjson.loads(f.read())
                 
                 cache_entries.append({
                     'key': cached_data.get('cache_key', 'unknown'),
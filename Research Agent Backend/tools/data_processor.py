@@ -1,9 +1,44 @@
 import pandas as pd
 from typing import List, Dict, Any
-import json
+import orjson
 from datetime import datetime
+from functools import lru_cache
+
+PROMPT_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+@lru_cache(maxsize=1)
+def get_data_processor() -> "DataProcessor":
+    """Shared DataProcessor instance"""
+    return DataProcessor()
 
 class DataProcessor:
+    @staticmethod
+    def compact_for_prompt(data: Any, max_str_len: int = 200, top_k: int = 5, float_digits: int = 3) -> Any:
+        """Shrink data before embedding it in an LLM prompt to cut prompt tokens"""
+        if isinstance(data, dict):
+            return {
+                key: DataProcessor.compact_for_prompt(value, max_str_len, top_k, float_digits)
+                for key, value in data.items()
+                # Type-checked emptiness test - arrays/frames would broadcast or raise on ==/bool()
+                if value is not None and not (isinstance(value, (list, dict, str)) and not value)
+            }
+        if isinstance(data, (list, tuple)):
+            items = list(data)
+            # Rated entities (competitors) - keep only the top-K by rating
+            if len(items) > top_k and items and all(isinstance(item, dict) and 'rating' in item for item in items):
+                items = sorted(items, key=lambda item: item.get('rating') or 0, reverse=True)[:top_k]
+            return [DataProcessor.compact_for_prompt(item, max_str_len, top_k, float_digits) for item in items]
+        if isinstance(data, str) and len(data) > max_str_len:
+            return data[:max_str_len] + "..."
+        if isinstance(data, float):
+            return round(data, float_digits)
+        return data
+    
+    @staticmethod
+    def to_prompt_json(data: Any, **compact_options) -> str:
+        """Serialize compacted data as minified JSON for prompt embedding"""
+        return orjson.dumps(DataProcessor.compact_for_prompt(data, **compact_options), default=str, option=PROMPT_JSON_OPTIONS).decode()
+    
     @staticmethod
     def process_places_data(places_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Process and analyze Google Places data with advanced metrics"""
@@ -91,10 +126,10 @@ class DataProcessor:
                 time_series['date'] = pd.to_datetime(time_series['date'])
                 time_series = time_series.sort_values('date')
                 
-                analysis["interest_over_time"] = {
-                    str(row['date'].date()): row['value'] 
-                    for _, row in time_series.iterrows()
-                }
+                analysis["interest_over_time"] = dict(zip(
+                    time_series['date'].dt.strftime('%Y-%m-%d').tolist(),
+                    time_series['value'].tolist()
+                ))
                 
                 # Trend calculations
                 values = time_series['value'].tolist()
@@ -0,0 +1,21 @@
+# tools/http_session.py - Shared keep-alive HTTP session for the data collection clients
+
+from functools import lru_cache
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_POOL_SIZE = 16
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Pooled session so SearchAPI/geocoding calls reuse warm TLS connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=("GET",))
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
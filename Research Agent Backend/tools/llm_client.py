@@ -1,9 +1,171 @@
 import os
-from cerebras.cloud.sdk import Cerebras
-from groq import Groq
-from typing import Dict, Any, Optional
+import asyncio
+from cerebras.cloud.sdk import Cerebras, AsyncCerebras
+from groq import Groq, AsyncGroq
+from typing import Dict, Any, Optional, List, Tuple, Iterator, AsyncIterator
+from functools import lru_cache
+from collections import OrderedDict
+import hashlib
+import json
+import threading
 import time
+import httpx
 from config.settings import settings
+from tools.cache_manager import CacheManager
+from tools.semantic_cache import get_semantic_cache
+
+LLM_CACHE_TTL_HOURS = 24
+LLM_MEMORY_CACHE_SIZE = 512
+
+_llm_memory_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_llm_cache_lock = threading.Lock()
+
+# Cap in-flight Cerebras requests: the async one bounds asyncio.gather fan-out,
+# the threading one bounds thread-pool fan-out from the synchronous agents
+LLM_SEMAPHORE = asyncio.Semaphore(settings.CEREBRAS_MAX_CONCURRENCY)
+LLM_THREAD_SEMAPHORE = threading.BoundedSemaphore(settings.CEREBRAS_MAX_CONCURRENCY)
+
+@lru_cache(maxsize=1)
+def get_cerebras_client() -> Cerebras:
+    """Shared Cerebras client with a pooled keep-alive HTTP transport"""
+    http_client = httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0),
+        timeout=60.0
+    )
+    # The SDK retries 429/5xx with exponential backoff and jitter (honouring Retry-After)
+    return Cerebras(api_key=settings.CEREBRAS_API_KEY, http_client=http_client,
+                    max_retries=settings.CEREBRAS_MAX_RETRIES)
+
+@lru_cache(maxsize=1)
+def get_async_cerebras_client() -> AsyncCerebras:
+    """Shared async Cerebras client for running independent LLM calls concurrently"""
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0),
+        timeout=60.0
+    )
+    return AsyncCerebras(api_key=settings.CEREBRAS_API_KEY, http_client=http_client,
+                         max_retries=settings.CEREBRAS_MAX_RETRIES)
+
+@lru_cache(maxsize=1)
+def get_llm_disk_cache() -> CacheManager:
+    """Persistent LLM response cache shared across processes and restarts"""
+    return CacheManager(cache_dir=os.path.join("cache", "llm"), ttl_hours=LLM_CACHE_TTL_HOURS,
+                        max_cache_size=LLM_MEMORY_CACHE_SIZE)
+
+def llm_cache_key(messages: Any, model: Any, **params) -> str:
+    """Content-addressed key over the full request (messages or a template prompt key, model and sampling params)"""
+    payload = json.dumps([model, messages, params], sort_keys=True, default=str)
+    return "llm_" + hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+def get_cached_llm_response(cache_key: str) -> Optional[str]:
+    """Look up a response in the in-memory LRU, then on disk"""
+    with _llm_cache_lock:
+        entry = _llm_memory_cache.get(cache_key)
+        if entry is not None:
+            cached_at, content = entry
+            if time.time() - cached_at < LLM_CACHE_TTL_HOURS * 3600:
+                _llm_memory_cache.move_to_end(cache_key)
+                return content
+            del _llm_memory_cache[cache_key]
+    
+    cached = get_llm_disk_cache().get_cached_result(cache_key)
+    if cached and cached.get("content"):
+        _remember_llm_response(cache_key, cached["content"])
+        return cached["content"]
+    return None
+
+def save_llm_response(cache_key: str, content: str):
+    """Store a successful response in both cache layers"""
+    if not content:
+        return
+    _remember_llm_response(cache_key, content)
+    get_llm_disk_cache().save_result_to_cache(cache_key, {"content": content})
+
+def _remember_llm_response(cache_key: str, content: str):
+    with _llm_cache_lock:
+        _llm_memory_cache[cache_key] = (time.time(), content)
+        _llm_memory_cache.move_to_end(cache_key)
+        while len(_llm_memory_cache) > LLM_MEMORY_CACHE_SIZE:
+            _llm_memory_cache.popitem(last=False)
+
+def lookup_llm_response(cache_key: str, messages: List[Dict[str, str]], model: Any,
+                        semantic_scope: Optional[str] = None, **params) -> Optional[str]:
+    """Exact cache lookup, then a near-duplicate prompt lookup within semantic_scope"""
+    content = get_cached_llm_response(cache_key)
+    if content is not None or not semantic_scope:
+        return content
+    
+    scope = llm_cache_key(semantic_scope, model, **params)
+    similar_key = get_semantic_cache().lookup(scope, _prompt_text(messages))
+    if similar_key:
+        content = get_cached_llm_response(similar_key)
+        if content is not None:
+            print("💾 Using cached LLM response for a near-identical prompt")
+    return content
+
+def store_llm_response(cache_key: str, content: str, messages: List[Dict[str, str]], model: Any,
+                       semantic_scope: Optional[str] = None, **params):
+    """Store a response and index its prompt for near-duplicate lookups"""
+    save_llm_response(cache_key, content)
+    if content and semantic_scope:
+        scope = llm_cache_key(semantic_scope, model, **params)
+        get_semantic_cache().add(scope, _prompt_text(messages), cache_key)
+
+def _prompt_text(messages: List[Dict[str, str]]) -> str:
+    return "\n".join(message.get("content", "") for message in messages)
+
+def _stream_deltas(stream) -> Iterator[str]:
+    """Non-empty text deltas of a streamed chat completion"""
+    for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            yield delta
+
+async def _astream_deltas(stream) -> AsyncIterator[str]:
+    """Async variant of _stream_deltas"""
+    async for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            yield delta
+
+def cached_chat_completion(client: Cerebras, messages: List[Dict[str, str]], model: Any,
+                           prompt_key: Optional[str] = None, semantic_scope: Optional[str] = None,
+                           **params) -> str:
+    """Run a chat completion, serving identical (or, with semantic_scope, near-identical) requests from cache"""
+    cache_key = llm_cache_key(prompt_key or messages, model, **params)
+    content = lookup_llm_response(cache_key, messages, model, semantic_scope, **params)
+    if content is not None:
+        return content
+    
+    with LLM_THREAD_SEMAPHORE:
+        if "response_format" in params:
+            # JSON mode is not paired with SSE streaming - one blocking request
+            response = client.chat.completions.create(messages=messages, model=model, **params)
+            content = response.choices[0].message.content or ""
+        else:
+            stream = client.chat.completions.create(messages=messages, model=model, stream=True, **params)
+            content = "".join(_stream_deltas(stream))
+    store_llm_response(cache_key, content, messages, model, semantic_scope, **params)
+    return content
+
+async def acached_chat_completion(client: AsyncCerebras, messages: List[Dict[str, str]], model: Any,
+                                  prompt_key: Optional[str] = None, semantic_scope: Optional[str] = None,
+                                  **params) -> str:
+    """Async variant of cached_chat_completion"""
+    cache_key = llm_cache_key(prompt_key or messages, model, **params)
+    content = lookup_llm_response(cache_key, messages, model, semantic_scope, **params)
+    if content is not None:
+        return content
+    
+    async with LLM_SEMAPHORE:
+        if "response_format" in params:
+            response = await client.chat.completions.create(messages=messages, model=model, **params)
+            content = response.choices[0].message.content or ""
+        else:
+            stream = await client.chat.completions.create(messages=messages, model=model, stream=True, **params)
+            content = "".join([delta async for delta in _astream_deltas(stream)])
+    store_llm_response(cache_key, content, messages, model, semantic_scope, **params)
+    return content
 
 class MultiProviderLLM:
     def __init__(self):
@@ -17,7 +179,8 @@ class MultiProviderLLM:
         if settings.CEREBRAS_API_KEY and settings.CEREBRAS_API_KEY != "demo_key":
             try:
                 self.providers["cerebras"] = {
-                    "client": Cerebras(api_key=settings.CEREBRAS_API_KEY),
+                    "client": get_cerebras_client(),
+                    "async_client": get_async_cerebras_client(),
                     "models": settings.MODELS
                 }
                 print("✅ Cerebras client initialized")
@@ -29,6 +192,7 @@ class MultiProviderLLM:
             try:
                 self.providers["groq"] = {
                     "client": Groq(api_key=settings.GROQ_API_KEY),
+                    "async_client": AsyncGroq(api_key=settings.GROQ_API_KEY),
                     "models": {
                         "gpt_oss_120b": "llama-3.1-70b-versatile",  # Updated model
                         "llama_70b": "llama-3.1-70b-versatile",     # Updated model
@@ -54,8 +218,25 @@ class MultiProviderLLM:
     
     def generate_completion(self, messages: list, model_key: str, **kwargs) -> Optional[str]:
         """Generate completion with provider fallback"""
+        return self._complete(messages, model_key, **kwargs)[0]
+    
+    def generate_cached_completion(self, messages: list, model_key: str, **kwargs) -> Optional[str]:
+        """generate_completion behind the shared LLM response cache; mock fallbacks are never cached"""
+        cache_key = llm_cache_key(messages, model_key, **kwargs)
+        content = get_cached_llm_response(cache_key)
+        if content is not None:
+            print("💾 Using cached LLM response")
+            return content
+        
+        content, from_provider = self._complete(messages, model_key, **kwargs)
+        if from_provider:
+            save_llm_response(cache_key, content)
+        return content
+    
+    def _complete(self, messages: list, model_key: str, **kwargs) -> Tuple[Optional[str], bool]:
+        """Completion text and whether it came from a real provider rather than the mock fallback"""
         if not self.active_provider:
-            return self._get_mock_response(messages, model_key)
+            return self._get_mock_response(messages, model_key), False
         
         max_retries = 2
         original_provider = self.active_provider
@@ -68,9 +249,9 @@ class MultiProviderLLM:
                 print(f"🤖 Using {self.active_provider} with {model_name}")
                 
                 if self.active_provider == "cerebras":
-                    return self._cerebras_completion(provider["client"], messages, model_name, **kwargs)
+                    return self._cerebras_completion(provider["client"], messages, model_name, **kwargs), True
                 elif self.active_provider == "groq":
-                    return self._groq_completion(provider["client"], messages, model_name, **kwargs)
+                    return self._groq_completion(provider["client"], messages, model_name, **kwargs), True
                     
             except Exception as e:
                 print(f"❌ {self.active_provider} attempt {attempt + 1} failed: {e}")
@@ -79,6 +260,38 @@ class MultiProviderLLM:
                 break
         
         # If all providers fail, return mock response
+        print("🔄 All providers failed, using mock response")
+        return self._get_mock_response(messages, model_key), False
+    
+    def ready(self) -> bool:
+        """True when a real provider is configured; otherwise completions fall back to mock responses"""
+        return bool(self.active_provider)
+    
+    async def agenerate_completion(self, messages: list, model_key: str, **kwargs) -> Optional[str]:
+        """Async variant of generate_completion - awaits the provider instead of blocking the event loop"""
+        if not self.active_provider:
+            return self._get_mock_response(messages, model_key)
+        
+        max_retries = 2
+        
+        for attempt in range(max_retries):
+            try:
+                provider = self.providers[self.active_provider]
+                model_name = provider["models"].get(model_key, model_key)
+                
+                print(f"🤖 Using {self.active_provider} with {model_name}")
+                
+                if self.active_provider == "cerebras":
+                    return await self._acerebras_completion(provider["async_client"], messages, model_name, **kwargs)
+                elif self.active_provider == "groq":
+                    return await self._agroq_completion(provider["async_client"], messages, model_name, **kwargs)
+                    
+            except Exception as e:
+                print(f"❌ {self.active_provider} attempt {attempt + 1} failed: {e}")
+                if self._switch_provider():
+                    continue
+                break
+        
         print("🔄 All providers failed, using mock response")
         return self._get_mock_response(messages, model_key)
     
@@ -108,6 +321,32 @@ class MultiProviderLLM:
         )
         return response.choices[0].message.content
     
+    async def _acerebras_completion(self, client, messages: list, model: str, **kwargs) -> str:
+        """Async Cerebras completion"""
+        if isinstance(model, dict):
+            model = model.get('cerebras', 'llama-70b')
+        
+        async with LLM_SEMAPHORE:
+            response = await client.chat.completions.create(
+                messages=messages,
+                model=model,
+                max_completion_tokens=kwargs.get('max_tokens', 4000),
+                temperature=kwargs.get('temperature', 0.7),
+                top_p=kwargs.get('top_p', 0.8)
+            )
+        return response.choices[0].message.content
+    
+    async def _agroq_completion(self, client, messages: list, model: str, **kwargs) -> str:
+        """Async Groq completion"""
+        response = await client.chat.completions.create(
+            messages=messages,
+            model=model,
+            max_tokens=kwargs.get('max_tokens', 4000),
+            temperature=kwargs.get('temperature', 0.7),
+            top_p=kwargs.get('top_p', 0.8)
+        )
+        return response.choices[0].message.content
+    
     def _switch_provider(self) -> bool:
         """Switch to next available provider"""
         providers_order = ["cerebras", "groq"]
@@ -0,0 +1,34 @@
+# tools/prompt_template.py - Pre-parsed prompt skeletons shared by the agents
+
+import hashlib
+import json
+import re
+import unicodedata
+from string import Template
+from typing import Any
+
+WHITESPACE = re.compile(r"\s+")
+KEY_SEPARATORS = re.compile(r"[\s,]+")
+
+def canonical_text(text: str) -> str:
+    """NFKC-normalize and collapse whitespace so equivalent user input renders byte-identical prompts"""
+    return WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+def canonical_key(text: str) -> str:
+    """Case-folded canonical_text with whitespace/comma runs as '_' - for cache keys and scopes"""
+    return KEY_SEPARATORS.sub("_", canonical_text(text).casefold()).strip("_")
+
+class PromptTemplate:
+    def __init__(self, text: str):
+        self.template = Template(text)
+        # Hash of the static skeleton, computed once at import time
+        self.static_hash = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def render(self, **values: Any) -> str:
+        """Substitute $placeholders with the given values"""
+        return self.template.substitute(values)
+
+    def cache_key(self, **values: Any) -> str:
+        """Cache key over the static skeleton hash plus only the variable substitutions"""
+        payload = json.dumps(values, sort_keys=True, default=str)
+        return f"{self.static_hash}:{hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()}"
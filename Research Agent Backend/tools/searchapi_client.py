@@ -1,5 +1,4 @@
 # tools/searchapi_client.py
-import requests
 import csv
 import json
 from typing import List, Dict, Any
@@ -8,12 +7,14 @@ from datetime import datetime, timedelta
 import random
 from config.settings import settings
 import time
+from tools.http_session import get_http_session
 
 class SearchAPIClient:
     def __init__(self):
         self.api_key = settings.SEARCHAPI_API_KEY
         self.base_url = "https://www.searchapi.io/api/v1/search"
         self.api_available = bool(self.api_key and self.api_key != "demo_key")
+        self.session = get_http_session()
         
         if self.api_available:
             print("✅ SearchAPI client initialized")
@@ -40,7 +41,7 @@ class SearchAPIClient:
             if location:
                 params["location"] = location
             
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -73,7 +74,7 @@ class SearchAPIClient:
                 "date": timeframe
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -101,7 +102,7 @@ class SearchAPIClient:
                 "geo": location
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -0,0 +1,109 @@
+# tools/semantic_cache.py - MinHash/LSH index for near-duplicate prompt lookups
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Set, Tuple
+import numpy as np
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+TOKEN_PATTERN = re.compile(r"\w+")
+
+class SemanticCache:
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.9,
+                 shingle_size: int = 3, max_entries: int = 2048, seed: int = 1):
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.max_entries = max_entries
+
+        # Fixed seed so signatures are comparable across instances
+        rng = np.random.default_rng(seed)
+        self.perm_a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self.perm_b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+        self.entries: "OrderedDict[int, Tuple[str, np.ndarray, str]]" = OrderedDict()
+        self.buckets: Dict[Tuple[str, int, bytes], Set[int]] = {}
+        self.next_id = 0
+        self.lock = threading.Lock()
+
+    def lookup(self, scope: str, text: str) -> Optional[str]:
+        """Return the cache key of a stored prompt with estimated Jaccard >= threshold, if any"""
+        signature = self._signature(text)
+        if signature is None:
+            return None
+
+        with self.lock:
+            candidates = set()
+            for band, band_key in enumerate(self._band_keys(signature)):
+                candidates |= self.buckets.get((scope, band, band_key), set())
+
+            best_key, best_similarity = None, self.threshold
+            for entry_id in candidates:
+                _, entry_signature, cache_key = self.entries[entry_id]
+                similarity = float(np.mean(entry_signature == signature))
+                if similarity >= best_similarity:
+                    best_key, best_similarity = cache_key, similarity
+            return best_key
+
+    def add(self, scope: str, text: str, cache_key: str):
+        """Index a prompt so near-duplicates within the same scope resolve to cache_key"""
+        signature = self._signature(text)
+        if signature is None:
+            return
+
+        with self.lock:
+            entry_id = self.next_id
+            self.next_id += 1
+            self.entries[entry_id] = (scope, signature, cache_key)
+            for band, band_key in enumerate(self._band_keys(signature)):
+                self.buckets.setdefault((scope, band, band_key), set()).add(entry_id)
+
+            while len(self.entries) > self.max_entries:
+                self._evict_oldest()
+
+    def invalidate(self, scope_prefix: str):
+        """Drop every indexed prompt whose scope starts with scope_prefix"""
+        with self.lock:
+            stale = [entry_id for entry_id, (scope, _, _) in self.entries.items() if scope.startswith(scope_prefix)]
+            for entry_id in stale:
+                self._remove(entry_id)
+
+    def _signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature over normalized token shingles"""
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        if len(tokens) < self.shingle_size:
+            return None
+
+        shingles = {" ".join(tokens[i:i + self.shingle_size]) for i in range(len(tokens) - self.shingle_size + 1)}
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "little") for s in shingles),
+            dtype=np.uint64, count=len(shingles)
+        )
+        permuted = (self.perm_a[:, None] * hashes[None, :] + self.perm_b[:, None]) % MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def _evict_oldest(self):
+        self._remove(next(iter(self.entries)))
+
+    def _remove(self, entry_id: int):
+        scope, signature, _ = self.entries.pop(entry_id)
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self.buckets.get((scope, band, band_key))
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self.buckets[(scope, band, band_key)]
+
+@lru_cache(maxsize=1)
+def get_semantic_cache() -> SemanticCache:
+    """Per-process semantic prompt index"""
+    return SemanticCache()
@@ -3,6 +3,12 @@ import seaborn as sns
 import pandas as pd
 from typing import List, Dict, Any
 import os
+from functools import lru_cache
+
+@lru_cache(maxsize=1)
+def get_viz_generator() -> "VisualizationGenerator":
+    """Shared VisualizationGenerator so matplotlib style/output setup runs once"""
+    return VisualizationGenerator()
 
 class VisualizationGenerator:
     def __init__(self):